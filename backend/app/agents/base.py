@@ -8,12 +8,31 @@ Implements core agent functionality with:
 - Multi-provider LLM support (Claude, GPT-4, Gemini)
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 import asyncio
 from app.utils.logger import LoggerMixin
 from app.agents.memory import TemporalMemory
-from app.agents.config import AgentConfig
+from app.agents.config import AgentConfig, MAX_CONCURRENT_LLM_CALLS
 from app.agents.llm_providers import get_llm_provider, BaseLLMProvider
+from app.services.cache_service import cache_service
+
+
+# Shared by every agent on an event loop so concurrent pipelines cannot fan
+# out past the provider's rate limit. Semaphores are bound to the loop that
+# first contends for them, so each loop (e.g. each asyncio.run) gets its own
+_LLM_SEMAPHORES: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """The LLM call semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        # Forget loops that have finished so their semaphores are not kept alive
+        for closed in [other for other in _LLM_SEMAPHORES if other.is_closed()]:
+            del _LLM_SEMAPHORES[closed]
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    return semaphore
 
 
 class BaseAgent(LoggerMixin, ABC):
@@ -39,6 +58,10 @@ class BaseAgent(LoggerMixin, ABC):
         self.role = role
         self.config = config
         self.memory = memory
+        # Reflections still running in the background (see reflect_later)
+        self._pending_reflections: Set[asyncio.Task] = set()
+        # Completion cache counters for deterministic generate() calls
+        self.stats: Dict[str, int] = {"llm_hits": 0, "llm_misses": 0}
 
         # Initialize LLM provider using factory
         self.llm: BaseLLMProvider = get_llm_provider(
@@ -56,21 +79,52 @@ class BaseAgent(LoggerMixin, ABC):
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        stop_after_json: bool = False
     ) -> str:
-        """Generate text using LLM with retry logic (multi-provider support)"""
+        """
+        Generate text using LLM with retry logic (multi-provider support)
+
+        Deterministic calls (temperature 0) are memoized in the shared cache,
+        keyed by provider, model, prompts and token budget. Pass
+        stop_after_json=True when the answer is a single JSON object: providers
+        that stream stop reading once it is complete. Each attempt waits for a
+        slot in the event loop's shared LLM semaphore and is then bounded by
+        config.timeout_seconds, so a hung request is retried instead of
+        stalling the pipeline.
+        """
+        system_prompt = system_prompt or self._get_system_prompt()
+        temperature = self.config.temperature if temperature is None else temperature
+        max_tokens = max_tokens or self.config.max_tokens
+        cache_args = (
+            self.llm.provider_name, self.llm.get_model_name(), system_prompt, prompt, max_tokens
+        )
+
+        if temperature == 0:
+            cached = await cache_service.get_cached_completion(*cache_args)
+            if cached is not None:
+                self.stats["llm_hits"] += 1
+                self.log_debug(f"Completion cache hit ({len(cached)} chars)")
+                return cached
+            self.stats["llm_misses"] += 1
 
         for attempt in range(self.config.max_retries):
             try:
                 messages = [{"role": "user", "content": prompt}]
 
-                # Use the provider abstraction
-                response = await self.llm.generate(
-                    messages=messages,
-                    system_prompt=system_prompt or self._get_system_prompt(),
-                    temperature=temperature or self.config.temperature,
-                    max_tokens=max_tokens or self.config.max_tokens
-                )
+                # Use the provider abstraction; the timeout starts once a
+                # slot is free so queueing is not counted against it
+                async with _llm_semaphore():
+                    response = await asyncio.wait_for(
+                        self.llm.generate(
+                            messages=messages,
+                            system_prompt=system_prompt,
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                            stop_after_json=stop_after_json
+                        ),
+                        timeout=self.config.timeout_seconds
+                    )
 
                 # Extract text from standardized response
                 text = response.text
@@ -80,6 +134,9 @@ class BaseAgent(LoggerMixin, ABC):
                     tokens=response.input_tokens + response.output_tokens
                 )
 
+                if temperature == 0:
+                    await cache_service.cache_completion(*cache_args, text)
+
                 return text
 
             except Exception as e:
@@ -176,6 +233,28 @@ class BaseAgent(LoggerMixin, ABC):
             self.log_error("Failed to generate reflection", error=e)
             return None
 
+    def reflect_later(
+        self,
+        task: str,
+        result: Dict[str, Any],
+        outcome: str
+    ) -> None:
+        """
+        Run reflect() in the background
+
+        Reflection is an extra LLM call whose output only feeds future runs,
+        so the current pipeline moves on instead of waiting for it.
+        Call wait_for_reflections() before shutting down.
+        """
+        reflection = asyncio.create_task(self.reflect(task, result, outcome))
+        self._pending_reflections.add(reflection)
+        reflection.add_done_callback(self._pending_reflections.discard)
+
+    async def wait_for_reflections(self) -> None:
+        """Wait for background reflections started by reflect_later()"""
+        if self._pending_reflections:
+            await asyncio.gather(*self._pending_reflections)
+
     async def get_past_learnings(
         self,
         task_type: str,
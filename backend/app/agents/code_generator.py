@@ -96,7 +96,8 @@ Code quality matters. This will be used by researchers."""
             code_text = await self.generate(
                 prompt,
                 temperature=0.5,  # Balance creativity and precision
-                max_tokens=6000  # Longer for code
+                max_tokens=6000,  # Longer for code
+                stop_after_json=True  # The answer is a single JSON object
             )
 
             # Parse into structured format
@@ -274,15 +275,14 @@ RETURN ONLY JSON. NO OTHER TEXT.
         if not results:
             return "Standard ML patterns."
 
-        patterns_text = "PATTERNS THAT WORKED:\n"
+        parts = ["PATTERNS THAT WORKED:\n"]
         for r in results:
-            patterns_text += f"- {r.get('data', {}).get('pattern', 'N/A')}\n"
+            parts.append(f"- {r.get('data', {}).get('pattern', 'N/A')}\n")
 
-        return patterns_text
+        return "".join(parts)
 
     def _parse_generated_code(self, code_text: str) -> GeneratedCode:
         """Parse LLM output into structured code"""
-        import json
         import re
 
         json_match = re.search(r'\{.*\}', code_text, re.DOTALL)
@@ -290,8 +290,8 @@ RETURN ONLY JSON. NO OTHER TEXT.
             raise ValueError("Could not find JSON in response")
 
         try:
-            data = json.loads(json_match.group())
-            return GeneratedCode(**data)
+            # Parse and validate in one step, without an intermediate dict
+            return GeneratedCode.model_validate_json(json_match.group())
         except Exception as e:
             self.log_error("Failed to parse generated code", error=e)
             raise
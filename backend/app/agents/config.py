@@ -17,6 +17,9 @@ DEFAULT_MODELS = {
     "gemini": "gemini-2.5-flash-lite",
 }
 
+# Provider calls in flight at once across every agent in the process
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("AGENT_MAX_CONCURRENT_LLM_CALLS", "4"))
+
 
 def get_default_provider() -> str:
     """Get provider from env or auto-detect based on available API keys"""
@@ -104,6 +107,8 @@ class OrchestratorConfig(BaseModel):
 
     # Pipeline Configuration
     max_debug_iterations: int = 3
+    # Abstracts shorter than this are too thin to implement from; skip the agents
+    min_abstract_words: int = 20
     enable_reflection: bool = True
     enable_meta_optimization: bool = False  # Future feature
 
@@ -25,6 +25,7 @@ class DebugIteration(BaseModel):
     analysis: str
     fixes_applied: List[str]
     fixed_code: GeneratedCode
+    lesson: Optional[str] = None
 
 
 class DebugResult(BaseModel):
@@ -187,7 +188,7 @@ Be precise. Other engineers will learn from your debugging."""
         )
 
         # Parse response
-        fixed_code, fixes_applied = self._parse_debug_response(
+        fixed_code, fixes_applied, lesson = self._parse_debug_response(
             debug_response,
             code
         )
@@ -196,7 +197,8 @@ Be precise. Other engineers will learn from your debugging."""
             iteration=iteration,
             analysis=debug_response[:500],  # First 500 chars
             fixes_applied=fixes_applied,
-            fixed_code=fixed_code
+            fixed_code=fixed_code,
+            lesson=lesson
         )
 
     def _build_debug_prompt(
@@ -258,6 +260,10 @@ Analyze and fix:
 3. WHY IT FIXES IT:
    Explain how your fix addresses the root cause.
 
+4. LESSON:
+   If this fix works, what pattern should future generations remember
+   to avoid this bug?
+
 Return your response in this format:
 
 ANALYSIS:
@@ -268,6 +274,9 @@ FIXES:
 2. [Second fix description]
 ...
 
+LESSON:
+[2-3 sentences: root cause, pattern to remember, how to avoid it]
+
 FIXED CODE JSON:
 {{
   "main_code": "fixed model.py content",
@@ -285,15 +294,14 @@ Focus on minimal, surgical fixes. Don't introduce new bugs.
         self,
         response: str,
         original_code: GeneratedCode
-    ) -> tuple[GeneratedCode, List[str]]:
-        """Parse debug response into fixed code and fixes list"""
+    ) -> tuple[GeneratedCode, List[str], Optional[str]]:
+        """Parse debug response into fixed code, fixes list and lesson"""
 
-        import json
         import re
 
         # Extract fixes list
         fixes = []
-        fixes_section = re.search(r'FIXES:(.*?)(?:FIXED CODE|$)', response, re.DOTALL)
+        fixes_section = re.search(r'FIXES:(.*?)(?:LESSON:|FIXED CODE|$)', response, re.DOTALL)
         if fixes_section:
             fix_lines = fixes_section.group(1).strip().split('\n')
             fixes = [
@@ -302,19 +310,21 @@ Focus on minimal, surgical fixes. Don't introduce new bugs.
                 if line.strip()
             ]
 
+        lesson_section = re.search(r'LESSON:(.*?)(?:FIXED CODE|$)', response, re.DOTALL)
+        lesson = lesson_section.group(1).strip() if lesson_section else None
+
         # Extract JSON
         json_match = re.search(r'\{.*\}', response, re.DOTALL)
         if json_match:
             try:
-                data = json.loads(json_match.group())
-                fixed_code = GeneratedCode(**data)
-                return fixed_code, fixes
+                fixed_code = GeneratedCode.model_validate_json(json_match.group())
+                return fixed_code, fixes, lesson or None
             except Exception as e:
                 self.log_error("Failed to parse fixed code", error=e)
 
         # Fallback: return original code
         self.log_warning("Could not parse fixed code, returning original")
-        return original_code, ["Failed to parse debug response"]
+        return original_code, ["Failed to parse debug response"], None
 
     async def _reflect_on_success(
         self,
@@ -338,8 +348,12 @@ Reflect (3-4 sentences):
 Be specific and actionable.
 """
 
+        # The fix that made the tests pass already stated its lesson in the
+        # same response; only spend another round trip when it did not
+        lesson = debug_history[-1].lesson if debug_history else None
+
         try:
-            reflection = await self.generate(
+            reflection = lesson or await self.generate(
                 reflection_prompt,
                 temperature=0.7
             )
@@ -13,6 +13,7 @@ Environment Variables:
 - GEMINI_API_KEY: For Gemini
 """
 import os
+import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
@@ -21,6 +22,25 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_json_decoder = json.JSONDecoder()
+
+
+def _complete_json_prefix(text: str) -> Optional[str]:
+    """
+    Text up to the end of its first JSON object, once that object is complete.
+
+    Returns None while the object is still incomplete (or is empty, which is
+    more likely a stray "{}" in prose than the requested payload).
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    try:
+        obj, end = _json_decoder.raw_decode(text, start)
+    except ValueError:
+        return None
+    return text[:end] if obj else None
+
 
 @dataclass
 class LLMResponse:
@@ -191,8 +211,22 @@ class GeminiProvider(BaseLLMProvider):
             "temperature": 0.7,
             "max_output_tokens": 4000,
         }
+        # GenerativeModel instances keyed by system instruction; each agent
+        # uses a fixed system prompt, so this stays small
+        self._models: Dict[str, Any] = {}
         logger.info(f"Initialized Gemini provider with model: {model}")
 
+    def _get_model(self, system_instruction: str):
+        """Get the model for a system instruction, building it on first use"""
+        model = self._models.get(system_instruction)
+        if model is None:
+            model = self.genai.GenerativeModel(
+                model_name=self.model,
+                system_instruction=system_instruction
+            )
+            self._models[system_instruction] = model
+        return model
+
     async def generate(
         self,
         messages: List[Dict[str, str]],
@@ -201,13 +235,17 @@ class GeminiProvider(BaseLLMProvider):
         max_tokens: int = 4000,
         **kwargs
     ) -> LLMResponse:
-        """Generate using Gemini"""
+        """
+        Generate using Gemini
+
+        The response is streamed. With stop_after_json=True, reading stops as
+        soon as the first JSON object is complete, so trailing commentary
+        after a JSON-only answer is not waited for.
+        """
+        stop_after_json = kwargs.get("stop_after_json", False)
         try:
-            # Create model with system instruction
-            model = self.genai.GenerativeModel(
-                model_name=self.model,
-                system_instruction=system_prompt or "You are a helpful AI assistant."
-            )
+            # Reuse the model built for this system instruction
+            model = self._get_model(system_prompt or "You are a helpful AI assistant.")
 
             # Convert messages to Gemini format
             gemini_messages = []
@@ -224,25 +262,37 @@ class GeminiProvider(BaseLLMProvider):
                 "max_output_tokens": max_tokens,
             }
 
-            response = await asyncio.to_thread(
-                model.generate_content,
+            response = await model.generate_content_async(
                 gemini_messages,
-                generation_config=generation_config
+                generation_config=generation_config,
+                stream=True
             )
 
             # Extract text and token counts
-            text = response.text if response.text else ""
+            parts: List[str] = []
+            finish_reason = "stop"
+            chunk = None
+            async for chunk in response:
+                parts.append(chunk.text or "")
+                if stop_after_json and "}" in parts[-1]:
+                    complete = _complete_json_prefix("".join(parts))
+                    if complete is not None:
+                        parts = [complete]
+                        finish_reason = "json_complete"
+                        break
+            text = "".join(parts)
 
             # Gemini doesn't always provide token counts in the same way
-            input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0) if hasattr(response, 'usage_metadata') else 0
-            output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+            usage = getattr(chunk, 'usage_metadata', None)
+            input_tokens = getattr(usage, 'prompt_token_count', 0) if usage else 0
+            output_tokens = getattr(usage, 'candidates_token_count', 0) if usage else 0
 
             return LLMResponse(
                 text=text,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 model=self.model,
-                finish_reason="stop"
+                finish_reason=finish_reason
             )
         except Exception as e:
             logger.error(f"Gemini generation failed: {e}")
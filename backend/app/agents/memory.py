@@ -34,11 +34,12 @@ class InMemoryTemporalStore:
             json.dumps(node_data, sort_keys=True, default=str).encode()
         ).hexdigest()
 
+        now = datetime.now()
         self.nodes[node_id] = {
             **node_data,
-            "created_at": datetime.now(),
+            "created_at": now,
             "access_count": 0,
-            "last_accessed": datetime.now()
+            "last_accessed": now
         }
 
         return node_id
@@ -49,6 +50,7 @@ class InMemoryTemporalStore:
         """
         results = []
         keywords = query_text.lower().split()
+        now = datetime.now()
 
         for node_id, node in self.nodes.items():
             # Simple relevance scoring
@@ -58,7 +60,7 @@ class InMemoryTemporalStore:
             if score > 0:
                 # Update access patterns
                 self.nodes[node_id]["access_count"] += 1
-                self.nodes[node_id]["last_accessed"] = datetime.now()
+                self.nodes[node_id]["last_accessed"] = now
 
                 results.append({
                     "node_id": node_id,
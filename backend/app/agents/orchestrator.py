@@ -12,7 +12,7 @@ Implements:
 Based on research: AgentCoder (2024), Reflexion (2023), SAGE (2024)
 """
 import asyncio
-from datetime import datetime
+import time
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 
@@ -23,6 +23,7 @@ from app.agents.test_designer import TestDesignerAgent, TestSuite
 from app.agents.code_generator import CodeGeneratorAgent, GeneratedCode
 from app.agents.test_executor import TestExecutorAgent, ExecutionResult
 from app.agents.debugger import DebuggerAgent, DebugResult
+from app.services.cache_service import cache_service
 from app.utils.logger import LoggerMixin
 
 
@@ -64,6 +65,9 @@ class CodeGenerationOrchestrator(LoggerMixin):
     3. Generate code
     4. Execute tests
     5. Debug if needed (with reflection)
+
+    Agents reflect on each stage in the background, so those extra LLM
+    calls overlap the following stages instead of delaying them.
     """
 
     def __init__(
@@ -99,6 +103,10 @@ class CodeGenerationOrchestrator(LoggerMixin):
             self.memory
         )
 
+        # Generations currently running, by version-less paper ID, so
+        # concurrent requests for the same paper share one pipeline run
+        self._inflight: Dict[str, asyncio.Task] = {}
+
         self.log_info("Orchestrator initialized with 5 agents")
 
     async def generate_quick_start(
@@ -124,7 +132,57 @@ class CodeGenerationOrchestrator(LoggerMixin):
         Returns:
             Complete quick start with code, tests, and results
         """
-        start_time = datetime.now()
+        # Too little text for the analyzer to work from; every stage would
+        # just run on the fallback analysis
+        if len(paper_abstract.split()) < orchestrator_config.min_abstract_words:
+            self.log_warning(f"Abstract too short for code generation: {paper_title[:60]}")
+            return QuickStartResult(
+                success=False,
+                generation_time_seconds=0.0,
+                paper_title=paper_title,
+                paper_id=paper_id,
+                analysis_summary="Generation skipped: paper abstract is too short to implement from",
+                readme="# Generation Skipped\n\nThe paper abstract is too short to implement from."
+            )
+
+        # Working code for this paper (or a near-identical version of it)
+        # was already generated; skip the whole agent pipeline
+        cached = await cache_service.get_cached_quick_start(paper_id, paper_title, paper_abstract)
+        if cached is not None:
+            self.log_info(f"♻️ Reusing cached code generation for: {paper_title[:60]}")
+            return QuickStartResult.model_validate_json(cached)
+
+        key = paper_id.split("v")[0]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_pipeline(
+                paper_title,
+                paper_abstract,
+                paper_summary,
+                paper_id,
+                paper_category
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.log_info(f"⏳ Joining in-progress code generation for: {paper_title[:60]}")
+
+        # Shielded so one caller disconnecting does not cancel the run
+        # the other callers are waiting on
+        return await asyncio.shield(task)
+
+    async def _run_pipeline(
+        self,
+        paper_title: str,
+        paper_abstract: str,
+        paper_summary: Dict[str, Any],
+        paper_id: str,
+        paper_category: str
+    ) -> QuickStartResult:
+        """Run every agent stage for one paper (see generate_quick_start)"""
+        # Monotonic: elapsed time must not jump with wall-clock adjustments
+        start_time = time.monotonic()
+
         self.log_info(f"🚀 Starting code generation for: {paper_title[:60]}...")
 
         try:
@@ -197,28 +255,34 @@ class CodeGenerationOrchestrator(LoggerMixin):
             )
 
             # STAGE 7: System-level reflection
-            system_reflection = await self._system_reflection(
+            system_reflection = self._system_reflection(
                 analysis,
                 tests,
                 execution,
                 debug_iterations
             )
 
-            # STAGE 8: Store success in memory
+            # STAGE 8: Store success in memory, alongside any agent
+            # reflections still running from earlier stages
+            pending = [
+                self.paper_analyzer.wait_for_reflections(),
+                self.test_designer.wait_for_reflections()
+            ]
             if execution.success:
-                await self._store_success(
+                pending.append(self._store_success(
                     paper_category,
                     analysis,
                     execution,
                     debug_iterations
-                )
+                ))
+            await asyncio.gather(*pending)
 
             # Calculate total time
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
 
             self.log_info(f"🎉 Generation complete in {elapsed:.1f}s")
 
-            return QuickStartResult(
+            result = QuickStartResult(
                 success=execution.success,
                 generation_time_seconds=elapsed,
                 code=code,
@@ -233,10 +297,21 @@ class CodeGenerationOrchestrator(LoggerMixin):
                 readme=readme
             )
 
+            # Only working code is reused; failed runs are retried next time
+            if result.success:
+                await cache_service.cache_quick_start(
+                    paper_id,
+                    paper_title,
+                    paper_abstract,
+                    result.model_dump_json()
+                )
+
+            return result
+
         except Exception as e:
             self.log_error("Code generation failed", error=e)
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
 
             return QuickStartResult(
                 success=False,
@@ -344,7 +419,7 @@ class CodeGenerationOrchestrator(LoggerMixin):
 
         return debug_result
 
-    async def _system_reflection(
+    def _system_reflection(
         self,
         analysis: PaperAnalysis,
         tests: TestSuite,
@@ -9,6 +9,7 @@ Responsibilities:
 
 Based on research findings from multi-agent surveys (2024-2025)
 """
+import asyncio
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 from app.agents.base import BaseAgent
@@ -16,6 +17,95 @@ from app.agents.memory import TemporalMemory
 from app.agents.config import AgentConfig
 
 
+# Static instructions and output schema, sent ahead of the paper-specific
+# sections so every analysis prompt shares the same prefix (providers cache
+# repeated prompt prefixes)
+_ANALYSIS_INSTRUCTIONS = """Analyze a research paper for implementation.
+
+Provide a comprehensive implementation analysis in this EXACT JSON format:
+
+{
+  "core_algorithm": "What is the main algorithmic innovation? Describe in detail.",
+
+  "step_by_step_procedure": [
+    "Step 1: ...",
+    "Step 2: ...",
+    "..."
+  ],
+
+  "key_equations": [
+    "Equation 1: description (if mentioned)",
+    "..."
+  ],
+
+  "components": [
+    "Component 1: description",
+    "Component 2: description",
+    "..."
+  ],
+
+  "component_connections": "How do components connect? Describe data flow.",
+
+  "architecture_diagram_description": "Describe the architecture as if drawing a diagram",
+
+  "hyperparameters": {
+    "learning_rate": "value or typical range",
+    "batch_size": "value or typical range",
+    "...": "other hyperparameters from paper"
+  },
+
+  "critical_hyperparameters": [
+    "Which hyperparameters are most important?",
+    "Which ones significantly affect results?"
+  ],
+
+  "dependencies": [
+    "PyTorch/TensorFlow/JAX",
+    "numpy",
+    "other required libraries"
+  ],
+
+  "mathematical_operations": [
+    "Matrix multiplication",
+    "Convolution",
+    "Attention mechanism",
+    "..."
+  ],
+
+  "gotchas": [
+    "Implementation detail 1 that's crucial but not obvious",
+    "Common mistake people make",
+    "..."
+  ],
+
+  "complexity_score": 7,  // 1-10, where 10 is extremely complex
+
+  "estimated_implementation_time_hours": 20,  // Realistic estimate for an experienced engineer
+
+  "required_compute": "medium",  // "low", "medium", or "high"
+
+  "likely_failure_points": [
+    "Tensor shape mismatch in component X",
+    "Numerical instability in operation Y",
+    "..."
+  ],
+
+  "common_bugs_to_avoid": [
+    "Forgetting to normalize inputs",
+    "Wrong dimension order",
+    "..."
+  ]
+}
+
+Based on similar papers you've analyzed, anticipate issues and be specific about implementation details.
+
+The paper follows.
+
+---
+
+"""
+
+
 class PaperAnalysis(BaseModel):
     """Structured output from paper analysis"""
 
@@ -114,14 +204,15 @@ You must be thorough and precise. Other agents depend on your analysis."""
             # Generate analysis
             analysis_text = await self.generate(
                 prompt,
-                temperature=0.3  # Lower temperature for precision
+                temperature=0.0,  # Deterministic, so repeat analyses hit the completion cache
+                stop_after_json=True  # The answer is a single JSON object
             )
 
             # Parse into structured format
             analysis = self._parse_analysis(analysis_text)
 
             # Reflect on success
-            await self.reflect(
+            self.reflect_later(
                 task="paper_analysis",
                 result={"summary": f"Analyzed {paper_title}"},
                 outcome="success"
@@ -133,7 +224,7 @@ You must be thorough and precise. Other agents depend on your analysis."""
             self.log_error("Analysis failed", error=e)
 
             # Reflect on failure
-            await self.reflect(
+            self.reflect_later(
                 task="paper_analysis",
                 result={"error": str(e)},
                 outcome="failure"
@@ -151,9 +242,7 @@ You must be thorough and precise. Other agents depend on your analysis."""
     ) -> str:
         """Build comprehensive analysis prompt"""
 
-        return f"""Analyze this research paper for implementation:
-
-PAPER TITLE:
+        return f"""{_ANALYSIS_INSTRUCTIONS}PAPER TITLE:
 {title}
 
 ABSTRACT:
@@ -168,85 +257,6 @@ Implementation Insights: {summary.get('implementationInsights', 'N/A')}
 LEARNINGS FROM SIMILAR PAPERS:
 {past_learnings}
 
----
-
-Provide a comprehensive implementation analysis in this EXACT JSON format:
-
-{{
-  "core_algorithm": "What is the main algorithmic innovation? Describe in detail.",
-
-  "step_by_step_procedure": [
-    "Step 1: ...",
-    "Step 2: ...",
-    "..."
-  ],
-
-  "key_equations": [
-    "Equation 1: description (if mentioned)",
-    "..."
-  ],
-
-  "components": [
-    "Component 1: description",
-    "Component 2: description",
-    "..."
-  ],
-
-  "component_connections": "How do components connect? Describe data flow.",
-
-  "architecture_diagram_description": "Describe the architecture as if drawing a diagram",
-
-  "hyperparameters": {{
-    "learning_rate": "value or typical range",
-    "batch_size": "value or typical range",
-    "...": "other hyperparameters from paper"
-  }},
-
-  "critical_hyperparameters": [
-    "Which hyperparameters are most important?",
-    "Which ones significantly affect results?"
-  ],
-
-  "dependencies": [
-    "PyTorch/TensorFlow/JAX",
-    "numpy",
-    "other required libraries"
-  ],
-
-  "mathematical_operations": [
-    "Matrix multiplication",
-    "Convolution",
-    "Attention mechanism",
-    "..."
-  ],
-
-  "gotchas": [
-    "Implementation detail 1 that's crucial but not obvious",
-    "Common mistake people make",
-    "..."
-  ],
-
-  "complexity_score": 7,  // 1-10, where 10 is extremely complex
-
-  "estimated_implementation_time_hours": 20,  // Realistic estimate for an experienced engineer
-
-  "required_compute": "medium",  // "low", "medium", or "high"
-
-  "likely_failure_points": [
-    "Tensor shape mismatch in component X",
-    "Numerical instability in operation Y",
-    "..."
-  ],
-
-  "common_bugs_to_avoid": [
-    "Forgetting to normalize inputs",
-    "Wrong dimension order",
-    "..."
-  ]
-}}
-
-Based on similar papers you've analyzed, anticipate issues and be specific about implementation details.
-
 RETURN ONLY THE JSON. NO OTHER TEXT.
 """
 
@@ -255,30 +265,29 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
         if not self.memory:
             return "No past learnings available."
 
-        # Query memory for similar papers
-        results = await self.memory.query(
-            f"successful implementations in {paper_category}",
-            max_results=5
+        # Query memory for similar papers and past reflections together
+        results, reflections = await asyncio.gather(
+            self.memory.query(
+                f"successful implementations in {paper_category}",
+                max_results=5
+            ),
+            self.get_past_learnings("paper_analysis", max_results=3)
         )
 
         if not results:
             return "No past learnings available."
 
-        # Get reflections
-        reflections = await self.get_past_learnings("paper_analysis", max_results=3)
-
-        learnings_text = f"PAST SUCCESSES:\n"
+        parts = ["PAST SUCCESSES:\n"]
         for r in results:
             data = r.get('data', {})
-            learnings_text += f"- Paper in {paper_category}: {data.get('notes', 'N/A')}\n"
+            parts.append(f"- Paper in {paper_category}: {data.get('notes', 'N/A')}\n")
 
-        learnings_text += f"\nPAST REFLECTIONS:\n{reflections}"
+        parts.append(f"\nPAST REFLECTIONS:\n{reflections}")
 
-        return learnings_text
+        return "".join(parts)
 
     def _parse_analysis(self, analysis_text: str) -> PaperAnalysis:
         """Parse LLM output into structured analysis"""
-        import json
         import re
 
         # Extract JSON from response
@@ -287,8 +296,8 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
             raise ValueError("Could not find JSON in response")
 
         try:
-            data = json.loads(json_match.group())
-            return PaperAnalysis(**data)
+            # Parse and validate in one step, without an intermediate dict
+            return PaperAnalysis.model_validate_json(json_match.group())
         except Exception as e:
             self.log_error("Failed to parse analysis", error=e)
             raise
@@ -301,7 +310,8 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
         """Minimal fallback analysis when main analysis fails"""
         self.log_warning("Using fallback analysis")
 
-        return PaperAnalysis(
+        # Known-good literals, so skip validation
+        return PaperAnalysis.model_construct(
             core_algorithm="Algorithm details unclear - manual review needed",
             step_by_step_procedure=["Step 1: Review paper manually"],
             key_equations=[],
@@ -20,6 +20,7 @@ import json
 import tempfile
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -101,7 +102,7 @@ class SimpleCodeGenerator:
         5. Debug if needed
         6. Return complete package
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         print(f"🚀 Starting elegant code generation for: {paper_title[:60]}...")
 
@@ -131,14 +132,14 @@ class SimpleCodeGenerator:
             if generation_result.success:
                 self._save_learning(generation_result, paper_category)
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             print(f"✅ Generation complete in {elapsed:.1f}s")
 
             return generation_result
 
         except Exception as e:
             print(f"❌ Generation failed: {e}")
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
 
             return GenerationResult(
                 success=False,
@@ -543,11 +544,11 @@ Analyze the error and provide ONLY updated code as JSON:
         result: Dict,
         paper_id: str,
         paper_title: str,
-        start_time: datetime
+        start_time: float
     ) -> GenerationResult:
         """Parse Claude's result into GenerationResult"""
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
 
         # Handle raw response (not JSON)
         if "raw_response" in result:
@@ -12,6 +12,7 @@ Responsibilities:
 Research basis: AgentCoder (2024) showed that AI-designed tests
 significantly outperform template-based tests.
 """
+import asyncio
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
 from app.agents.base import BaseAgent
@@ -20,6 +21,135 @@ from app.agents.memory import TemporalMemory
 from app.agents.config import AgentConfig
 
 
+# Fixed half of the test design prompt. It goes before the per-paper
+# sections so consecutive calls share an identical prefix
+_TEST_DESIGN_INSTRUCTIONS = """Design a comprehensive pytest test suite for a paper implementation.
+
+Design tests that verify the implementation works correctly.
+
+Create tests in 4 categories:
+
+1. FUNCTIONALITY TESTS (Does it run?)
+   - Basic forward pass works
+   - Accepts correct input shapes
+   - Produces correct output shapes
+   - No runtime errors with valid inputs
+
+2. CORRECTNESS TESTS (Does it match paper?)
+   - Intermediate values are reasonable
+   - Output matches expected behavior
+   - Implements paper's algorithm correctly
+   - Uses hyperparameters from paper
+
+3. EDGE CASE TESTS (Handle errors?)
+   - Empty inputs
+   - Batch size = 1
+   - Very large inputs
+   - Invalid inputs raise proper errors
+
+4. PERFORMANCE TESTS (Fast enough?)
+   - Memory usage reasonable
+   - Speed acceptable for paper's claims
+   - No memory leaks
+
+Return ONLY this JSON format:
+
+{
+  "fixtures": '''
+import pytest
+import torch
+import numpy as np
+
+@pytest.fixture
+def sample_input():
+    # Realistic test data
+    return torch.randn(2, 3, 224, 224)
+
+@pytest.fixture
+def model():
+    # Import will be added by code generator
+    pass
+''',
+
+  "functionality_tests": [
+    {
+      "name": "test_model_forward_pass",
+      "description": "Test basic forward pass",
+      "test_code": '''
+def test_model_forward_pass(model, sample_input):
+    output = model(sample_input)
+    assert output is not None
+    assert output.shape[0] == sample_input.shape[0]
+''',
+      "category": "functionality",
+      "expected_to_catch": ["Runtime errors", "Shape mismatches"]
+    },
+    ...more tests...
+  ],
+
+  "correctness_tests": [
+    {
+      "name": "test_output_range",
+      "description": "Verify output values are in reasonable range",
+      "test_code": '''
+def test_output_range(model, sample_input):
+    output = model(sample_input)
+    assert torch.all(output >= -10) and torch.all(output <= 10), "Output values out of reasonable range"
+''',
+      "category": "correctness",
+      "expected_to_catch": ["Numerical instability", "Wrong activation functions"]
+    },
+    ...more tests...
+  ],
+
+  "edge_case_tests": [
+    {
+      "name": "test_batch_size_one",
+      "description": "Test with batch size 1",
+      "test_code": '''
+def test_batch_size_one(model):
+    single_input = torch.randn(1, 3, 224, 224)
+    output = model(single_input)
+    assert output.shape[0] == 1
+''',
+      "category": "edge_case",
+      "expected_to_catch": ["Batch dimension issues"]
+    },
+    ...more tests...
+  ],
+
+  "performance_tests": [
+    {
+      "name": "test_memory_usage",
+      "description": "Check memory doesn't explode",
+      "test_code": '''
+def test_memory_usage(model, sample_input):
+    import tracemalloc
+    tracemalloc.start()
+    output = model(sample_input)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1e9, f"Memory usage too high: {peak / 1e6:.2f}MB"
+''',
+      "category": "performance",
+      "expected_to_catch": ["Memory leaks", "Inefficient operations"]
+    },
+    ...more tests...
+  ],
+
+  "total_tests": 15,
+  "estimated_runtime_seconds": 5
+}
+
+Design at least 12-15 tests total. Focus on tests that would have caught issues in similar papers.
+
+The paper follows.
+
+---
+
+"""
+
+
 class TestCase(BaseModel):
     """Individual test case"""
     name: str
@@ -104,14 +234,15 @@ Your tests guide the code generation process. Be thorough."""
             # Generate test suite
             test_suite_text = await self.generate(
                 prompt,
-                temperature=0.4  # Moderate creativity for tests
+                temperature=0.4,  # Moderate creativity for tests
+                stop_after_json=True  # The answer is a single JSON object
             )
 
             # Parse into structured format
             test_suite = self._parse_test_suite(test_suite_text)
 
             # Reflect on success
-            await self.reflect(
+            self.reflect_later(
                 task="test_design",
                 result={"tests_created": test_suite.total_tests},
                 outcome="success"
@@ -124,7 +255,7 @@ Your tests guide the code generation process. Be thorough."""
             self.log_error("Test design failed", error=e)
 
             # Reflect on failure
-            await self.reflect(
+            self.reflect_later(
                 task="test_design",
                 result={"error": str(e)},
                 outcome="failure"
@@ -141,9 +272,7 @@ Your tests guide the code generation process. Be thorough."""
     ) -> str:
         """Build test design prompt"""
 
-        return f"""Design a comprehensive pytest test suite for this paper implementation.
-
-PAPER: {paper_title}
+        return f"""{_TEST_DESIGN_INSTRUCTIONS}PAPER: {paper_title}
 
 IMPLEMENTATION ANALYSIS:
 Core Algorithm: {analysis.core_algorithm}
@@ -155,129 +284,9 @@ Common Bugs: {', '.join(analysis.common_bugs_to_avoid)}
 EFFECTIVE TEST PATTERNS FROM PAST SUCCESSES:
 {test_patterns}
 
----
-
-Design tests that verify the implementation works correctly.
-
-Create tests in 4 categories:
-
-1. FUNCTIONALITY TESTS (Does it run?)
-   - Basic forward pass works
-   - Accepts correct input shapes
-   - Produces correct output shapes
-   - No runtime errors with valid inputs
-
-2. CORRECTNESS TESTS (Does it match paper?)
-   - Intermediate values are reasonable
-   - Output matches expected behavior
-   - Implements paper's algorithm correctly
-   - Uses hyperparameters from paper
-
-3. EDGE CASE TESTS (Handle errors?)
-   - Empty inputs
-   - Batch size = 1
-   - Very large inputs
-   - Invalid inputs raise proper errors
-
-4. PERFORMANCE TESTS (Fast enough?)
-   - Memory usage reasonable
-   - Speed acceptable for paper's claims
-   - No memory leaks
-
 IMPORTANT BASED ON ANALYSIS:
 {self._build_specific_requirements(analysis)}
 
-Return ONLY this JSON format:
-
-{{
-  "fixtures": '''
-import pytest
-import torch
-import numpy as np
-
-@pytest.fixture
-def sample_input():
-    # Realistic test data
-    return torch.randn(2, 3, 224, 224)
-
-@pytest.fixture
-def model():
-    # Import will be added by code generator
-    pass
-''',
-
-  "functionality_tests": [
-    {{
-      "name": "test_model_forward_pass",
-      "description": "Test basic forward pass",
-      "test_code": '''
-def test_model_forward_pass(model, sample_input):
-    output = model(sample_input)
-    assert output is not None
-    assert output.shape[0] == sample_input.shape[0]
-''',
-      "category": "functionality",
-      "expected_to_catch": ["Runtime errors", "Shape mismatches"]
-    }},
-    ...more tests...
-  ],
-
-  "correctness_tests": [
-    {{
-      "name": "test_output_range",
-      "description": "Verify output values are in reasonable range",
-      "test_code": '''
-def test_output_range(model, sample_input):
-    output = model(sample_input)
-    assert torch.all(output >= -10) and torch.all(output <= 10), "Output values out of reasonable range"
-''',
-      "category": "correctness",
-      "expected_to_catch": ["Numerical instability", "Wrong activation functions"]
-    }},
-    ...more tests...
-  ],
-
-  "edge_case_tests": [
-    {{
-      "name": "test_batch_size_one",
-      "description": "Test with batch size 1",
-      "test_code": '''
-def test_batch_size_one(model):
-    single_input = torch.randn(1, 3, 224, 224)
-    output = model(single_input)
-    assert output.shape[0] == 1
-''',
-      "category": "edge_case",
-      "expected_to_catch": ["Batch dimension issues"]
-    }},
-    ...more tests...
-  ],
-
-  "performance_tests": [
-    {{
-      "name": "test_memory_usage",
-      "description": "Check memory doesn't explode",
-      "test_code": '''
-def test_memory_usage(model, sample_input):
-    import tracemalloc
-    tracemalloc.start()
-    output = model(sample_input)
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    assert peak < 1e9, f"Memory usage too high: {{peak / 1e6:.2f}}MB"
-''',
-      "category": "performance",
-      "expected_to_catch": ["Memory leaks", "Inefficient operations"]
-    }},
-    ...more tests...
-  ],
-
-  "total_tests": 15,
-  "estimated_runtime_seconds": 5
-}}
-
-Design at least 12-15 tests total. Focus on tests that would have caught issues in similar papers.
-
 RETURN ONLY THE JSON. NO OTHER TEXT.
 """
 
@@ -319,29 +328,30 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
         if not self.memory:
             return "No test patterns available."
 
-        # Query for successful test patterns
-        results = await self.memory.query(
-            f"effective test patterns for {domain} caught bugs",
-            max_results=5
+        # Query for successful test patterns and reflections on what tests
+        # work together
+        results, reflections = await asyncio.gather(
+            self.memory.query(
+                f"effective test patterns for {domain} caught bugs",
+                max_results=5
+            ),
+            self.get_past_learnings("test_design", max_results=3)
         )
 
         if not results:
             return "No test patterns available."
 
-        patterns_text = "SUCCESSFUL TEST PATTERNS:\n"
+        parts = ["SUCCESSFUL TEST PATTERNS:\n"]
         for r in results:
             data = r.get('data', {})
-            patterns_text += f"- {data.get('pattern', 'N/A')}\n"
+            parts.append(f"- {data.get('pattern', 'N/A')}\n")
 
-        # Add reflections on what tests work
-        reflections = await self.get_past_learnings("test_design", max_results=3)
-        patterns_text += f"\nLEARNINGS:\n{reflections}"
+        parts.append(f"\nLEARNINGS:\n{reflections}")
 
-        return patterns_text
+        return "".join(parts)
 
     def _parse_test_suite(self, test_suite_text: str) -> TestSuite:
         """Parse LLM output into structured test suite"""
-        import json
         import re
 
         # Extract JSON
@@ -350,8 +360,8 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
             raise ValueError("Could not find JSON in response")
 
         try:
-            data = json.loads(json_match.group())
-            return TestSuite(**data)
+            # Parse and validate in one step, without an intermediate dict
+            return TestSuite.model_validate_json(json_match.group())
         except Exception as e:
             self.log_error("Failed to parse test suite", error=e)
             raise
@@ -360,7 +370,8 @@ RETURN ONLY THE JSON. NO OTHER TEXT.
         """Minimal fallback tests when design fails"""
         self.log_warning("Using fallback tests")
 
-        basic_test = TestCase(
+        # Known-good literals, so skip validation
+        basic_test = TestCase.model_construct(
             name="test_basic_functionality",
             description="Basic smoke test",
             test_code="""
@@ -375,7 +386,7 @@ def test_basic_functionality():
             expected_to_catch=["Basic errors"]
         )
 
-        return TestSuite(
+        return TestSuite.model_construct(
             fixtures="# No fixtures",
             functionality_tests=[basic_test],
             correctness_tests=[],
@@ -12,6 +12,7 @@ Based on AgentCoder (2024) execution patterns
 import asyncio
 import tempfile
 import os
+import re
 import shutil
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
@@ -22,6 +23,10 @@ from app.agents.config import AgentConfig
 from app.utils.logger import LoggerMixin
 
 
+# Result lines in verbose pytest output ("test_name PASSED" / "test_name FAILED")
+_PYTEST_RESULT_LINE = re.compile(r"^.* (?:PASSED|FAILED).*$", re.MULTILINE)
+
+
 class TestResult(BaseModel):
     """Individual test result"""
     name: str
@@ -168,7 +173,7 @@ class SimpleSandbox(LoggerMixin):
     def _build_test_file(self, tests: TestSuite) -> str:
         """Build complete test file from test suite"""
 
-        test_file = f"""
+        parts = [f"""
 # Auto-generated test file
 import pytest
 import torch
@@ -179,23 +184,23 @@ from config import *
 {tests.fixtures}
 
 # Functionality Tests
-"""
+"""]
         for test in tests.functionality_tests:
-            test_file += f"\n{test.test_code}\n"
+            parts.append(f"\n{test.test_code}\n")
 
-        test_file += "\n# Correctness Tests\n"
+        parts.append("\n# Correctness Tests\n")
         for test in tests.correctness_tests:
-            test_file += f"\n{test.test_code}\n"
+            parts.append(f"\n{test.test_code}\n")
 
-        test_file += "\n# Edge Case Tests\n"
+        parts.append("\n# Edge Case Tests\n")
         for test in tests.edge_case_tests:
-            test_file += f"\n{test.test_code}\n"
+            parts.append(f"\n{test.test_code}\n")
 
-        test_file += "\n# Performance Tests\n"
+        parts.append("\n# Performance Tests\n")
         for test in tests.performance_tests:
-            test_file += f"\n{test.test_code}\n"
+            parts.append(f"\n{test.test_code}\n")
 
-        return test_file
+        return "".join(parts)
 
     async def _install_dependencies(
         self,
@@ -273,49 +278,49 @@ from config import *
         tests_passed = 0
         tests_failed = 0
 
+        # The failure reason is the same for every failed test, so scan once
+        failure_error = "Test failed"
+        if 'AssertionError' in stdout:
+            failure_error = "Assertion failed"
+        elif 'Error' in stdout:
+            failure_error = "Runtime error"
+
         # Parse pytest output
         # Format: "test_name PASSED" or "test_name FAILED"
-        lines = stdout.split('\n')
-
-        for line in lines:
-            if ' PASSED' in line or ' FAILED' in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    test_name = parts[0].split('::')[-1]
-                    passed = ' PASSED' in line
-
-                    if passed:
-                        tests_passed += 1
-                    else:
-                        tests_failed += 1
-
-                    # Extract duration if present
-                    duration = 0.0
-                    for part in parts:
-                        if 's' in part and part[:-1].replace('.', '').isdigit():
-                            try:
-                                duration = float(part[:-1])
-                            except:
-                                pass
-
-                    # Extract error if failed
-                    error = None
-                    stack_trace = None
-                    if not passed:
-                        # Look for error details in subsequent lines
-                        error = "Test failed"
-                        if 'AssertionError' in stdout:
-                            error = "Assertion failed"
-                        elif 'Error' in stdout:
-                            error = "Runtime error"
-
-                    test_results.append(TestResult(
-                        name=test_name,
-                        passed=passed,
-                        duration=duration,
-                        error=error,
-                        stack_trace=stack_trace
-                    ))
+        for match in _PYTEST_RESULT_LINE.finditer(stdout):
+            line = match.group()
+            parts = line.split()
+            if len(parts) >= 2:
+                test_name = parts[0].split('::')[-1]
+                passed = ' PASSED' in line
+
+                if passed:
+                    tests_passed += 1
+                else:
+                    tests_failed += 1
+
+                # Extract duration if present
+                duration = 0.0
+                for part in parts:
+                    if 's' in part and part[:-1].replace('.', '').isdigit():
+                        try:
+                            duration = float(part[:-1])
+                        except:
+                            pass
+
+                # Extract error if failed
+                error = None
+                stack_trace = None
+                if not passed:
+                    error = failure_error
+
+                test_results.append(TestResult(
+                    name=test_name,
+                    passed=passed,
+                    duration=duration,
+                    error=error,
+                    stack_trace=stack_trace
+                ))
 
         tests_total = tests_passed + tests_failed
         success = returncode == 0 and tests_failed == 0
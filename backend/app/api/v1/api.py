@@ -2,7 +2,7 @@
 API v1 router configuration
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import papers, knowledge_graph, enrichment, trends, agent_memory, atlas_db, ingestion, discovery, data_moat, leaderboards, pipeline, search
+from app.api.v1.endpoints import papers, knowledge_graph, enrichment, trends, agent_memory, atlas_db, ingestion, discovery, data_moat, leaderboards, pipeline, search, embeddings
 
 api_router = APIRouter()
 api_router.include_router(papers.router, prefix="/papers", tags=["papers"])
@@ -17,3 +17,4 @@ api_router.include_router(discovery.router, tags=["discovery"])
 api_router.include_router(data_moat.router, prefix="/data-moat", tags=["data-moat"])
 api_router.include_router(leaderboards.router, tags=["leaderboards"])
 api_router.include_router(pipeline.router, tags=["pipeline"])
+api_router.include_router(embeddings.router, tags=["embeddings"])
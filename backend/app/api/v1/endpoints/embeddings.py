@@ -0,0 +1,50 @@
+"""
+Embedding endpoints backed by the shared SPECTER2 encoder.
+
+Lets offline jobs (scripts/update_embeddings.py) encode against the model the
+API server already holds in memory instead of loading their own copy.
+"""
+import asyncio
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from app.services.specter2_encoder import get_specter2_encoder
+
+router = APIRouter(prefix="/embeddings")
+
+# The model is not safe to drive from several threads at once
+_encode_lock = asyncio.Lock()
+
+# Upper bound on texts per request, so one caller cannot hold the encode lock
+# (and build a response) without limit
+MAX_ENCODE_TEXTS = 1024
+
+
+class EncodeRequest(BaseModel):
+    texts: List[str] = Field(min_length=1, max_length=MAX_ENCODE_TEXTS)
+    batch_size: int = Field(default=32, ge=1, le=256)
+
+
+class EncodeResponse(BaseModel):
+    embeddings: List[List[float]]
+    dimension: int
+
+
+@router.post("/encode", response_model=EncodeResponse)
+async def encode_texts(request: EncodeRequest):
+    """Encode texts into L2-normalized SPECTER2 embeddings."""
+    encoder = get_specter2_encoder()
+    try:
+        async with _encode_lock:
+            embeddings = await asyncio.to_thread(
+                encoder.encode, request.texts, request.batch_size
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Encoding failed: {str(e)}")
+
+    return EncodeResponse(
+        embeddings=embeddings.tolist(),
+        dimension=int(embeddings.shape[1]),
+    )
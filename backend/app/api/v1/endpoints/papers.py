@@ -871,7 +871,7 @@ def _build_full_test_code(tests) -> str:
     if not tests:
         return ""
 
-    test_file = f"""# Auto-generated test file
+    parts = [f"""# Auto-generated test file
 import pytest
 import torch
 import numpy as np
@@ -881,23 +881,23 @@ from config import *
 {tests.fixtures}
 
 # Functionality Tests
-"""
+"""]
     for test in tests.functionality_tests:
-        test_file += f"\n{test.test_code}\n"
+        parts.append(f"\n{test.test_code}\n")
 
-    test_file += "\n# Correctness Tests\n"
+    parts.append("\n# Correctness Tests\n")
     for test in tests.correctness_tests:
-        test_file += f"\n{test.test_code}\n"
+        parts.append(f"\n{test.test_code}\n")
 
-    test_file += "\n# Edge Case Tests\n"
+    parts.append("\n# Edge Case Tests\n")
     for test in tests.edge_case_tests:
-        test_file += f"\n{test.test_code}\n"
+        parts.append(f"\n{test.test_code}\n")
 
-    test_file += "\n# Performance Tests\n"
+    parts.append("\n# Performance Tests\n")
     for test in tests.performance_tests:
-        test_file += f"\n{test.test_code}\n"
+        parts.append(f"\n{test.test_code}\n")
 
-    return test_file
+    return "".join(parts)
 
 
 @router.post("/{paper_id}/generate-code")
@@ -12,6 +12,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from app.services.local_atlas_service import LocalAtlasService
+from app.services.technique_extraction_service import match_task_domains, match_technique_keys
+
 
 def iterate_ndjson_files(input_dir: Path) -> List[Path]:
     """Return a sorted list of NDJSON files inside the input directory."""
@@ -34,6 +37,18 @@ def sanitize_record(record: Dict[str, Any]) -> Dict[str, Any]:
     return sanitized
 
 
+def tag_techniques(record: Dict[str, Any]) -> None:
+    """
+    Store the heuristic technique and task-domain keys on the record.
+
+    Matched against the same text the atlas searches, so trend queries can
+    read these fields instead of re-matching every paper at runtime.
+    """
+    text = LocalAtlasService._compose_search_text(record)
+    record["heuristic_techniques"] = match_technique_keys(text)
+    record["heuristic_domains"] = match_task_domains(text)
+
+
 def build_datasets(input_dir: Path, output_dir: Path) -> Dict[str, Any]:
     """Read raw dumps and build derived datasets and statistics."""
     files = iterate_ndjson_files(input_dir)
@@ -65,6 +80,7 @@ def build_datasets(input_dir: Path, output_dir: Path) -> Dict[str, Any]:
                     continue
 
                 seen_ids.add(paper_id)
+                tag_techniques(data)
                 papers.append(data)
                 record_count += 1
 
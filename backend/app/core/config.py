@@ -36,22 +36,41 @@ class Settings(BaseSettings):
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379"
     REDIS_CACHE_TTL: int = 86400  # 24 hours
+    ARXIV_PAPER_CACHE_TTL: int = 604800  # 7 days
+    INGESTED_IDS_TTL: int = 2592000  # 30 days; refreshed whenever ingestion records IDs
+    ANALYSIS_CACHE_TTL: int = 1209600  # 14 days
+    LLM_COMPLETION_CACHE_TTL: int = 3600  # 1 hour; only deterministic (temperature 0) calls
+    # Word-set overlap at which another version's cached analysis is reused
+    ANALYSIS_SIMILARITY_THRESHOLD: float = 0.9
 
     # AI Service Configuration
     GEMINI_API_KEY: Optional[str] = None
     GEMINI_MODEL: str = "gemini-2.5-flash-lite"
+    # One Gemini request per paper instead of four per-stage requests
+    GEMINI_COMBINED_ANALYSIS: bool = True
+    # Papers analyzed per combined request in batch summaries
+    GEMINI_PAPERS_PER_REQUEST: int = 5
     OPENAI_API_KEY: Optional[str] = None
 
     # Rate Limiting
     MAX_PAPERS_PER_BATCH: int = 20
     GEMINI_RATE_LIMIT_BATCH_SIZE: int = 5
     GEMINI_RATE_LIMIT_DELAY: float = 2.0
+    GEMINI_MAX_CONCURRENCY: int = 4  # In-flight analysis requests per process
+    GEMINI_MAX_RETRIES: int = 3  # Retries after a 429 before giving up
+    GEMINI_RETRY_BASE_DELAY: float = 60.0  # Doubles per retry, capped at GEMINI_RETRY_MAX_DELAY
+    GEMINI_RETRY_MAX_DELAY: float = 300.0
 
     # arXiv API Configuration
     ARXIV_API_BASE_URL: str = "http://export.arxiv.org/api/query"
     ARXIV_MAX_RESULTS: int = 500
     ARXIV_SPLIT_THRESHOLD: int = 900
     ARXIV_MIN_SPLIT_DAYS: int = 1
+    ARXIV_REQUESTS_PER_MINUTE: int = 20  # arXiv requests are spaced evenly: 20/min = one every 3s
+    ARXIV_MAX_RETRIES: int = 3  # Retries after a 429/503 before giving up
+    ARXIV_WINDOW_CONCURRENCY: int = 8  # Ingestion windows/categories fetched at once
+    INGEST_STORE_CONCURRENCY: int = 4  # Fetched windows stored/embedded at once
+    GRAPH_WRITE_CONCURRENCY: int = 4  # Papers' research graph writes in flight at once
 
     # GitHub API Configuration (Optional - for code detection)
     GITHUB_TOKEN: Optional[str] = None  # Get from https://github.com/settings/tokens
@@ -66,6 +85,8 @@ class Settings(BaseSettings):
     ATLAS_EMBED_CACHE_DIR: str = "../embeddings"
     ATLAS_EMBED_CACHE_LABEL: Optional[str] = None
     ATLAS_EMBED_BUILD_ON_STARTUP: bool = False
+    # Warm SPECTER2 encoder served by the API; update_embeddings.py falls back to in-process
+    SPECTER2_ENCODE_URL: Optional[str] = "http://localhost:8000/api/v1/embeddings/encode"
     CONTEXTUAL_SEARCH_TOP_K: int = 6
     CONTEXTUAL_SEARCH_MAX_DAYS: int = 1095  # ~3 years
     DEFAULT_AI_CATEGORIES: List[str] = [
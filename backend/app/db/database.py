@@ -35,7 +35,8 @@ else:
     database = Database(
         DATABASE_URL,
         min_size=5,          # Minimum connections in pool
-        max_size=20          # Maximum connections in pool
+        max_size=20,         # Maximum connections in pool
+        timeout=10,          # Connect timeout (seconds) instead of hanging on a dead pooler
     )
 
 # For SQLAlchemy models
@@ -49,7 +50,9 @@ else:
         DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://"),
         pool_pre_ping=True,
         pool_size=10,
-        max_overflow=20
+        max_overflow=20,
+        pool_recycle=1800,   # Recycle connections before server-side idle timeouts
+        pool_timeout=10      # Fail fast when the pool is exhausted
     )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
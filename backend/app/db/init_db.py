@@ -122,6 +122,12 @@ CREATE INDEX IF NOT EXISTS concepts_embedding_idx ON concepts
     USING hnsw (embedding vector_cosine_ops);
 """
 
+# B-tree indexes for lookups that filter on an expression rather than a column
+LOOKUP_INDEXES_SQL = """
+-- Version-less arXiv ID, used by ingestion dedup (split_part(id, 'v', 1) IN ...)
+CREATE INDEX IF NOT EXISTS papers_base_id_idx ON papers (split_part(id, 'v', 1));
+"""
+
 # Materialized views for common queries
 VIEWS_SQL = """
 -- Top papers by citations (refreshed periodically)
@@ -205,6 +211,17 @@ async def create_vector_indexes():
         print(f"⚠️  Vector index creation warning: {e}")
 
 
+async def create_lookup_indexes():
+    """Create expression indexes used by lookup queries"""
+    print("🔎 Creating lookup indexes...")
+    try:
+        async with database.transaction():
+            await database.execute(text(LOOKUP_INDEXES_SQL))
+        print("✅ Lookup indexes created successfully")
+    except Exception as e:
+        print(f"⚠️  Lookup index creation warning: {e}")
+
+
 async def create_views():
     """Create materialized views for common queries"""
     print("👁️  Creating materialized views...")
@@ -284,10 +301,13 @@ async def init_database():
         # Step 4: Vector Indexes
         await create_vector_indexes()
 
-        # Step 5: Views
+        # Step 5: Lookup Indexes
+        await create_lookup_indexes()
+
+        # Step 6: Views
         await create_views()
 
-        # Step 6: Verify
+        # Step 7: Verify
         success = await verify_setup()
 
         print("\n" + "=" * 60)
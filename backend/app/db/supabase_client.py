@@ -21,7 +21,7 @@ Setup:
 """
 import os
 from typing import Optional, Any, Dict, List
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from dotenv import load_dotenv
 
@@ -421,8 +421,10 @@ class AgentMemorySupabase:
     agent_memory_* tables.
     """
 
-    def __init__(self):
-        self.helper = SupabaseHelper(use_admin=True)
+    @cached_property
+    def helper(self) -> SupabaseHelper:
+        """Admin helper, created on first use so importing this module never connects"""
+        return SupabaseHelper(use_admin=True)
 
     async def add_reflection(
         self,
@@ -10,6 +10,9 @@ from app.core.config import settings
 from app.api.v1.api import api_router
 from app.services.local_atlas_service import local_atlas_service
 from app.services.scheduler_service import get_scheduler_service
+from app.services.arxiv_service import arxiv_service
+from app.services.cache_service import cache_service
+from app.services.code_detection_service import code_detection_service
 from app.db.database import connect_db, disconnect_db
 
 
@@ -18,6 +21,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown events"""
     # Startup
     await connect_db()
+    # Open the cache connection now rather than on the first request
+    await cache_service.warmup()
 
     # Start the scheduler for background jobs (if enabled)
     scheduler = get_scheduler_service()
@@ -27,6 +32,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     scheduler.stop()
+    await arxiv_service.aclose()
+    await code_detection_service.aclose()
+    await cache_service.aclose()
     await disconnect_db()
 
 
@@ -79,8 +87,6 @@ async def get_papers_compat(
     query: str = ""
 ):
     """Frontend-compatible papers endpoint."""
-    from app.services.arxiv_service import arxiv_service
-
     try:
         limit = min(20, settings.MAX_PAPERS_PER_BATCH)
 
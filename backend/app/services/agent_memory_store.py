@@ -237,8 +237,17 @@ class PersistentMemoryStore(LoggerMixin):
             )
         )
 
-        # Build the query
-        query = select(AgentMemoryNode)
+        # Build the query, projecting only the columns scored below
+        # (notably not the 1536-d embedding)
+        query = select(
+            AgentMemoryNode.id,
+            AgentMemoryNode.content,
+            AgentMemoryNode.searchable_text,
+            AgentMemoryNode.created_at,
+            AgentMemoryNode.last_accessed,
+            AgentMemoryNode.access_count,
+            AgentMemoryNode.decay_rate,
+        )
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -289,16 +298,16 @@ class PersistentMemoryStore(LoggerMixin):
         results.sort(key=lambda x: x["relevance"], reverse=True)
 
         # Update access patterns for returned results
-        for result in results[:max_results]:
-            await self._update_access(result["node_id"])
+        if results:
+            await self._update_access([result["node_id"] for result in results[:max_results]])
 
         return results[:max_results]
 
-    async def _update_access(self, node_id: str):
-        """Update access count and timestamp for a node"""
+    async def _update_access(self, node_ids: List[str]):
+        """Update access count and timestamp for nodes (one statement)"""
         query = (
             update(AgentMemoryNode)
-            .where(AgentMemoryNode.id == node_id)
+            .where(AgentMemoryNode.id.in_(node_ids))
             .values(
                 access_count=AgentMemoryNode.access_count + 1,
                 last_accessed=datetime.utcnow()
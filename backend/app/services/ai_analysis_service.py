@@ -2,15 +2,123 @@
 AI analysis service for paper processing using Google Gemini
 """
 import asyncio
+import json
 import time
-from typing import Dict, Any, List
-import google.generativeai as genai
+from typing import Dict, Any, List, Optional
+from google.api_core import exceptions as google_exceptions
 from app.core.config import settings
 from app.services.cache_service import cache_service
 from app.services.code_detection_service import code_detection_service
+from app.services.gemini_model import get_gemini_model
 from app.utils.logger import LoggerMixin
 from app.utils.exceptions import AIAnalysisException, RateLimitException
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Shared across all analyses on an event loop so concurrent papers cannot fan
+# out past the project's Gemini quota. Semaphores are bound to the loop that
+# first contends for them, so each loop (e.g. each asyncio.run) gets its own
+_GEMINI_SEMAPHORES: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _gemini_semaphore() -> asyncio.Semaphore:
+    """The Gemini request semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _GEMINI_SEMAPHORES.get(loop)
+    if semaphore is None:
+        # Forget loops that have finished so their semaphores are not kept alive
+        for closed in [other for other in _GEMINI_SEMAPHORES if other.is_closed()]:
+            del _GEMINI_SEMAPHORES[closed]
+        semaphore = _GEMINI_SEMAPHORES[loop] = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+    return semaphore
+
+
+# Offline defaults for each analysis stage, overlaid by the model's reply
+_DEFAULT_TECHNICAL_ANALYSIS = {
+    "keyContribution": "Novel technical approach identified",
+    "methodologyBreakdown": "Advanced methodology analysis",
+    "performanceHighlights": "Significant performance improvements",
+    "implementationInsights": "Moderate implementation complexity",
+}
+_DEFAULT_RESEARCH_CONTEXT = {
+    "researchContext": "Advances current research in the field",
+    "futureImplications": "Opens new research directions",
+    "limitations": "Some implementation constraints exist",
+    "researchSignificance": "significant",
+}
+_DEFAULT_PRACTICAL_ASSESSMENT = {
+    "impactScore": 7,
+    "difficultyLevel": "intermediate",
+    "readingTime": 15,
+    "hasCode": False,
+    "implementationComplexity": "medium",
+    "practicalApplicability": "medium",
+    "reproductionDifficulty": "medium",
+}
+_DEFAULT_BASIC_SUMMARY = {
+    "summary": "This paper presents a novel approach to advancing AI research.",
+    "novelty": "Introduces new techniques for improved performance",
+    "technicalInnovation": "Advanced methodology with practical applications",
+}
+_DEFAULT_COMBINED_ANALYSIS = {
+    **_DEFAULT_BASIC_SUMMARY,
+    **_DEFAULT_TECHNICAL_ANALYSIS,
+    **_DEFAULT_RESEARCH_CONTEXT,
+    **_DEFAULT_PRACTICAL_ASSESSMENT,
+}
+
+# Constant fallbacks for failed analysis stages - built once, handed out as copies
+_FAILED_TECHNICAL_ANALYSIS = {
+    "keyContribution": "Analysis unavailable",
+    "methodologyBreakdown": "Analysis failed",
+    "performanceHighlights": "Results unavailable",
+    "implementationInsights": "Implementation details unclear",
+}
+_FAILED_RESEARCH_CONTEXT = {
+    "researchContext": "Context unavailable",
+    "futureImplications": "Implications unclear",
+    "limitations": "Limitations not identified",
+    "researchSignificance": "incremental",
+}
+_FAILED_PRACTICAL_ASSESSMENT = {
+    "impactScore": 5,
+    "difficultyLevel": "intermediate",
+    "readingTime": 10,
+    "hasCode": False,
+    "implementationComplexity": "medium",
+    "practicalApplicability": "medium",
+    "reproductionDifficulty": "medium",
+}
+_FAILED_BASIC_SUMMARY = {
+    "summary": "Summary unavailable",
+    "novelty": "Novelty assessment unavailable",
+    "technicalInnovation": "Technical innovation unclear",
+}
+_FAILED_COMBINED_ANALYSIS = {
+    **_FAILED_BASIC_SUMMARY,
+    **_FAILED_TECHNICAL_ANALYSIS,
+    **_FAILED_RESEARCH_CONTEXT,
+    **_FAILED_PRACTICAL_ASSESSMENT,
+}
+# Abstracts shorter than this (empty, withdrawn, placeholder) are not worth a model call
+_MIN_ABSTRACT_LENGTH = 200
+_NO_CODE_INFO = {"hasCode": False, "officialRepo": None, "communityRepos": [], "totalRepos": 0}
+_FAILED_PAPER_ANALYSIS = {
+    "summary": "Analysis failed",
+    "novelty": "Unable to assess",
+    "technicalInnovation": "Technical details unavailable",
+    "keyContribution": "Analysis error",
+    "methodologyBreakdown": "Method unclear",
+    "performanceHighlights": "Results unavailable",
+    "implementationInsights": "Implementation details unclear",
+    **_FAILED_RESEARCH_CONTEXT,
+    **_FAILED_PRACTICAL_ASSESSMENT,
+}
+
 
 class DummyGeminiResponse:
     """Lightweight response object to mimic Gemini responses."""
@@ -49,8 +157,7 @@ class AIAnalysisService(LoggerMixin):
             if not settings.GEMINI_API_KEY:
                 raise ValueError("GEMINI_API_KEY missing")
 
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+            self.model = get_gemini_model()
             self.log_info("AI Analysis Service initialized")
         except Exception as exc:
             self.fallback_mode = True
@@ -59,6 +166,41 @@ class AIAnalysisService(LoggerMixin):
                 "Gemini model unavailable; continuing with deterministic fallbacks",
                 error=str(exc)
             )
+
+    def _generate_json_blocking(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Call Gemini and decode its JSON reply (blocking; run in a worker thread)"""
+        response = self.model.generate_content(prompt)
+        if not response.text:
+            return None
+        try:
+            text = response.text.strip()
+            parsed = orjson.loads(text) if orjson is not None else json.loads(text)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    async def _generate_json(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Run a Gemini request with bounded concurrency and return the decoded JSON reply.
+
+        The request and the decoding of the reply both run in a worker thread
+        so large responses never block the event loop. Rate-limit (429)
+        responses are retried with exponential backoff; the semaphore is
+        released while waiting so other requests can proceed.
+        """
+        delay = settings.GEMINI_RETRY_BASE_DELAY
+        for attempt in range(settings.GEMINI_MAX_RETRIES + 1):
+            try:
+                async with _gemini_semaphore():
+                    return await asyncio.to_thread(self._generate_json_blocking, prompt)
+            except google_exceptions.ResourceExhausted as e:
+                if attempt == settings.GEMINI_MAX_RETRIES:
+                    raise RateLimitException(
+                        f"Gemini rate limit exceeded: {str(e)}", error_code="GEMINI_RATE_LIMIT"
+                    ) from e
+                self.log_warning("Gemini rate limited, backing off", delay=delay, attempt=attempt + 1)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, settings.GEMINI_RETRY_MAX_DELAY)
     
     async def generate_technical_analysis(self, abstract: str, title: str) -> Dict[str, Any]:
         """Generate technical analysis of the paper"""
@@ -78,36 +220,25 @@ class AIAnalysisService(LoggerMixin):
         """
 
         if self.fallback_mode:
-            return {
-                "keyContribution": "Novel technical approach identified",
-                "methodologyBreakdown": "Advanced methodology analysis",
-                "performanceHighlights": "Significant performance improvements",
-                "implementationInsights": "Moderate implementation complexity"
-            }
+            return dict(_DEFAULT_TECHNICAL_ANALYSIS)
 
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            
-            analysis = {
-                "keyContribution": "Novel technical approach identified",
-                "methodologyBreakdown": "Advanced methodology analysis",
-                "performanceHighlights": "Significant performance improvements",
-                "implementationInsights": "Moderate implementation complexity"
-            }
-            
-            if response.text:
-                try:
-                    import json
-                    parsed = json.loads(response.text.strip())
-                    analysis.update(parsed)
-                except:
-                    pass
-            
-            return analysis
-            
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            # Already retried with backoff; passed through unchanged so callers
+            # can skip their own retry
+            raise
         except Exception as e:
             self.log_error("Technical analysis failed", error=e, title=title)
             raise AIAnalysisException(f"Technical analysis failed: {str(e)}", error_code="TECHNICAL_ANALYSIS_ERROR")
+
+        if not parsed:
+            # An empty or unparseable reply fails the stage, so its defaults are never cached
+            raise AIAnalysisException("Technical analysis returned no JSON", error_code="TECHNICAL_ANALYSIS_ERROR")
+
+        analysis = dict(_DEFAULT_TECHNICAL_ANALYSIS)
+        analysis.update(parsed)
+        return analysis
     
     async def generate_research_context(self, abstract: str, title: str) -> Dict[str, Any]:
         """Generate research context and implications"""
@@ -127,36 +258,23 @@ class AIAnalysisService(LoggerMixin):
         """
 
         if self.fallback_mode:
-            return {
-                "researchContext": "Advances current research in the field",
-                "futureImplications": "Opens new research directions",
-                "limitations": "Some implementation constraints exist",
-                "researchSignificance": "significant"
-            }
+            return dict(_DEFAULT_RESEARCH_CONTEXT)
 
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            
-            analysis = {
-                "researchContext": "Advances current research in the field",
-                "futureImplications": "Opens new research directions",
-                "limitations": "Some implementation constraints exist",
-                "researchSignificance": "significant"
-            }
-            
-            if response.text:
-                try:
-                    import json
-                    parsed = json.loads(response.text.strip())
-                    analysis.update(parsed)
-                except:
-                    pass
-            
-            return analysis
-            
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            raise
         except Exception as e:
             self.log_error("Research context analysis failed", error=e, title=title)
             raise AIAnalysisException(f"Research context analysis failed: {str(e)}", error_code="RESEARCH_CONTEXT_ERROR")
+
+        if not parsed:
+            # An empty or unparseable reply fails the stage, so its defaults are never cached
+            raise AIAnalysisException("Research context analysis returned no JSON", error_code="RESEARCH_CONTEXT_ERROR")
+
+        analysis = dict(_DEFAULT_RESEARCH_CONTEXT)
+        analysis.update(parsed)
+        return analysis
     
     async def generate_practical_assessment(self, abstract: str, title: str) -> Dict[str, Any]:
         """Generate practical assessment metrics"""
@@ -179,42 +297,23 @@ class AIAnalysisService(LoggerMixin):
         """
 
         if self.fallback_mode:
-            return {
-                "impactScore": 7,
-                "difficultyLevel": "intermediate",
-                "readingTime": 15,
-                "hasCode": False,
-                "implementationComplexity": "medium",
-                "practicalApplicability": "medium",
-                "reproductionDifficulty": "medium"
-            }
+            return dict(_DEFAULT_PRACTICAL_ASSESSMENT)
 
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            
-            assessment = {
-                "impactScore": 7,
-                "difficultyLevel": "intermediate",
-                "readingTime": 15,
-                "hasCode": False,
-                "implementationComplexity": "medium",
-                "practicalApplicability": "medium",
-                "reproductionDifficulty": "medium"
-            }
-            
-            if response.text:
-                try:
-                    import json
-                    parsed = json.loads(response.text.strip())
-                    assessment.update(parsed)
-                except:
-                    pass
-            
-            return assessment
-            
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            raise
         except Exception as e:
             self.log_error("Practical assessment failed", error=e, title=title)
             raise AIAnalysisException(f"Practical assessment failed: {str(e)}", error_code="PRACTICAL_ASSESSMENT_ERROR")
+
+        if not parsed:
+            # An empty or unparseable reply fails the stage, so its defaults are never cached
+            raise AIAnalysisException("Practical assessment returned no JSON", error_code="PRACTICAL_ASSESSMENT_ERROR")
+
+        assessment = dict(_DEFAULT_PRACTICAL_ASSESSMENT)
+        assessment.update(parsed)
+        return assessment
     
     async def generate_basic_summary(self, abstract: str, title: str) -> Dict[str, Any]:
         """Generate basic summary and novelty assessment"""
@@ -233,35 +332,224 @@ class AIAnalysisService(LoggerMixin):
         """
 
         if self.fallback_mode:
-            return {
-                "summary": "This paper presents a novel approach to advancing AI research.",
-                "novelty": "Introduces new techniques for improved performance",
-                "technicalInnovation": "Advanced methodology with practical applications"
-            }
+            return dict(_DEFAULT_BASIC_SUMMARY)
 
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            
-            summary = {
-                "summary": "This paper presents a novel approach to advancing AI research.",
-                "novelty": "Introduces new techniques for improved performance",
-                "technicalInnovation": "Advanced methodology with practical applications"
-            }
-            
-            if response.text:
-                try:
-                    import json
-                    parsed = json.loads(response.text.strip())
-                    summary.update(parsed)
-                except:
-                    pass
-            
-            return summary
-            
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            raise
         except Exception as e:
             self.log_error("Basic summary generation failed", error=e, title=title)
             raise AIAnalysisException(f"Basic summary generation failed: {str(e)}", error_code="BASIC_SUMMARY_ERROR")
+
+        if not parsed:
+            # An empty or unparseable reply fails the stage, so its defaults are never cached
+            raise AIAnalysisException("Basic summary generation returned no JSON", error_code="BASIC_SUMMARY_ERROR")
+
+        summary = dict(_DEFAULT_BASIC_SUMMARY)
+        summary.update(parsed)
+        return summary
     
+    async def generate_combined_analysis(self, abstract: str, title: str) -> Dict[str, Any]:
+        """Generate all four analysis stages from a single model request"""
+        prompt = f"""
+        Analyze this AI research paper:
+
+        Title: {title}
+        Abstract: {abstract}
+
+        Provide:
+        1. Summary (2-3 sentences), novelty (what's new about this approach?) and
+           technical innovation (key technical contribution)
+        2. Key technical innovation, methodology breakdown, performance highlights
+           and implementation insights
+        3. Research context (field, related work), future implications, limitations
+           and research significance (incremental/significant/breakthrough)
+        4. Impact Score (1-10), Difficulty Level (beginner/intermediate/advanced),
+           Reading Time (minutes), Has Code (true/false), and Implementation Complexity,
+           Practical Applicability and Reproduction Difficulty (each low/medium/high)
+
+        Return as a single flat JSON object with keys: summary, novelty, technicalInnovation,
+        keyContribution, methodologyBreakdown, performanceHighlights, implementationInsights,
+        researchContext, futureImplications, limitations, researchSignificance,
+        impactScore, difficultyLevel, readingTime, hasCode, implementationComplexity,
+        practicalApplicability, reproductionDifficulty
+        """
+
+        analysis = dict(_DEFAULT_COMBINED_ANALYSIS)
+
+        if self.fallback_mode:
+            return analysis
+
+        try:
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            raise
+        except Exception as e:
+            self.log_error("Combined analysis failed", error=e, title=title)
+            raise AIAnalysisException(f"Combined analysis failed: {str(e)}", error_code="COMBINED_ANALYSIS_ERROR")
+
+        if not parsed:
+            # Same rule as the per-stage requests: no JSON means no cacheable analysis
+            raise AIAnalysisException("Combined analysis returned no JSON", error_code="COMBINED_ANALYSIS_ERROR")
+
+        analysis.update(parsed)
+        return analysis
+
+    async def generate_combined_analyses(self, papers: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate combined analyses for several papers from a single model request.
+
+        ``papers`` holds ``title``/``abstract`` dicts. Results are aligned with
+        the input; a paper the reply left out comes back as None.
+        """
+        paper_blocks = "\n\n".join(
+            f"Paper {number}:\nTitle: {paper['title']}\nAbstract: {paper['abstract']}"
+            for number, paper in enumerate(papers, start=1)
+        )
+        prompt = f"""
+        Analyze each of these AI research papers:
+
+{paper_blocks}
+
+        For each paper provide:
+        1. Summary (2-3 sentences), novelty (what's new about this approach?) and
+           technical innovation (key technical contribution)
+        2. Key technical innovation, methodology breakdown, performance highlights
+           and implementation insights
+        3. Research context (field, related work), future implications, limitations
+           and research significance (incremental/significant/breakthrough)
+        4. Impact Score (1-10), Difficulty Level (beginner/intermediate/advanced),
+           Reading Time (minutes), Has Code (true/false), and Implementation Complexity,
+           Practical Applicability and Reproduction Difficulty (each low/medium/high)
+
+        Return as a JSON object {{"analyses": [...]}} holding one flat object per paper,
+        in the order given, each with keys: paper (its number), summary, novelty,
+        technicalInnovation, keyContribution, methodologyBreakdown, performanceHighlights,
+        implementationInsights, researchContext, futureImplications, limitations,
+        researchSignificance, impactScore, difficultyLevel, readingTime, hasCode,
+        implementationComplexity, practicalApplicability, reproductionDifficulty
+        """
+
+        if self.fallback_mode:
+            return [dict(_DEFAULT_COMBINED_ANALYSIS) for _ in papers]
+
+        try:
+            parsed = await self._generate_json(prompt)
+        except RateLimitException:
+            raise
+        except Exception as e:
+            self.log_error("Combined batch analysis failed", error=e, papers=len(papers))
+            raise AIAnalysisException(f"Combined batch analysis failed: {str(e)}", error_code="COMBINED_ANALYSIS_ERROR")
+
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(papers)
+        replies = parsed.get("analyses") if parsed else None
+        if not isinstance(replies, list):
+            return analyses
+
+        for position, reply in enumerate(replies):
+            if not isinstance(reply, dict):
+                continue
+            # Trust the paper number when it is valid, otherwise the position
+            number = reply.pop("paper", None)
+            index = number - 1 if isinstance(number, int) and 0 < number <= len(papers) else position
+            if index < len(papers) and analyses[index] is None:
+                analyses[index] = {**_DEFAULT_COMBINED_ANALYSIS, **reply}
+        return analyses
+
+    def _short_abstract_analysis(self, title: str, abstract: str) -> Optional[Dict[str, Any]]:
+        """Fallback analysis for abstracts too short to be worth a model call, else None"""
+        abstract_text = (abstract or "").strip()
+        if len(abstract_text) >= _MIN_ABSTRACT_LENGTH:
+            return None
+
+        self.log_info("Skipped LLM analysis: abstract too short", title=title, length=len(abstract_text))
+        return {
+            **_FAILED_COMBINED_ANALYSIS,
+            "summary": abstract_text or _FAILED_BASIC_SUMMARY["summary"],
+            "codeAvailability": dict(_NO_CODE_INFO, communityRepos=[]),
+        }
+
+    async def _get_cached_comprehensive(
+        self, title: str, abstract: str, arxiv_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Cached analysis of this paper, or of another version of it"""
+        cached_result = await cache_service.get_cached_analysis(title, abstract, "full", arxiv_id)
+        if not cached_result and arxiv_id:
+            cached_result = await cache_service.get_similar_cached_analysis(title, abstract, arxiv_id, "full")
+        if cached_result:
+            self.log_info("Using cached analysis", title=title)
+        return cached_result
+
+    async def _analyze_paper_group(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Comprehensive analyses for a group of papers sharing one model request.
+
+        Short abstracts and cache hits are answered without the model; the
+        remaining papers go into a single generate_combined_analyses call
+        while code detection runs per paper alongside it.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        pending: List[int] = []
+        for index, paper in enumerate(papers):
+            title, abstract = paper.get('title', ''), paper.get('summary', '')
+            result = self._short_abstract_analysis(title, abstract)
+            if result is None:
+                result = await self._get_cached_comprehensive(title, abstract, paper.get('id'))
+            if result is None:
+                pending.append(index)
+            results.append(result)
+
+        if not pending:
+            return results
+
+        detect = [index for index in pending if papers[index].get('authors') and papers[index].get('id')]
+        outcomes = await asyncio.gather(
+            self.generate_combined_analyses([
+                {"title": papers[index].get('title', ''), "abstract": papers[index].get('summary', '')}
+                for index in pending
+            ]),
+            *(
+                code_detection_service.detect_code_from_paper(
+                    title=papers[index].get('title', ''),
+                    abstract=papers[index].get('summary', ''),
+                    authors=papers[index]['authors'],
+                    arxiv_id=papers[index]['id']
+                )
+                for index in detect
+            ),
+            return_exceptions=True
+        )
+        analyses, code_results = outcomes[0], dict(zip(detect, outcomes[1:]))
+
+        if isinstance(analyses, Exception):
+            self.log_warning("Combined batch analysis failed, using fallback", error=str(analyses))
+            analyses = [None] * len(pending)
+
+        for index, analysis in zip(pending, analyses):
+            paper = papers[index]
+            # Same rule as generate_comprehensive_analysis: only cache real model output
+            cacheable = not self.fallback_mode and analysis is not None
+
+            if analysis is None:
+                analysis = dict(_FAILED_COMBINED_ANALYSIS)
+
+            code_info = code_results.get(index)
+            if isinstance(code_info, Exception):
+                self.log_warning("Code detection failed, using fallback", error=str(code_info))
+                cacheable = False
+                code_info = None
+            if code_info is None:
+                code_info = dict(_NO_CODE_INFO, communityRepos=[])
+
+            results[index] = {**analysis, "codeAvailability": code_info}
+            if cacheable:
+                await cache_service.cache_analysis(
+                    paper.get('title', ''), paper.get('summary', ''), results[index], "full", paper.get('id')
+                )
+
+        return results
+
     async def generate_comprehensive_analysis(
         self,
         abstract: str,
@@ -272,23 +560,32 @@ class AIAnalysisService(LoggerMixin):
         """Generate comprehensive analysis using all stages"""
         self.log_info("Starting comprehensive analysis", title=title)
 
+        skipped = self._short_abstract_analysis(title, abstract)
+        if skipped:
+            return skipped
+
         # Check cache first
-        cached_result = cache_service.get_cached_analysis(title, abstract, "full")
+        cached_result = await self._get_cached_comprehensive(title, abstract, arxiv_id)
         if cached_result:
-            self.log_info("Using cached analysis", title=title)
             return cached_result
 
         # Run all analysis stages in parallel
         try:
             self.log_info("Running parallel analysis stages", title=title)
 
-            # Create tasks for all stages (including code detection)
-            tasks = [
-                self.generate_technical_analysis(abstract, title),
-                self.generate_research_context(abstract, title),
-                self.generate_practical_assessment(abstract, title),
-                self.generate_basic_summary(abstract, title)
-            ]
+            # Create tasks for all stages (including code detection); the combined
+            # request sends the paper once instead of once per stage
+            combined = settings.GEMINI_COMBINED_ANALYSIS
+            if combined:
+                stages = [self.generate_combined_analysis]
+            else:
+                stages = [
+                    self.generate_technical_analysis,
+                    self.generate_research_context,
+                    self.generate_practical_assessment,
+                    self.generate_basic_summary
+                ]
+            tasks = [stage(abstract, title) for stage in stages]
 
             # Add code detection if we have author info
             if authors and arxiv_id:
@@ -304,33 +601,69 @@ class AIAnalysisService(LoggerMixin):
             # Execute all tasks with exception handling
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
+            # Retry failed model stages once on their own, keeping the stages that
+            # succeeded; rate-limit failures have already been retried with backoff
+            retry = [
+                index for index, result in enumerate(results[:len(stages)])
+                if isinstance(result, Exception)
+                and not isinstance(result, RateLimitException)
+            ]
+            if retry:
+                self.log_info("Retrying failed analysis stages", title=title, stages=len(retry))
+                retried = await asyncio.gather(
+                    *(stages[index](abstract, title) for index in retry),
+                    return_exceptions=True
+                )
+                for index, result in zip(retry, retried):
+                    results[index] = result
+
+            # Only cache real model output; offline or partially failed analyses
+            # (including replies without parseable JSON) should be recomputed
+            # on the next request
+            cacheable = not self.fallback_mode and not any(
+                isinstance(result, Exception) for result in results
+            )
+
             # Unpack results (code detection is optional last item)
             if authors and arxiv_id:
-                technical, context, practical, basic, code_info = results
+                code_info = results.pop()
             else:
-                technical, context, practical, basic = results
-                code_info = {"hasCode": False, "officialRepo": None, "communityRepos": [], "totalRepos": 0}
-            
+                code_info = dict(_NO_CODE_INFO, communityRepos=[])
+
+            if isinstance(code_info, Exception):
+                self.log_warning("Code detection failed, using fallback", error=str(code_info))
+                code_info = dict(_NO_CODE_INFO, communityRepos=[])
+
+            if combined:
+                analysis = results[0]
+                if isinstance(analysis, Exception):
+                    self.log_warning("Combined analysis failed, using fallback", error=str(analysis))
+                    analysis = dict(_FAILED_COMBINED_ANALYSIS)
+
+                comprehensive_analysis = {**analysis, "codeAvailability": code_info}
+                if cacheable:
+                    await cache_service.cache_analysis(title, abstract, comprehensive_analysis, "full", arxiv_id)
+                self.log_info("Comprehensive analysis completed successfully", title=title)
+                return comprehensive_analysis
+
+            technical, context, practical, basic = results
+
             # Handle any stage failures with fallback data
             if isinstance(technical, Exception):
                 self.log_warning("Technical analysis stage failed, using fallback", error=str(technical))
-                technical = {"keyContribution": "Analysis unavailable", "methodologyBreakdown": "Analysis failed", "performanceHighlights": "Results unavailable", "implementationInsights": "Implementation details unclear"}
+                technical = dict(_FAILED_TECHNICAL_ANALYSIS)
             
             if isinstance(context, Exception):
                 self.log_warning("Research context stage failed, using fallback", error=str(context))
-                context = {"researchContext": "Context unavailable", "futureImplications": "Implications unclear", "limitations": "Limitations not identified", "researchSignificance": "incremental"}
+                context = dict(_FAILED_RESEARCH_CONTEXT)
             
             if isinstance(practical, Exception):
                 self.log_warning("Practical assessment stage failed, using fallback", error=str(practical))
-                practical = {"impactScore": 5, "difficultyLevel": "intermediate", "readingTime": 10, "hasCode": False, "implementationComplexity": "medium", "practicalApplicability": "medium", "reproductionDifficulty": "medium"}
+                practical = dict(_FAILED_PRACTICAL_ASSESSMENT)
             
             if isinstance(basic, Exception):
                 self.log_warning("Basic summary stage failed, using fallback", error=str(basic))
-                basic = {"summary": "Summary unavailable", "novelty": "Novelty assessment unavailable", "technicalInnovation": "Technical innovation unclear"}
-
-            if isinstance(code_info, Exception):
-                self.log_warning("Code detection failed, using fallback", error=str(code_info))
-                code_info = {"hasCode": False, "officialRepo": None, "communityRepos": [], "totalRepos": 0}
+                basic = dict(_FAILED_BASIC_SUMMARY)
 
             # Combine all analyses
             comprehensive_analysis = {
@@ -342,7 +675,8 @@ class AIAnalysisService(LoggerMixin):
             }
             
             # Cache the successful result
-            cache_service.cache_analysis(title, abstract, comprehensive_analysis, "full")
+            if cacheable:
+                await cache_service.cache_analysis(title, abstract, comprehensive_analysis, "full", arxiv_id)
             self.log_info("Comprehensive analysis completed successfully", title=title)
             
             return comprehensive_analysis
@@ -352,68 +686,82 @@ class AIAnalysisService(LoggerMixin):
             raise AIAnalysisException(f"Comprehensive analysis failed: {str(e)}", error_code="COMPREHENSIVE_ANALYSIS_ERROR")
     
     async def batch_generate_summaries(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate summaries for multiple papers in batches"""
+        """
+        Generate summaries for multiple papers, at most a batch of requests at a time.
+
+        With combined analysis enabled, papers are grouped GEMINI_PAPERS_PER_REQUEST
+        to a model request; otherwise each paper gets its own analysis.
+        Requests run in a sliding window of GEMINI_RATE_LIMIT_BATCH_SIZE slots
+        rather than fixed batches, so one slow request no longer holds back
+        the rest of its batch. Each slot is handed back GEMINI_RATE_LIMIT_DELAY
+        seconds after its request finishes, which keeps the same request rate
+        as sleeping between batches.
+        """
         batch_size = settings.GEMINI_RATE_LIMIT_BATCH_SIZE
         delay = settings.GEMINI_RATE_LIMIT_DELAY
         
-        self.log_info(f"Starting batch analysis for {len(papers)} papers", batch_size=batch_size)
-        
-        results = []
-        
-        for i in range(0, len(papers), batch_size):
-            batch = papers[i:i + batch_size]
-            self.log_info(f"Processing batch {i//batch_size + 1}", batch_papers=len(batch))
-            
-            # Process batch in parallel
-            batch_tasks = []
-            for paper in batch:
-                task = self.generate_comprehensive_analysis(
+        self.log_info("Starting batch analysis for %d papers", len(papers), batch_size=batch_size)
+
+        if settings.GEMINI_COMBINED_ANALYSIS:
+            group_size = settings.GEMINI_PAPERS_PER_REQUEST
+            analyze_group = self._analyze_paper_group
+        else:
+            group_size = 1
+
+            async def analyze_group(group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                paper = group[0]
+                return [await self.generate_comprehensive_analysis(
                     abstract=paper.get('summary', ''),
                     title=paper.get('title', ''),
                     authors=paper.get('authors', []),
                     arxiv_id=paper.get('id', '')
-                )
-                batch_tasks.append(task)
-            
-            # Execute batch with exception handling
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            # Add results to papers
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.log_warning(f"Paper analysis failed in batch", paper_title=papers[i + j].get('title', 'Unknown'), error=str(result))
-                    result = {
-                        "summary": "Analysis failed",
-                        "novelty": "Unable to assess",
-                        "technicalInnovation": "Technical details unavailable",
-                        "keyContribution": "Analysis error",
-                        "methodologyBreakdown": "Method unclear",
-                        "performanceHighlights": "Results unavailable",
-                        "implementationInsights": "Implementation details unclear",
-                        "researchContext": "Context unavailable",
-                        "futureImplications": "Implications unclear",
-                        "limitations": "Limitations not identified",
-                        "researchSignificance": "incremental",
-                        "impactScore": 5,
-                        "difficultyLevel": "intermediate",
-                        "readingTime": 10,
-                        "hasCode": False,
-                        "implementationComplexity": "medium",
-                        "practicalApplicability": "medium",
-                        "reproductionDifficulty": "medium"
-                    }
-                
-                papers[i + j]['aiSummary'] = result
-                results.append(papers[i + j])
-            
-            # Rate limiting delay between batches
-            if i + batch_size < len(papers):
-                self.log_info(f"Rate limiting delay: {delay}s")
-                await asyncio.sleep(delay)
+                )]
+
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(batch_size)
+
+        async def analyze(group: List[Dict[str, Any]]) -> None:
+            await slots.acquire()
+            try:
+                results = await analyze_group(group)
+            except Exception as e:
+                for paper in group:
+                    self.log_warning("Paper analysis failed in batch", paper_title=paper.get('title', 'Unknown'), error=str(e))
+                results = [dict(_FAILED_PAPER_ANALYSIS) for _ in group]
+            finally:
+                # Rate limiting: free the slot only after the delay
+                loop.call_later(delay, slots.release)
+
+            for paper, result in zip(group, results):
+                paper['aiSummary'] = result
+
+        await asyncio.gather(*(
+            analyze(papers[start:start + group_size])
+            for start in range(0, len(papers), group_size)
+        ))
         
-        self.log_info(f"Batch analysis completed successfully", total_papers=len(results))
-        return results
+        self.log_info("Batch analysis completed successfully", total_papers=len(papers))
+        return list(papers)
+
+
+# Module-level singleton with lazy initialization
+_ai_analysis_service: Optional[AIAnalysisService] = None
+
+
+def get_ai_analysis_service() -> AIAnalysisService:
+    """Get the AI analysis service singleton (configures Gemini on first use)."""
+    global _ai_analysis_service
+    if _ai_analysis_service is None:
+        _ai_analysis_service = AIAnalysisService()
+    return _ai_analysis_service
+
+
+# Backwards compatibility - lazy proxy
+class _LazyAIAnalysisService:
+    """Lazy proxy for backwards compatibility with 'ai_analysis_service' import."""
+
+    def __getattr__(self, name):
+        return getattr(get_ai_analysis_service(), name)
 
 
-# Global AI analysis service instance
-ai_analysis_service = AIAnalysisService()
+ai_analysis_service = _LazyAIAnalysisService()
@@ -1,14 +1,170 @@
 """
 arXiv API service for fetching research papers
 """
-import feedparser
 import asyncio
-from typing import List, Dict, Any
+import time
+from xml.parsers import expat
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence
 from datetime import datetime
 from urllib.parse import quote_plus
+
+import httpx
+
 from app.core.config import settings
 from app.utils.logger import LoggerMixin
 from app.utils.exceptions import ArxivAPIException
+from app.services.cache_service import cache_service
+
+
+# expat reports namespaced names as "<namespace> <local name>"
+_ATOM = "http://www.w3.org/2005/Atom "
+_ATOM_ENTRY = f"{_ATOM}entry"
+_ATOM_LINK = f"{_ATOM}link"
+_ATOM_CATEGORY = f"{_ATOM}category"
+
+# Atom elements inside an entry whose text is collected, and the field it fills
+_ATOM_TEXT_FIELDS = {
+    f"{_ATOM}id": "id",
+    f"{_ATOM}title": "title",
+    f"{_ATOM}summary": "summary",
+    f"{_ATOM}published": "published",
+    f"{_ATOM}name": "author",
+}
+
+# Read size when streaming feed bodies into the parser
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# In-flight page requests when a bounded search is fetched concurrently;
+# kept low to stay polite to the arXiv API
+ARXIV_PAGE_CONCURRENCY = 3
+
+# Statuses arXiv returns when throttling; retried with exponential backoff
+_RETRYABLE_STATUS = {429, 503}
+ARXIV_RETRY_MAX_DELAY = 60.0
+
+
+def category_query(categories: Sequence[str]) -> str:
+    """
+    Build a query matching papers listed in any of ``categories``.
+
+    The disjunction is parenthesized so it can be ANDed with other terms;
+    without parentheses ``A AND cat:x OR cat:y`` parses as ``(A AND cat:x) OR cat:y``.
+    """
+    return "(" + " OR ".join(f"cat:{category}" for category in categories) + ")"
+
+
+def _entry_to_paper(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Convert the fields collected for one Atom entry into a paper dict (None if undated)."""
+    try:
+        # arXiv stamps are always UTC "YYYY-MM-DDTHH:MM:SSZ"; dropping the Z keeps
+        # the naive datetimes callers compare against, and fromisoformat is
+        # far cheaper than strptime
+        published = datetime.fromisoformat(entry.get("published", "").removesuffix("Z"))
+    except ValueError:
+        return None
+
+    return {
+        "id": entry.get("id", "").split("/")[-1],
+        "title": entry.get("title", ""),
+        "authors": entry["authors"],
+        "summary": entry.get("summary", ""),
+        "published": published,
+        "link": entry["link"],
+        "category": entry["category"] or "Unknown",
+    }
+
+
+class _AtomFeedParser:
+    """
+    Incremental expat parser for arXiv's Atom feeds.
+
+    arXiv's entry schema is fixed, so rather than building an element tree
+    this keeps only the fields of the entry being read and emits a paper
+    dict on each ``</entry>``. Completed papers accumulate in ``papers``.
+    """
+
+    def __init__(self) -> None:
+        self.papers: List[Dict[str, Any]] = []
+        self._entry: Optional[Dict[str, Any]] = None
+        self._field: Optional[str] = None
+        self._text: List[str] = []
+
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._characters
+        self._parser = parser
+
+    def feed(self, chunk: bytes) -> None:
+        self._parser.Parse(chunk, False)
+
+    def close(self) -> None:
+        self._parser.Parse(b"", True)
+
+    def _start(self, name: str, attrs: Dict[str, str]) -> None:
+        entry = self._entry
+        if entry is None:
+            if name == _ATOM_ENTRY:
+                self._entry = {"authors": [], "link": None, "category": None}
+            return
+
+        field = _ATOM_TEXT_FIELDS.get(name)
+        if field is not None:
+            self._field = field
+            self._text = []
+        elif name == _ATOM_LINK:
+            if entry["link"] is None and attrs.get("rel", "alternate") == "alternate":
+                entry["link"] = attrs.get("href")
+        elif name == _ATOM_CATEGORY:
+            if entry["category"] is None:
+                entry["category"] = attrs.get("term")
+
+    def _characters(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+
+    def _end(self, name: str) -> None:
+        entry = self._entry
+        if entry is None:
+            return
+
+        if self._field is not None and _ATOM_TEXT_FIELDS.get(name) == self._field:
+            text = "".join(self._text).strip()
+            if self._field == "author":
+                entry["authors"].append(text)
+            else:
+                entry[self._field] = text
+            self._field = None
+        elif name == _ATOM_ENTRY:
+            self._entry = None
+            paper = _entry_to_paper(entry)
+            if paper is not None:
+                self.papers.append(paper)
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing ``rate`` requests per ``period`` seconds on average,
+    with bursts of up to ``burst`` requests (default 1, i.e. strictly spaced).
+
+    Callers reserve a token before sleeping, so concurrent requests queue up
+    behind each other without a lock tied to one event loop.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0, burst: int = 1) -> None:
+        self.capacity = float(burst)
+        self.interval = period / rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.interval)
 
 
 class ArxivService(LoggerMixin):
@@ -17,66 +173,152 @@ class ArxivService(LoggerMixin):
     def __init__(self):
         self.base_url = settings.ARXIV_API_BASE_URL
         self.max_results = settings.ARXIV_MAX_RESULTS
+        self._client: Optional[httpx.AsyncClient] = None
+        self._rate_limiter = _RateLimiter(settings.ARXIV_REQUESTS_PER_MINUTE)
         self.log_info("arXiv service initialized")
-    
-    async def search_papers(self, query: str, max_results: int | None = None) -> List[Dict[str, Any]]:
-        """Search for papers on arXiv, supporting pagination for large result sets."""
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_papers(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch an arXiv API URL, paced by the shared rate limiter.
+
+        Throttling responses (429/503) are retried up to ARXIV_MAX_RETRIES
+        times with exponential backoff before the error is raised.
+        """
+        for attempt in range(settings.ARXIV_MAX_RETRIES + 1):
+            await self._rate_limiter.acquire()
+            try:
+                return await self._fetch_feed(url)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status not in _RETRYABLE_STATUS or attempt == settings.ARXIV_MAX_RETRIES:
+                    raise
+                delay = min(ARXIV_RETRY_MAX_DELAY, 2.0 ** attempt)
+                self.log_warning("arXiv throttled request, retrying", status=status, delay=delay)
+                await asyncio.sleep(delay)
+
+    async def _fetch_feed(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch an arXiv API URL and parse the feed into papers.
+
+        The response body is fed to an incremental parser chunk by chunk, so
+        parsing overlaps the download and only one chunk plus the current
+        entry is held in memory. Parsing runs off the event loop so other
+        page fetches keep making progress meanwhile.
+        """
+        parser = _AtomFeedParser()
+        async with self._get_client().stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                await asyncio.to_thread(parser.feed, chunk)
+        await asyncio.to_thread(parser.close)
+        return parser.papers
+
+    def _search_url(self, encoded_query: str, start: int, size: int) -> str:
+        """Build a date-sorted search URL for one result page."""
+        return (
+            f"{self.base_url}?search_query={encoded_query}&start={start}"
+            f"&max_results={size}&sortBy=submittedDate&sortOrder=descending"
+        )
+
+    async def _fetch_pages_concurrently(
+        self, encoded_query: str, target_total: int, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a bounded search at once, ARXIV_PAGE_CONCURRENCY at
+        a time, and stitch them back together in order.
+        """
+        semaphore = asyncio.Semaphore(ARXIV_PAGE_CONCURRENCY)
+        pages = [
+            (start, min(batch_size, target_total - start))
+            for start in range(0, target_total, batch_size)
+        ]
+
+        async def fetch_page(start: int, size: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_papers(self._search_url(encoded_query, start, size))
+
+        results = await asyncio.gather(*(fetch_page(start, size) for start, size in pages))
+
+        collected: List[Dict[str, Any]] = []
+        for (start, size), entries in zip(pages, results):
+            collected.extend(entries)
+            if len(entries) < size:
+                # No more results beyond this page
+                break
+        return collected
+
+    async def iter_search_pages(
+        self, query: str, max_results: int | None = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield a search's results one page at a time, newest first.
+
+        Pages are fetched only as the caller asks for them, so large result
+        sets can be processed as they arrive without holding them all.
+        """
         target_total = max_results if (max_results and max_results > 0) else None
         batch_size = self.max_results
         encoded_query = quote_plus(query)
-
-        collected: List[Dict[str, Any]] = []
         start = 0
 
-        self.log_info("Searching arXiv papers", query=query, max_results=target_total)
+        while target_total is None or start < target_total:
+            current_batch = batch_size if target_total is None else min(batch_size, target_total - start)
 
-        try:
-            while True:
-                if target_total is not None and len(collected) >= target_total:
-                    break
+            entries = await self._fetch_papers(self._search_url(encoded_query, start, current_batch))
 
-                remaining = None if target_total is None else target_total - len(collected)
-                current_batch = batch_size if remaining is None else min(batch_size, remaining)
+            if not entries:
+                if start == 0:
+                    self.log_warning("No papers found for query", query=query)
+                return
 
-                search_url = (
-                    f"{self.base_url}?search_query={encoded_query}&start={start}"
-                    f"&max_results={current_batch}&sortBy=submittedDate&sortOrder=descending"
-                )
+            self.log_debug(
+                "Fetched arXiv batch",
+                query=query,
+                batch_size=len(entries),
+                start=start,
+            )
+            yield entries
 
-                feed = await asyncio.to_thread(feedparser.parse, search_url)
-                entries = feed.entries or []
+            if len(entries) < current_batch:
+                # No more results beyond this point
+                return
 
-                if not entries:
-                    if start == 0:
-                        self.log_warning("No papers found for query", query=query)
-                    break
+            start += current_batch
 
-                for entry in entries:
-                    collected.append(
-                        {
-                            "id": entry.id.split("/")[-1],
-                            "title": entry.title,
-                            "authors": [author.name for author in entry.authors],
-                            "summary": entry.summary,
-                            "published": datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ"),
-                            "link": entry.link,
-                            "category": entry.tags[0].term if entry.tags else "Unknown",
-                        }
-                    )
+    async def search_papers(self, query: str, max_results: int | None = None) -> List[Dict[str, Any]]:
+        """Search for papers on arXiv, supporting pagination for large result sets."""
+        target_total = max_results if (max_results and max_results > 0) else None
+        batch_size = self.max_results
+        encoded_query = quote_plus(query)
 
-                self.log_debug(
-                    "Fetched arXiv batch",
-                    query=query,
-                    batch_size=len(entries),
-                    start=start,
-                    collected=len(collected),
-                )
+        collected: List[Dict[str, Any]] = []
 
-                if len(entries) < current_batch:
-                    # No more results beyond this point
-                    break
+        self.log_info("Searching arXiv papers", query=query, max_results=target_total)
 
-                start += current_batch
+        try:
+            if target_total is not None and target_total > batch_size:
+                # Page count is known up front, so fetch the pages concurrently
+                collected = await self._fetch_pages_concurrently(encoded_query, target_total, batch_size)
+                if not collected:
+                    self.log_warning("No papers found for query", query=query)
+            else:
+                async for entries in self.iter_search_pages(query, target_total):
+                    collected.extend(entries)
 
             self.log_info("Successfully retrieved papers", found_papers=len(collected), query=query)
             return collected
@@ -128,10 +370,17 @@ class ArxivService(LoggerMixin):
         2. Papers become older than since_date
 
         This ensures we get ALL papers from since_date forward without
-        missing any due to arbitrary limits.
+        missing any due to arbitrary limits. The cutoff is also sent as a
+        submittedDate range, so arXiv only returns papers inside it rather
+        than a final page that is mostly discarded.
         """
         target_total = max_results if (max_results and max_results > 0) else 10000  # Higher default
         batch_size = self.max_results
+        if since_date:
+            query = (
+                f"({query}) AND submittedDate:["
+                f"{since_date:%Y%m%d%H%M} TO {datetime.utcnow():%Y%m%d%H%M}]"
+            )
         encoded_query = quote_plus(query)
 
         collected: List[Dict[str, Any]] = []
@@ -152,13 +401,7 @@ class ArxivService(LoggerMixin):
                 remaining = target_total - len(collected)
                 current_batch = min(batch_size, remaining)
 
-                search_url = (
-                    f"{self.base_url}?search_query={encoded_query}&start={start}"
-                    f"&max_results={current_batch}&sortBy=submittedDate&sortOrder=descending"
-                )
-
-                feed = await asyncio.to_thread(feedparser.parse, search_url)
-                entries = feed.entries or []
+                entries = await self._fetch_papers(self._search_url(encoded_query, start, current_batch))
 
                 if not entries:
                     if start == 0:
@@ -166,10 +409,7 @@ class ArxivService(LoggerMixin):
                     break
 
                 for entry in entries:
-                    try:
-                        published = datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ")
-                    except (ValueError, AttributeError):
-                        continue
+                    published = entry["published"]
 
                     # Check date cutoff
                     if since_date and published < since_date:
@@ -182,15 +422,7 @@ class ArxivService(LoggerMixin):
                         )
                         break
 
-                    collected.append({
-                        "id": entry.id.split("/")[-1],
-                        "title": entry.title,
-                        "authors": [author.name for author in entry.authors],
-                        "summary": entry.summary,
-                        "published": published,
-                        "link": entry.link,
-                        "category": entry.tags[0].term if entry.tags else "Unknown",
-                    })
+                    collected.append(entry)
 
                 self.log_debug(
                     "Fetched arXiv batch",
@@ -204,8 +436,6 @@ class ArxivService(LoggerMixin):
                     break
 
                 start += current_batch
-                # Rate limiting
-                await asyncio.sleep(0.5)
 
             self.log_info("Completed date-based search", found_papers=len(collected), query=query)
             return collected
@@ -216,24 +446,21 @@ class ArxivService(LoggerMixin):
     
     async def get_paper_by_id(self, arxiv_id: str) -> Dict[str, Any]:
         """Get a specific paper by arXiv ID"""
+        cached = await cache_service.get_cached_paper(arxiv_id)
+        if cached is not None:
+            self.log_debug("Paper cache hit", arxiv_id=arxiv_id)
+            return cached
+
         search_url = f"{self.base_url}?id_list={arxiv_id}"
         
         self.log_info("Fetching paper by ID", arxiv_id=arxiv_id)
         
         try:
-            feed = await asyncio.to_thread(feedparser.parse, search_url)
+            entries = await self._fetch_papers(search_url)
             
-            if feed.entries:
-                entry = feed.entries[0]
-                paper = {
-                    'id': entry.id.split('/')[-1],
-                    'title': entry.title,
-                    'authors': [author.name for author in entry.authors],
-                    'summary': entry.summary,
-                    'published': datetime.strptime(entry.published, '%Y-%m-%dT%H:%M:%SZ'),
-                    'link': entry.link,
-                    'category': entry.tags[0].term if entry.tags else 'Unknown'
-                }
+            if entries:
+                paper = entries[0]
+                await cache_service.cache_paper(arxiv_id, paper)
                 self.log_info("Successfully retrieved paper", arxiv_id=arxiv_id, title=paper['title'])
                 return paper
             
@@ -31,13 +31,12 @@ REQUESTS_PER_MINUTE = 1500  # Gemini rate limit for Flash Lite
 DELAY_BETWEEN_BATCHES = 2.0  # Seconds between batches
 
 
-# GitHub/GitLab URL extraction patterns
-CODE_URL_PATTERNS = [
-    r'github\.com/[\w\-\.]+/[\w\-\.]+',
-    r'gitlab\.com/[\w\-\.]+/[\w\-\.]+',
-    r'huggingface\.co/[\w\-\.]+/[\w\-\.]+',
-    r'bitbucket\.org/[\w\-\.]+/[\w\-\.]+',
-]
+# Code hosts recognised in abstracts, in the order their URLs are returned,
+# each with its compiled URL pattern
+CODE_URL_PATTERNS = {
+    host: re.compile(re.escape(host) + r'/[\w\-\.]+/[\w\-\.]+', re.IGNORECASE)
+    for host in ("github.com", "gitlab.com", "huggingface.co", "bitbucket.org")
+}
 
 
 # Analysis prompt template
@@ -158,11 +157,15 @@ class BatchEnrichmentService(LoggerMixin):
         self.log_info("Stop requested, will finish current batch")
 
     def extract_code_urls(self, text: str) -> List[str]:
-        """Extract code repository URLs from text."""
-        urls = []
-        for pattern in CODE_URL_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+        """Extract code repository URLs from text, grouped by host."""
+        # A cheap substring check decides which hosts need a regex scan at
+        # all; most abstracts mention none
+        lowered = text.lower()
+        urls: List[str] = []
+        for host, pattern in CODE_URL_PATTERNS.items():
+            if host not in lowered:
+                continue
+            for match in pattern.findall(text):
                 url = f"https://{match}"
                 if url not in urls:
                     urls.append(url)
@@ -3,19 +3,87 @@ Caching service for paper analysis with Redis and in-memory fallback
 """
 import json
 import hashlib
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from datetime import datetime, timedelta
 from app.core.config import settings
 from app.utils.logger import LoggerMixin
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional compression
+    zstandard = None
+
+# Payloads at least this large are zstd-compressed when zstandard is installed
+_COMPRESS_MIN_BYTES = 1024
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a cache payload (orjson when installed, datetimes as ISO-8601).
+
+    Large payloads such as generated code are zstd-compressed when zstandard
+    is installed; _loads recognises them by the zstd frame magic.
+    """
+    if orjson is not None:
+        data = orjson.dumps(value)
+    else:
+        data = json.dumps(value, default=_json_default).encode()
+    if _compressor is not None and len(data) >= _COMPRESS_MIN_BYTES:
+        return _compressor.compress(data)
+    return data
+
+
+def _loads(data: bytes | str) -> Any:
+    """Deserialize a cache payload"""
+    if isinstance(data, bytes) and data[:4] == _ZSTD_MAGIC:
+        data = _decompressor.decompress(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Redis set of paper IDs already written by ingestion, shared across runs
+INGESTED_IDS_KEY = "ingested_paper_ids"
+
+# Bump when analysis prompts or output fields change so stale entries are skipped
+ANALYSIS_CACHE_VERSION = 2
+# Same for the agent pipeline's generated code results
+QUICK_START_CACHE_VERSION = 2
+
+
+def _word_set(text: str) -> set[str]:
+    return set(text.lower().split())
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
 
 class InMemoryCache:
-    """Simple in-memory cache fallback when Redis is unavailable"""
+    """Simple in-memory cache fallback when Redis is unavailable (mirrors the async Redis API)"""
 
     def __init__(self):
-        self._cache: Dict[str, tuple[str, datetime]] = {}
+        self._cache: Dict[str, tuple[bytes, datetime]] = {}
+        self._sets: Dict[str, set] = {}
+        self._set_expiry: Dict[str, datetime] = {}
 
-    def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[bytes]:
         """Get value from cache if not expired"""
         if key in self._cache:
             value, expiry = self._cache[key]
@@ -26,23 +94,48 @@ class InMemoryCache:
                 del self._cache[key]
         return None
 
-    def setex(self, key: str, ttl: int, value: str) -> None:
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
         """Set value with expiration"""
         expiry = datetime.now() + timedelta(seconds=ttl)
         self._cache[key] = (value, expiry)
 
-    def delete(self, key: str) -> int:
-        """Delete key from cache"""
-        if key in self._cache:
-            del self._cache[key]
-            return 1
-        return 0
+    async def delete(self, *keys: str) -> int:
+        """Delete keys from cache"""
+        deleted = 0
+        for key in keys:
+            if key in self._cache:
+                del self._cache[key]
+                deleted += 1
+        return deleted
 
-    def keys(self, pattern: str) -> list:
+    async def keys(self, pattern: str) -> list:
         """Get keys matching pattern (simple prefix match)"""
         prefix = pattern.replace("*", "")
         return [k for k in self._cache.keys() if k.startswith(prefix)]
 
+    def _live_set(self, key: str) -> set:
+        expiry = self._set_expiry.get(key)
+        if expiry is not None and datetime.now() >= expiry:
+            self._sets.pop(key, None)
+            del self._set_expiry[key]
+        return self._sets.setdefault(key, set())
+
+    async def sadd(self, key: str, *members: str) -> int:
+        """Add members to a set"""
+        members_set = self._live_set(key)
+        before = len(members_set)
+        members_set.update(members)
+        return len(members_set) - before
+
+    async def smismember(self, key: str, *members: str) -> list:
+        """Check membership of several members at once"""
+        members_set = self._live_set(key)
+        return [int(member in members_set) for member in members]
+
+    async def expire(self, key: str, ttl: int) -> None:
+        """Set a set's expiration"""
+        self._set_expiry[key] = datetime.now() + timedelta(seconds=ttl)
+
 
 class CacheService(LoggerMixin):
     """Service for handling caching operations with Redis or in-memory fallback"""
@@ -51,12 +144,22 @@ class CacheService(LoggerMixin):
         self.redis_client = None
         self.use_redis = False
 
-        # Try to connect to Redis
+    async def _get_client(self):
+        """
+        Get the cache backend, connecting on first use.
+
+        Uses the asyncio Redis client so cache round trips never block the
+        event loop; falls back to an in-memory cache if Redis is unavailable.
+        """
+        if self.redis_client is not None:
+            return self.redis_client
+
         try:
-            import redis
-            self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            import redis.asyncio as aioredis
+            client = aioredis.from_url(settings.REDIS_URL, decode_responses=False)
             # Test connection
-            self.redis_client.ping()
+            await client.ping()
+            self.redis_client = client
             self.use_redis = True
             self.log_info("Cache service initialized with Redis")
         except ImportError:
@@ -65,21 +168,38 @@ class CacheService(LoggerMixin):
         except Exception as e:
             self.log_warning("Redis unavailable, using in-memory cache", error=str(e))
             self.redis_client = InMemoryCache()
+        return self.redis_client
+
+    async def warmup(self) -> None:
+        """Connect (and ping) at startup so the first request does not pay for it"""
+        await self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool, if one was opened"""
+        if self.use_redis:
+            await self.redis_client.aclose()
+        self.redis_client = None
+        self.use_redis = False
     
-    def _generate_cache_key(self, title: str, abstract: str, analysis_type: str = "full") -> str:
+    def _generate_cache_key(
+        self, title: str, abstract: str, analysis_type: str = "full", arxiv_id: Optional[str] = None
+    ) -> str:
         """Generate a unique cache key for paper analysis"""
-        content = f"{title}:{abstract}:{analysis_type}"
-        return f"paper_analysis:{hashlib.md5(content.encode()).hexdigest()}"
+        content = f"{ANALYSIS_CACHE_VERSION}:{arxiv_id or ''}:{title}:{abstract}:{analysis_type}"
+        return f"paper_analysis:{hashlib.sha256(content.encode()).hexdigest()}"
     
-    def get_cached_analysis(self, title: str, abstract: str, analysis_type: str = "full") -> Optional[Dict[str, Any]]:
+    async def get_cached_analysis(
+        self, title: str, abstract: str, analysis_type: str = "full", arxiv_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Retrieve cached analysis if available"""
         try:
-            cache_key = self._generate_cache_key(title, abstract, analysis_type)
-            cached_data = self.redis_client.get(cache_key)
+            cache_key = self._generate_cache_key(title, abstract, analysis_type, arxiv_id)
+            client = await self._get_client()
+            cached_data = await client.get(cache_key)
             
             if cached_data:
                 self.log_debug("Cache hit", cache_key=cache_key)
-                return json.loads(cached_data)
+                return _loads(cached_data)
             else:
                 self.log_debug("Cache miss", cache_key=cache_key)
                 return None
@@ -87,24 +207,228 @@ class CacheService(LoggerMixin):
             self.log_error("Cache retrieval failed", error=e, analysis_type=analysis_type)
             return None
     
-    def cache_analysis(self, title: str, abstract: str, analysis: Dict[str, Any], analysis_type: str = "full") -> None:
+    async def cache_analysis(
+        self,
+        title: str,
+        abstract: str,
+        analysis: Dict[str, Any],
+        analysis_type: str = "full",
+        arxiv_id: Optional[str] = None
+    ) -> None:
         """Cache analysis results with TTL"""
         try:
-            cache_key = self._generate_cache_key(title, abstract, analysis_type)
-            self.redis_client.setex(
+            cache_key = self._generate_cache_key(title, abstract, analysis_type, arxiv_id)
+            client = await self._get_client()
+            await client.setex(
                 cache_key, 
-                settings.REDIS_CACHE_TTL, 
-                json.dumps(analysis)
+                settings.ANALYSIS_CACHE_TTL, 
+                _dumps(analysis)
             )
-            self.log_debug("Analysis cached successfully", cache_key=cache_key, ttl=settings.REDIS_CACHE_TTL)
+            self.log_debug("Analysis cached successfully", cache_key=cache_key, ttl=settings.ANALYSIS_CACHE_TTL)
+
+            if arxiv_id:
+                # Remember the latest analysis per paper so other versions can reuse it
+                await client.setex(
+                    self._similar_cache_key(arxiv_id, analysis_type),
+                    settings.ANALYSIS_CACHE_TTL,
+                    _dumps({"title": title, "abstract": abstract, "analysis": analysis})
+                )
         except Exception as e:
             self.log_error("Cache storage failed", error=e, analysis_type=analysis_type)
+
+    def _similar_cache_key(self, arxiv_id: str, analysis_type: str) -> str:
+        base_id = arxiv_id.split("v")[0]
+        return f"paper_analysis:{ANALYSIS_CACHE_VERSION}:{analysis_type}:latest:{base_id}"
+
+    async def get_similar_cached_analysis(
+        self, title: str, abstract: str, arxiv_id: str, analysis_type: str = "full"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the cached analysis of another version of the same arXiv paper.
+
+        Revisions usually change a few words of the abstract, which misses the
+        exact cache. The stored analysis is reused when the title and abstract
+        word sets overlap by at least ANALYSIS_SIMILARITY_THRESHOLD.
+        """
+        try:
+            client = await self._get_client()
+            cached_data = await client.get(self._similar_cache_key(arxiv_id, analysis_type))
+            if not cached_data:
+                return None
+
+            cached = _loads(cached_data)
+            similarity = _jaccard(
+                _word_set(f"{title} {abstract}"),
+                _word_set(f"{cached['title']} {cached['abstract']}")
+            )
+            if similarity < settings.ANALYSIS_SIMILARITY_THRESHOLD:
+                self.log_debug("Similar cache miss", arxiv_id=arxiv_id, similarity=round(similarity, 3))
+                return None
+
+            self.log_debug("Similar cache hit", arxiv_id=arxiv_id, similarity=round(similarity, 3))
+            return cached["analysis"]
+        except Exception as e:
+            self.log_error("Similar cache retrieval failed", error=e, arxiv_id=arxiv_id)
+            return None
     
-    def invalidate_cache(self, title: str, abstract: str, analysis_type: str = "full") -> None:
+    def _quick_start_key(self, paper_id: str) -> str:
+        base_id = paper_id.split("v")[0]
+        return f"quick_start:{QUICK_START_CACHE_VERSION}:{base_id}"
+
+    async def get_cached_quick_start(
+        self, paper_id: str, title: str, abstract: str
+    ) -> Optional[str]:
+        """
+        Retrieve a cached code generation result for this paper.
+
+        Results are keyed by version-less arXiv ID and reused when the title
+        and abstract word sets overlap by at least ANALYSIS_SIMILARITY_THRESHOLD,
+        so a revised or resubmitted paper does not rerun the agent pipeline.
+        The result is returned as the JSON string it was stored as, ready for
+        model_validate_json.
+        """
+        try:
+            client = await self._get_client()
+            cached_data = await client.get(self._quick_start_key(paper_id))
+            if not cached_data:
+                return None
+
+            cached = _loads(cached_data)
+            similarity = _jaccard(
+                _word_set(f"{title} {abstract}"),
+                _word_set(f"{cached['title']} {cached['abstract']}")
+            )
+            if similarity < settings.ANALYSIS_SIMILARITY_THRESHOLD:
+                self.log_debug("Quick start cache miss", paper_id=paper_id, similarity=round(similarity, 3))
+                return None
+
+            self.log_debug("Quick start cache hit", paper_id=paper_id, similarity=round(similarity, 3))
+            return cached["result"]
+        except Exception as e:
+            self.log_error("Quick start cache retrieval failed", error=e, paper_id=paper_id)
+            return None
+
+    async def cache_quick_start(
+        self, paper_id: str, title: str, abstract: str, result: str
+    ) -> None:
+        """Cache a code generation result (serialized with model_dump_json) with TTL"""
+        try:
+            client = await self._get_client()
+            await client.setex(
+                self._quick_start_key(paper_id),
+                settings.ANALYSIS_CACHE_TTL,
+                _dumps({"title": title, "abstract": abstract, "result": result})
+            )
+        except Exception as e:
+            self.log_error("Quick start cache storage failed", error=e, paper_id=paper_id)
+
+    def _completion_key(
+        self, provider: str, model: str, system_prompt: str, prompt: str, max_tokens: int
+    ) -> str:
+        # Plain canonical JSON, not _dumps: keys must not depend on the
+        # installed extras or on payload compression
+        content = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "system": system_prompt,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return f"llm_completion:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    async def get_cached_completion(
+        self, provider: str, model: str, system_prompt: str, prompt: str, max_tokens: int
+    ) -> Optional[str]:
+        """Retrieve a cached deterministic LLM completion if available"""
+        try:
+            client = await self._get_client()
+            cached_data = await client.get(
+                self._completion_key(provider, model, system_prompt, prompt, max_tokens)
+            )
+            if not cached_data:
+                return None
+            return _loads(cached_data)["text"]
+        except Exception as e:
+            self.log_error("Completion cache retrieval failed", error=e, model=model)
+            return None
+
+    async def cache_completion(
+        self, provider: str, model: str, system_prompt: str, prompt: str, max_tokens: int, text: str
+    ) -> None:
+        """Cache a deterministic LLM completion with TTL"""
+        try:
+            client = await self._get_client()
+            await client.setex(
+                self._completion_key(provider, model, system_prompt, prompt, max_tokens),
+                settings.LLM_COMPLETION_CACHE_TTL,
+                _dumps({"text": text})
+            )
+        except Exception as e:
+            self.log_error("Completion cache storage failed", error=e, model=model)
+
+    async def get_cached_paper(self, arxiv_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached arXiv paper metadata if available"""
+        try:
+            client = await self._get_client()
+            cached_data = await client.get(f"arxiv_paper:{arxiv_id}")
+            if not cached_data:
+                return None
+            paper = _loads(cached_data)
+            paper["published"] = datetime.fromisoformat(paper["published"])
+            return paper
+        except Exception as e:
+            self.log_error("Paper cache retrieval failed", error=e, arxiv_id=arxiv_id)
+            return None
+
+    async def cache_paper(self, arxiv_id: str, paper: Dict[str, Any]) -> None:
+        """Cache arXiv paper metadata with TTL"""
+        try:
+            client = await self._get_client()
+            await client.setex(
+                f"arxiv_paper:{arxiv_id}",
+                settings.ARXIV_PAPER_CACHE_TTL,
+                _dumps(paper)
+            )
+        except Exception as e:
+            self.log_error("Paper cache storage failed", error=e, arxiv_id=arxiv_id)
+
+    async def filter_ingested_ids(self, paper_ids: Iterable[str]) -> set[str]:
+        """Return which of the given paper IDs earlier ingestion runs recorded (one round trip)"""
+        paper_ids = list(paper_ids)
+        if not paper_ids:
+            return set()
+        try:
+            client = await self._get_client()
+            flags = await client.smismember(INGESTED_IDS_KEY, *paper_ids)
+            return {paper_id for paper_id, flag in zip(paper_ids, flags) if flag}
+        except Exception as e:
+            self.log_error("Ingested ID lookup failed", error=e, count=len(paper_ids))
+            return set()
+
+    async def record_ingested_ids(self, paper_ids: Iterable[str]) -> None:
+        """Record paper IDs as ingested, refreshing the set's TTL"""
+        paper_ids = list(paper_ids)
+        if not paper_ids:
+            return
+        try:
+            client = await self._get_client()
+            await client.sadd(INGESTED_IDS_KEY, *paper_ids)
+            await client.expire(INGESTED_IDS_KEY, settings.INGESTED_IDS_TTL)
+        except Exception as e:
+            self.log_error("Ingested ID recording failed", error=e, count=len(paper_ids))
+
+    async def invalidate_cache(
+        self, title: str, abstract: str, analysis_type: str = "full", arxiv_id: Optional[str] = None
+    ) -> None:
         """Invalidate cached analysis"""
         try:
-            cache_key = self._generate_cache_key(title, abstract, analysis_type)
-            result = self.redis_client.delete(cache_key)
+            cache_key = self._generate_cache_key(title, abstract, analysis_type, arxiv_id)
+            client = await self._get_client()
+            result = await client.delete(cache_key)
             if result:
                 self.log_debug("Cache invalidated successfully", cache_key=cache_key)
             else:
@@ -112,16 +436,14 @@ class CacheService(LoggerMixin):
         except Exception as e:
             self.log_error("Cache invalidation failed", error=e, analysis_type=analysis_type)
     
-    def clear_all_cache(self) -> None:
+    async def clear_all_cache(self) -> None:
         """Clear all cached analysis data"""
         try:
             pattern = "paper_analysis:*"
-            keys = self.redis_client.keys(pattern)
+            client = await self._get_client()
+            keys = await client.keys(pattern)
             if keys:
-                if self.use_redis:
-                    deleted_count = self.redis_client.delete(*keys)
-                else:
-                    deleted_count = sum(self.redis_client.delete(key) for key in keys)
+                deleted_count = await client.delete(*keys)
                 self.log_info(f"Cleared {deleted_count} cached analyses")
             else:
                 self.log_info("No cached analyses to clear")
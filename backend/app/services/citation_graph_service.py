@@ -312,12 +312,7 @@ class CitationGraphService(LoggerMixin):
 
     def _get_paper_index(self, paper_id: str) -> Optional[int]:
         """Get the index of a paper in the atlas records."""
-        base_id = self._normalize_id(paper_id)
-        for idx, record_id in enumerate(self._atlas._record_ids):
-            record_base = self._normalize_id(record_id) if record_id else None
-            if record_base == base_id:
-                return idx
-        return None
+        return self._atlas.get_record_index(paper_id)
 
 
 # Module-level singleton
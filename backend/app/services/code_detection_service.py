@@ -94,13 +94,33 @@ class CodeDetectionService(LoggerMixin):
 
     # Common GitHub URL patterns
     GITHUB_PATTERNS = [
-        r'github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)',
-        r'https?://(?:www\.)?github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)',
+        re.compile(r'github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)', re.IGNORECASE),
+        re.compile(r'https?://(?:www\.)?github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_.-]+)', re.IGNORECASE),
     ]
 
+    # Title cleanup for GitHub search queries
+    TITLE_STOPWORDS_PATTERN = re.compile(r'\b(via|using|for|with|and|the|of|in|on)\b', re.IGNORECASE)
+    TITLE_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s]')
+
     def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
         self.log_info("Code Detection Service initialized")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled GitHub API client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def detect_code_from_paper(
         self,
         title: str,
@@ -148,7 +168,7 @@ class CodeDetectionService(LoggerMixin):
         """Extract GitHub repository URLs from text"""
         links = []
         for pattern in self.GITHUB_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 user, repo = match.groups()
                 url = f"https://github.com/{user}/{repo}"
@@ -188,10 +208,10 @@ class CodeDetectionService(LoggerMixin):
     def _clean_title_for_search(self, title: str) -> str:
         """Clean paper title for GitHub search"""
         # Remove common paper words
-        title = re.sub(r'\b(via|using|for|with|and|the|of|in|on)\b', '', title, flags=re.IGNORECASE)
+        title = self.TITLE_STOPWORDS_PATTERN.sub('', title)
         # Remove special characters
-        title = re.sub(r'[^\w\s]', '', title)
-        # Remove extra spaces
+        title = self.TITLE_SPECIAL_CHARS_PATTERN.sub('', title)
+        # Remove extra spaces (split/join is faster than a \s+ substitution)
         title = ' '.join(title.split())
         return title.strip()
 
@@ -223,23 +243,22 @@ class CodeDetectionService(LoggerMixin):
             headers["Authorization"] = f"token {github_token}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
-
-                for item in data.get("items", []):
-                    repo = CodeRepository(
-                        url=item["html_url"],
-                        stars=item["stargazers_count"],
-                        forks=item["forks_count"],
-                        last_updated=datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")),
-                        description=item.get("description", ""),
-                        language=item.get("language", "Unknown")
-                    )
-                    repos.append(repo)
-
-                self.log_debug(f"GitHub API returned {len(repos)} repos for '{query}'")
+            response = await self._get_client().get(url, params=params, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+
+            for item in data.get("items", []):
+                repo = CodeRepository(
+                    url=item["html_url"],
+                    stars=item["stargazers_count"],
+                    forks=item["forks_count"],
+                    last_updated=datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")),
+                    description=item.get("description", ""),
+                    language=item.get("language", "Unknown")
+                )
+                repos.append(repo)
+
+            self.log_debug(f"GitHub API returned {len(repos)} repos for '{query}'")
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
@@ -287,15 +306,17 @@ class CodeDetectionService(LoggerMixin):
         if not repos:
             return None
 
+        # Name parts worth matching (first or last name), split once for all repos
+        author_parts = [
+            part for author in authors for part in author.lower().split() if len(part) > 3
+        ]
+
         # Check if any repo owner matches author
         for repo in repos:
             owner = repo.url.split("/")[3].lower()
-            for author in authors:
-                # Simple name matching (first or last name)
-                author_parts = author.lower().split()
-                if any(part in owner for part in author_parts if len(part) > 3):
-                    repo.is_official = True
-                    return repo
+            if any(part in owner for part in author_parts):
+                repo.is_official = True
+                return repo
 
         # If no author match, return highest quality repo
         return max(repos, key=lambda r: r.quality_score)
@@ -9,19 +9,41 @@ Extracts concepts from papers and populates the knowledge graph:
 import asyncio
 import json
 from typing import List, Dict, Any, Optional
-import google.generativeai as genai
 
 from app.db.database import database
-from app.core.config import settings
+from app.services.gemini_model import get_gemini_model
 from app.utils.logger import LoggerMixin
 
 
+# Common AI/ML concepts to look for in the keyword-matching fallback
+SIMPLE_CONCEPT_KEYWORDS = {
+    "transformer": "architecture",
+    "attention": "technique",
+    "bert": "architecture",
+    "gpt": "architecture",
+    "neural network": "architecture",
+    "deep learning": "technique",
+    "machine learning": "technique",
+    "reinforcement learning": "technique",
+    "supervised learning": "technique",
+    "unsupervised learning": "technique",
+    "classification": "task",
+    "regression": "task",
+    "generation": "task",
+    "translation": "task",
+    "imagenet": "dataset",
+    "coco": "dataset",
+    "accuracy": "metric",
+    "f1 score": "metric",
+}
+MAX_SIMPLE_CONCEPTS = 5
+
+
 class ConceptExtractionService(LoggerMixin):
     """Service for extracting concepts from research papers"""
 
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+        self.model = get_gemini_model()
         self.log_info("Concept extraction service initialized")
 
     async def extract_concepts_for_paper(
@@ -140,40 +162,21 @@ Return ONLY the JSON array, no other text.
 
         Returns basic concepts if AI extraction fails
         """
-        # Common AI/ML concepts to look for
-        concept_keywords = {
-            "transformer": "architecture",
-            "attention": "technique",
-            "bert": "architecture",
-            "gpt": "architecture",
-            "neural network": "architecture",
-            "deep learning": "technique",
-            "machine learning": "technique",
-            "reinforcement learning": "technique",
-            "supervised learning": "technique",
-            "unsupervised learning": "technique",
-            "classification": "task",
-            "regression": "task",
-            "generation": "task",
-            "translation": "task",
-            "imagenet": "dataset",
-            "coco": "dataset",
-            "accuracy": "metric",
-            "f1 score": "metric"
-        }
-
         text_lower = (title + " " + abstract).lower()
         concepts = []
 
-        for keyword, category in concept_keywords.items():
+        for keyword, category in SIMPLE_CONCEPT_KEYWORDS.items():
             if keyword in text_lower:
                 concepts.append({
                     "name": keyword.title(),
                     "category": category,
                     "relevance": 0.6  # Medium relevance for keyword matches
                 })
+                if len(concepts) == MAX_SIMPLE_CONCEPTS:
+                    # Only the first matches are returned; skip the rest of the scan
+                    break
 
-        return concepts[:5]  # Return top 5 matches
+        return concepts
 
     async def _store_concepts(
         self,
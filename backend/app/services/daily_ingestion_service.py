@@ -27,10 +27,19 @@ import numpy as np
 
 from app.core.config import settings
 from app.utils.logger import LoggerMixin
-from app.services.arxiv_service import arxiv_service
+from app.services.arxiv_service import arxiv_service, category_query
 from app.db.database import database
 
 
+# Papers per INSERT statement, and batches in flight at once during
+# ingestion (stays below the database pool size)
+INSERT_BATCH_SIZE = 500
+INSERT_CONCURRENCY = 10
+
+# Paper IDs per deduplication lookup query
+DEDUP_CHUNK_SIZE = 1000
+
+
 class DailyIngestionService(LoggerMixin):
     """
     Service for daily paper ingestion from arXiv.
@@ -64,21 +73,33 @@ class DailyIngestionService(LoggerMixin):
     def last_stats(self) -> Dict:
         return self._last_stats
 
-    async def _load_existing_ids_from_db(self) -> Set[str]:
-        """Load existing paper IDs from PostgreSQL for deduplication."""
+    async def _find_existing_ids(self, base_ids: List[str]) -> Set[str]:
+        """
+        Return which of the given (version-less) paper IDs are already stored.
+
+        Only the candidate IDs are looked up, in chunks of DEDUP_CHUNK_SIZE,
+        instead of pulling every ID in the papers table. The predicate matches
+        the papers_base_id_idx expression index (see init_db), so each chunk
+        is an index lookup rather than a table scan. Each chunk is bound
+        as one JSON array so the statement text never changes and its
+        prepared statement is reused from the connection's cache.
+        """
         existing_ids: Set[str] = set()
+        query = """
+            SELECT split_part(id, 'v', 1) AS base_id
+            FROM papers
+            WHERE split_part(id, 'v', 1) IN (
+                SELECT jsonb_array_elements_text(CAST(:ids AS jsonb))
+            )
+        """
 
         try:
-            query = "SELECT id FROM papers"
-            rows = await database.fetch_all(query)
+            for i in range(0, len(base_ids), DEDUP_CHUNK_SIZE):
+                chunk = base_ids[i:i + DEDUP_CHUNK_SIZE]
+                rows = await database.fetch_all(query, {"ids": json.dumps(chunk)})
+                existing_ids.update(row["base_id"] for row in rows)
 
-            for row in rows:
-                paper_id = row["id"]
-                # Normalize ID (remove version suffix)
-                base_id = paper_id.split("v")[0] if "v" in paper_id else paper_id
-                existing_ids.add(base_id)
-
-            self.log_info(f"Loaded {len(existing_ids)} existing paper IDs from PostgreSQL")
+            self.log_info(f"Found {len(existing_ids)} of {len(base_ids)} fetched papers already in PostgreSQL")
             return existing_ids
 
         except Exception as e:
@@ -132,7 +153,7 @@ class DailyIngestionService(LoggerMixin):
         }
 
     def _format_paper_for_database(self, paper: Dict) -> Dict:
-        """Format arXiv paper data for PostgreSQL insertion."""
+        """Format arXiv paper data as a record for the batched PostgreSQL insert."""
         published = paper.get("published")
         if isinstance(published, str):
             try:
@@ -142,27 +163,65 @@ class DailyIngestionService(LoggerMixin):
                     published = datetime.strptime(published, '%Y-%m-%d')
             except (ValueError, TypeError):
                 published = datetime.utcnow()
+        if not isinstance(published, datetime):
+            published = datetime.utcnow()
 
         authors = paper.get("authors", [])
         if isinstance(authors, str):
             authors = [authors]
 
+        # JSON-ready record; expanded server-side by jsonb_to_recordset
         return {
             "id": paper.get("id", ""),
             "title": paper.get("title", "").replace("\n", " ").strip(),
             "abstract": paper.get("summary", "").replace("\n", " ").strip(),
-            "authors": json.dumps(authors),
-            "published_date": published,
+            "authors": authors,
+            "published_date": published.isoformat(),
             "category": paper.get("category", "cs.AI"),
-            "citation_count": 0,
-            "influential_citation_count": 0,
-            "quality_score": 0.0,
         }
 
-    async def _insert_to_database(self, papers: List[Dict], batch_size: int = 100) -> int:
+    async def _insert_batch(self, papers: List[Dict], semaphore: asyncio.Semaphore) -> int:
+        """
+        Insert (or refresh) a batch of papers in a single statement.
+
+        The batch is sent as one JSON array and expanded server-side, so
+        each batch costs one round trip and is applied atomically.
+        """
+        payload = json.dumps([self._format_paper_for_database(paper) for paper in papers])
+
+        # Use INSERT ... ON CONFLICT to handle duplicates gracefully
+        query = """
+            INSERT INTO papers (
+                id, title, abstract, authors, published_date, category,
+                citation_count, influential_citation_count, quality_score
+            )
+            SELECT
+                p.id, p.title, p.abstract, p.authors, p.published_date, p.category,
+                0, 0, 0.0
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS p(
+                id text, title text, abstract text, authors jsonb,
+                published_date timestamp, category text
+            )
+            ON CONFLICT (id) DO UPDATE SET
+                title = EXCLUDED.title,
+                abstract = EXCLUDED.abstract,
+                authors = EXCLUDED.authors,
+                updated_at = NOW()
+            RETURNING id
+        """
+
+        async with semaphore:
+            rows = await database.fetch_all(query, {"payload": payload})
+        return len(rows)
+
+    async def _insert_to_database(self, papers: List[Dict]) -> int:
         """
         Insert new papers directly to PostgreSQL.
 
+        Papers are written INSERT_BATCH_SIZE at a time, one statement per
+        batch, with at most INSERT_CONCURRENCY batches in flight so the
+        connection pool is not exhausted.
+
         This triggers the auto-creation of:
         1. paper_processing_state (via trigger_paper_processing_state)
         2. enrichment jobs (via trigger_auto_create_enrichment_jobs)
@@ -173,44 +232,29 @@ class DailyIngestionService(LoggerMixin):
         if not papers:
             return 0
 
-        inserted = 0
+        batches = [
+            papers[i:i + INSERT_BATCH_SIZE]
+            for i in range(0, len(papers), INSERT_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(INSERT_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._insert_batch(batch, semaphore) for batch in batches),
+            return_exceptions=True,
+        )
 
-        # Process in batches
-        for i in range(0, len(papers), batch_size):
-            batch = papers[i:i + batch_size]
+        inserted = 0
+        failed = 0
+        for batch_num, (batch, result) in enumerate(zip(batches, results), start=1):
+            if isinstance(result, Exception):
+                failed += len(batch)
+                self.log_error(f"Failed to insert batch {batch_num}", error=result)
+            else:
+                inserted += result
 
-            try:
-                for paper in batch:
-                    formatted = self._format_paper_for_database(paper)
-
-                    # Use INSERT ... ON CONFLICT to handle duplicates gracefully
-                    query = """
-                        INSERT INTO papers (
-                            id, title, abstract, authors, published_date, category,
-                            citation_count, influential_citation_count, quality_score
-                        ) VALUES (
-                            :id, :title, :abstract, :authors, :published_date, :category,
-                            :citation_count, :influential_citation_count, :quality_score
-                        )
-                        ON CONFLICT (id) DO UPDATE SET
-                            title = EXCLUDED.title,
-                            abstract = EXCLUDED.abstract,
-                            authors = EXCLUDED.authors,
-                            updated_at = NOW()
-                        RETURNING id
-                    """
-
-                    result = await database.fetch_one(query, formatted)
-                    if result:
-                        inserted += 1
-
-                self.log_info(f"Inserted batch {i // batch_size + 1}: {len(batch)} papers")
-
-            except Exception as e:
-                self.log_error(f"Failed to insert batch {i // batch_size + 1}", error=e)
-                continue
-
-        self.log_info(f"Inserted {inserted} papers to PostgreSQL (triggers will auto-create jobs)")
+        self.log_info(
+            f"Inserted {inserted} papers to PostgreSQL (triggers will auto-create jobs)",
+            failed=failed,
+        )
         return inserted
 
     async def _fetch_recent_papers(
@@ -225,15 +269,14 @@ class DailyIngestionService(LoggerMixin):
 
         Args:
             categories: List of arXiv categories
-            max_per_category: Safety limit per category (default 1000)
+            max_per_category: Safety limit per category (default 1000), applied
+                to the combined query as max_per_category * len(categories)
             days_back: Fallback if since_date not provided
             since_date: Absolute date cutoff - preferred over days_back
 
         Returns:
             List of papers from all categories since the cutoff date
         """
-        all_papers: List[Dict] = []
-
         # Determine date cutoff
         if since_date is None:
             since_date = datetime.utcnow() - timedelta(days=days_back)
@@ -244,28 +287,21 @@ class DailyIngestionService(LoggerMixin):
             max_per_category=max_per_category
         )
 
-        for category in categories:
-            try:
-                self.log_info(f"Fetching papers for category: {category}")
-
-                # Use date-based cutoff - fetches ALL papers since that date
-                papers = await arxiv_service.get_recent_papers(
-                    category=category,
-                    max_results=max_per_category,
-                    since_date=since_date
-                )
-
-                all_papers.extend(papers)
-                self.log_info(f"Found {len(papers)} papers in {category} since {since_date.date()}")
-
-                # Rate limiting - be nice to arXiv
-                await asyncio.sleep(1.0)
-
-            except Exception as e:
-                self.log_error(f"Failed to fetch {category}", error=e)
-                continue
+        # One query covers every category, so the date range is paged
+        # through once and cross-listed papers come back a single time
+        try:
+            # Use date-based cutoff - fetches ALL papers since that date
+            papers = await arxiv_service.search_papers_until_date(
+                category_query(categories),
+                max_results=max_per_category * len(categories),
+                since_date=since_date
+            )
+        except Exception as e:
+            self.log_error(f"Failed to fetch {', '.join(categories)}", error=e)
+            return []
 
-        return all_papers
+        self.log_info(f"Found {len(papers)} papers across {len(categories)} categories since {since_date.date()}")
+        return papers
 
     async def run_ingestion(
         self,
@@ -320,9 +356,6 @@ class DailyIngestionService(LoggerMixin):
                 since_date=effective_since.isoformat()
             )
 
-            # Load existing paper IDs from PostgreSQL for deduplication
-            existing_ids = await self._load_existing_ids_from_db()
-
             # Fetch recent papers with date cutoff
             fetched_papers = await self._fetch_recent_papers(
                 categories=categories,
@@ -330,15 +363,21 @@ class DailyIngestionService(LoggerMixin):
                 since_date=effective_since
             )
 
-            # Deduplicate
-            new_papers: List[Dict] = []
+            # Deduplicate within the fetch (papers can be cross-listed)
+            candidates: Dict[str, Dict] = {}
             for paper in fetched_papers:
                 paper_id = paper.get("id", "")
                 base_id = paper_id.split("v")[0] if "v" in paper_id else paper_id
 
-                if base_id and base_id not in existing_ids:
-                    new_papers.append(paper)
-                    existing_ids.add(base_id)  # Prevent duplicates within batch
+                if base_id and base_id not in candidates:
+                    candidates[base_id] = paper
+
+            # Deduplicate against PostgreSQL, looking up only the fetched IDs
+            existing_ids = await self._find_existing_ids(list(candidates))
+            new_papers: List[Dict] = [
+                paper for base_id, paper in candidates.items()
+                if base_id not in existing_ids
+            ]
 
             self.log_info(f"Found {len(new_papers)} new papers after deduplication")
 
@@ -397,20 +436,21 @@ class DailyIngestionService(LoggerMixin):
         # Ensure directory exists
         self._atlas_dir.mkdir(parents=True, exist_ok=True)
 
-        appended = 0
         try:
-            with self._catalog_path.open("a", encoding="utf-8") as f:
-                for paper in papers:
-                    formatted = self._format_paper_for_catalog(paper)
-                    f.write(json.dumps(formatted) + "\n")
-                    appended += 1
-
+            appended = await asyncio.to_thread(self._write_catalog_lines, papers)
             self.log_info(f"Appended {appended} papers to catalog")
             return appended
 
         except Exception as e:
             self.log_error("Failed to append to catalog", error=e)
-            return appended
+            return 0
+
+    def _write_catalog_lines(self, papers: List[Dict]) -> int:
+        """Append formatted papers to the NDJSON catalog (blocking; run it off the event loop)"""
+        lines = [json.dumps(self._format_paper_for_catalog(paper)) + "\n" for paper in papers]
+        with self._catalog_path.open("a", encoding="utf-8") as f:
+            f.writelines(lines)
+        return len(lines)
 
     async def _generate_embeddings_for_new(self, papers: List[Dict]) -> int:
         """
@@ -11,7 +11,6 @@ Uses Gemini Flash to analyze the main content (excluding appendix) including:
 from __future__ import annotations
 
 import asyncio
-import io
 import json
 import os
 import tempfile
@@ -270,25 +269,19 @@ class DeepEnrichmentService(LoggerMixin):
         """
         Truncate PDF to first N pages (skip appendix).
 
-        Returns the truncated PDF as bytes.
+        Returns the truncated PDF as bytes. Objects only referenced by the
+        dropped pages (figures, fonts) are garbage-collected so they are not
+        uploaded either. Blocking; run it off the event loop.
         """
         try:
-            import pypdf
+            import fitz  # PyMuPDF
 
-            reader = pypdf.PdfReader(str(pdf_path))
-            writer = pypdf.PdfWriter()
+            with fitz.open(pdf_path) as doc:
+                if doc.page_count <= max_pages:
+                    return pdf_path.read_bytes()
 
-            # Take first max_pages or all pages if fewer
-            pages_to_include = min(len(reader.pages), max_pages)
-
-            for i in range(pages_to_include):
-                writer.add_page(reader.pages[i])
-
-            # Write to bytes buffer
-            buffer = io.BytesIO()
-            writer.write(buffer)
-            buffer.seek(0)
-            return buffer.read()
+                doc.select(list(range(max_pages)))
+                return doc.tobytes(garbage=3, deflate=True)
 
         except Exception as e:
             self.log_warning(f"PDF truncation failed, using full PDF: {e}")
@@ -304,7 +297,7 @@ class DeepEnrichmentService(LoggerMixin):
 
         try:
             # Truncate PDF to main content
-            pdf_bytes = self._truncate_pdf(pdf_path)
+            pdf_bytes = await asyncio.to_thread(self._truncate_pdf, pdf_path)
 
             # Create a temporary file for the truncated PDF
             with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
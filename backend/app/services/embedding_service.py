@@ -11,12 +11,43 @@ import hashlib
 import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from functools import lru_cache
 import openai
 from sqlalchemy import text
 
 from app.db.database import database
 from app.core.config import settings
 
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional, falls back to a character cut
+    tiktoken = None
+
+
+# Input limit of text-embedding-3-small
+EMBED_MAX_TOKENS = 8191
+# Character cut used when tiktoken is not installed (~2k tokens, safely inside the limit)
+EMBED_MAX_CHARS = 8000
+
+
+@lru_cache(maxsize=1)
+def _embedding_encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_for_embedding(text: str) -> str:
+    """Cut text to the embedding model's input limit, by tokens when tiktoken is available"""
+    if tiktoken is None:
+        return text[:EMBED_MAX_CHARS]
+    # Every token covers at least one character, so short texts need no encoding
+    if len(text) <= EMBED_MAX_TOKENS:
+        return text
+    encoding = _embedding_encoding()
+    tokens = encoding.encode(text)
+    if len(tokens) <= EMBED_MAX_TOKENS:
+        return text
+    return encoding.decode(tokens[:EMBED_MAX_TOKENS])
+
 
 class EmbeddingService:
     """Service for generating and caching embeddings"""
@@ -65,7 +96,7 @@ class EmbeddingService:
             # Generate embedding via OpenAI
             response = await self.client.embeddings.create(
                 model=self.model,
-                input=text[:8000],  # Truncate to token limit
+                input=_truncate_for_embedding(text),
                 encoding_format="float"
             )
 
@@ -132,7 +163,7 @@ class EmbeddingService:
 
             try:
                 # Truncate texts to token limit
-                truncated_texts = [text[:8000] for text in batch_texts]
+                truncated_texts = [_truncate_for_embedding(text) for text in batch_texts]
 
                 response = await self.client.embeddings.create(
                     model=self.model,
@@ -399,23 +430,24 @@ class EmbeddingService:
         Returns:
             Dict with counts and coverage percentage
         """
-        result = await database.fetch_one(
-            text("""
-                SELECT
-                    COUNT(*) as total_papers,
-                    COUNT(embedding) as papers_with_embedding,
-                    ROUND(100.0 * COUNT(embedding) / COUNT(*), 2) as coverage_percentage
-                FROM papers
-            """)
-        )
-
-        concept_result = await database.fetch_one(
-            text("""
-                SELECT
-                    COUNT(*) as total_concepts,
-                    COUNT(embedding) as concepts_with_embedding
-                FROM concepts
-            """)
+        result, concept_result = await asyncio.gather(
+            database.fetch_one(
+                text("""
+                    SELECT
+                        COUNT(*) as total_papers,
+                        COUNT(embedding) as papers_with_embedding,
+                        ROUND(100.0 * COUNT(embedding) / COUNT(*), 2) as coverage_percentage
+                    FROM papers
+                """)
+            ),
+            database.fetch_one(
+                text("""
+                    SELECT
+                        COUNT(*) as total_concepts,
+                        COUNT(embedding) as concepts_with_embedding
+                    FROM concepts
+                """)
+            ),
         )
 
         return {
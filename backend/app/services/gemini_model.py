@@ -0,0 +1,19 @@
+"""
+Shared Gemini model.
+
+The analysis and extraction services all talk to the same configured model,
+so one GenerativeModel is built per process on first use and handed to each
+of them instead of every service configuring and building its own.
+"""
+from functools import lru_cache
+
+import google.generativeai as genai
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_gemini_model() -> genai.GenerativeModel:
+    """Get the process-wide Gemini model (configures the API key on first use)"""
+    genai.configure(api_key=settings.GEMINI_API_KEY)
+    return genai.GenerativeModel(settings.GEMINI_MODEL)
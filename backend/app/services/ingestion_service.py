@@ -10,13 +10,18 @@ Orchestrates the full pipeline:
 import asyncio
 import json
 import os
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
+import httpx
 from sqlalchemy import text
 
 from app.db.database import database
 from app.services.arxiv_service import arxiv_service
+from app.services.cache_service import cache_service
 from app.services.embedding_service import get_embedding_service
 from app.services import get_research_graph_service
 from app.services.providers import (
@@ -25,9 +30,47 @@ from app.services.providers import (
     GitHubRepoProvider,
 )
 from app.services.providers.base import ProviderError
+from app.utils.exceptions import ServiceException
 from app.utils.logger import LoggerMixin
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Papers written per INSERT statement when storing a window. The size starts
+# at STORE_BATCH_SIZE and adapts to insert latency within the min/max bounds:
+# three batches faster than STORE_FAST_SECONDS in a row grow it by half, and a
+# batch slower than STORE_SLOW_SECONDS (or a failed one) halves it
+STORE_BATCH_SIZE = 200
+STORE_BATCH_MIN = 25
+STORE_BATCH_MAX = 1000
+STORE_FAST_SECONDS = 2.0
+STORE_SLOW_SECONDS = 5.0
+
+# Failures that only cost the window or category they hit: upstream API
+# errors, timeouts and dropped connections (OSError covers the last two).
+# Anything else is treated as a bug and cancels the rest of the run
+_TRANSIENT_ERRORS = (ServiceException, ProviderError, httpx.HTTPError, OSError)
+
+# Per-run counters summed across categories and windows
+_INGEST_COUNTS = (
+    "fetched",
+    "stored",
+    "duplicates",
+    "embeddings_generated",
+    "concepts_extracted",
+    "errors",
+)
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Serialize to UTF-8 JSON (orjson when installed), non-ASCII kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
 
 class IngestionService(LoggerMixin):
     """Service for ingesting papers into the knowledge graph"""
@@ -59,6 +102,12 @@ class IngestionService(LoggerMixin):
         else:
             self.local_dump_dir = None
         self.use_local_dump = self.local_dump_dir is not None
+        # IDs known to be in the papers table or local dump (stored or found
+        # as duplicates) during this process, so repeats skip storage entirely
+        self._known_ids: Set[str] = set()
+        # Store batch size, adapted to insert latency by _tune_store_batch_size
+        self._store_batch_size = STORE_BATCH_SIZE
+        self._fast_store_batches = 0
         self.log_info(
             "Ingestion service initialized",
             local_dump=str(self.local_dump_dir) if self.local_dump_dir else None
@@ -77,6 +126,20 @@ class IngestionService(LoggerMixin):
         """Format datetime in arXiv API style: YYYYMMDDHHMM."""
         return dt.strftime("%Y%m%d%H%M")
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _window_query(cls, category: str, start: datetime, end: datetime) -> str:
+        """
+        Build the arXiv search query for one category and submission window.
+
+        Memoized, since the ingestion loop builds each window query for
+        logging and the fetch then builds it again.
+        """
+        return (
+            f"cat:{category} AND submittedDate:["
+            f"{cls._format_arxiv_datetime(start)} TO {cls._format_arxiv_datetime(end)}]"
+        )
+
     def _generate_time_windows(
         self,
         years: int,
@@ -109,26 +172,22 @@ class IngestionService(LoggerMixin):
         start: datetime,
         end: datetime,
     ) -> List[Dict[str, Any]]:
-        query = (
-            f"cat:{category} AND submittedDate:["
-            f"{self._format_arxiv_datetime(start)} TO {self._format_arxiv_datetime(end)}]"
-        )
-
-        papers = await self.arxiv_service.search_papers(query, max_results=None)
+        query = self._window_query(category, start, end)
         threshold = settings.ARXIV_SPLIT_THRESHOLD or 0
         min_days = settings.ARXIV_MIN_SPLIT_DAYS or 0
         delta = end - start
 
-        if (
-            threshold
-            and len(papers) >= threshold
-            and delta.days >= min_days
-        ):
-            mid = start + delta / 2
-            mid = mid.replace(second=0, microsecond=0)
-            if mid <= start or mid >= end:
-                return papers
+        mid = (start + delta / 2).replace(second=0, microsecond=0)
+        splittable = threshold and delta.days >= min_days and start < mid < end
+
+        # A splittable window only needs its first `threshold` results: if it
+        # reaches the threshold both halves are fetched instead, so paging
+        # through the whole window first would download everything twice
+        papers = await self.arxiv_service.search_papers(
+            query, max_results=threshold if splittable else None
+        )
 
+        if splittable and len(papers) >= threshold:
             first_end = mid
             second_start = mid + timedelta(minutes=1)
 
@@ -147,10 +206,11 @@ class IngestionService(LoggerMixin):
         category: str,
         start: datetime,
         end: datetime,
+        papers: List[Dict[str, Any]],
         generate_embeddings: bool,
         extract_concepts: bool,
     ) -> Dict[str, Any]:
-        papers = await self._fetch_papers_for_range(category, start, end)
+        """Store, embed and extract concepts for the papers fetched for one window."""
         stats = {
             "fetched": len(papers),
             "stored": 0,
@@ -161,6 +221,12 @@ class IngestionService(LoggerMixin):
             "dump_path": None,
         }
 
+        # Papers cross-listed in several categories are fetched by a window of
+        # each; only the first one to reach storage keeps them
+        unseen = [paper for paper in papers if paper["id"] not in self._known_ids]
+        stats["duplicates"] = len(papers) - len(unseen)
+        papers = unseen
+
         if not papers:
             return stats
 
@@ -171,16 +237,17 @@ class IngestionService(LoggerMixin):
         }
 
         if self.use_local_dump:
-            dump_path, records = self._dump_to_local(papers, storage_context=storage_context)
+            dump_path, records = await asyncio.to_thread(
+                self._dump_to_local, papers, storage_context
+            )
+            self._known_ids.update(paper["id"] for paper in papers)
             stats["dump_path"] = str(dump_path)
             stats["stored"] = len(records)
         else:
             store_result = await self._store_papers(papers, storage_context=storage_context)
-            stats.update({
-                "stored": store_result["stored"],
-                "duplicates": store_result["duplicates"],
-                "errors": store_result["errors"],
-            })
+            stats["stored"] = store_result["stored"]
+            stats["duplicates"] += store_result["duplicates"]
+            stats["errors"] = store_result["errors"]
             records = store_result["papers"]
 
             if (
@@ -252,22 +319,38 @@ class IngestionService(LoggerMixin):
         }
 
         try:
-            # Step 1: Fetch papers from arXiv
-            if query:
-                papers = await self.arxiv_service.search_papers(query, max_results)
-            elif category:
-                papers = await self.arxiv_service.get_recent_papers(category, max_results)
+            # Steps 1-2: Fetch papers from arXiv and store them in the
+            # database or local dump
+            if query and not self.use_local_dump:
+                # Query results are stored page by page as they arrive, so
+                # only one page of raw results is held at a time
+                stored_papers = {"stored": 0, "duplicates": 0, "errors": 0, "papers": []}
+                async for page in self.arxiv_service.iter_search_pages(query, max_results):
+                    stats["fetched"] += len(page)
+                    page_result = await self._store_papers(page, storage_context=storage_context)
+                    for key in ("stored", "duplicates", "errors"):
+                        stored_papers[key] += page_result[key]
+                    stored_papers["papers"].extend(page_result["papers"])
+
+                self.log_info(f"Fetched {stats['fetched']} papers from arXiv")
+                if not stats["fetched"]:
+                    return stats
             else:
-                raise ValueError("Either query or category must be provided")
+                if query:
+                    papers = await self.arxiv_service.search_papers(query, max_results)
+                elif category:
+                    papers = await self.arxiv_service.get_recent_papers(category, max_results)
+                else:
+                    raise ValueError("Either query or category must be provided")
 
-            stats["fetched"] = len(papers)
-            self.log_info(f"Fetched {len(papers)} papers from arXiv")
+                stats["fetched"] = len(papers)
+                self.log_info(f"Fetched {len(papers)} papers from arXiv")
 
-            if not papers:
-                return stats
+                if not papers:
+                    return stats
+
+                stored_papers = await self._store_papers(papers, storage_context=storage_context)
 
-            # Step 2: Store papers in database or local dump
-            stored_papers = await self._store_papers(papers, storage_context=storage_context)
             stats["stored"] = stored_papers["stored"]
             stats["duplicates"] = stored_papers["duplicates"]
             stats["errors"] = stored_papers["errors"]
@@ -325,6 +408,10 @@ class IngestionService(LoggerMixin):
         """
         Store papers in database, handling duplicates
 
+        New papers are written in batches with one INSERT per batch, sized by
+        observed insert latency; existing rows are detected by the insert itself rather than a
+        lookup per paper.
+
         Returns:
             Dict with stored, duplicates, errors counts
         """
@@ -336,68 +423,138 @@ class IngestionService(LoggerMixin):
         }
 
         if self.use_local_dump and self.local_dump_dir:
-            dump_path, sanitized_records = self._dump_to_local(papers, storage_context)
+            dump_path, sanitized_records = await asyncio.to_thread(
+                self._dump_to_local, papers, storage_context
+            )
             result["stored"] = len(sanitized_records)
             result["papers"] = sanitized_records
             result["dump_path"] = str(dump_path)
             return result
 
+        candidates: Dict[str, Dict[str, Any]] = {}
+        known_ids = self._known_ids
         for paper in papers:
+            # Papers cross-listed in several categories recur across
+            # windows; skip ones already seen without a round trip
+            paper_id = paper["id"]
+            if paper_id in known_ids or paper_id in candidates:
+                result["duplicates"] += 1
+            else:
+                candidates[paper_id] = paper
+
+        # IDs recorded by earlier runs (or other workers) are already stored;
+        # one set lookup replaces sending them through the insert again
+        recorded = await cache_service.filter_ingested_ids(candidates)
+        for paper_id in recorded:
+            del candidates[paper_id]
+        self._known_ids.update(recorded)
+        result["duplicates"] += len(recorded)
+
+        written_ids: List[str] = []
+        batch = list(candidates.values())
+        offset = 0
+        while offset < len(batch):
+            chunk = batch[offset:offset + self._store_batch_size]
+            offset += len(chunk)
+            started = time.monotonic()
             try:
-                # Check if paper already exists
-                existing = await database.fetch_one(
-                    "SELECT id FROM papers WHERE id = :paper_id",
-                    {"paper_id": paper["id"]}
-                )
+                stored_ids = await self._insert_papers(chunk)
+            except Exception as e:
+                self._tune_store_batch_size(None)
+                result["errors"] += len(chunk)
+                self.log_error(f"Failed to store batch of {len(chunk)} papers", error=e)
+                continue
+
+            self._tune_store_batch_size(time.monotonic() - started)
+            written_ids.extend(paper["id"] for paper in chunk)
+            self._known_ids.update(paper["id"] for paper in chunk)
+            result["duplicates"] += len(chunk) - len(stored_ids)
+            for paper in chunk:
+                if paper["id"] in stored_ids:
+                    result["stored"] += 1
+                    result["papers"].append(self._sanitize_paper_record(paper))
+
+        await cache_service.record_ingested_ids(written_ids)
+        self.log_debug(
+            "Stored papers",
+            stored=result["stored"],
+            duplicates=result["duplicates"],
+            errors=result["errors"]
+        )
+        return result
 
-                if existing:
-                    result["duplicates"] += 1
-                    self.log_debug(f"Paper {paper['id']} already exists, skipping")
-                    continue
-
-                # Insert new paper
-                await database.execute(
-                    """
-                        INSERT INTO papers (
-                            id, title, abstract, authors, published_date,
-                            updated_date, category, ingested_at
-                        ) VALUES (
-                            :id, :title, :abstract, :authors, :published_date,
-                            :updated_date, :category, CURRENT_TIMESTAMP
-                        )
-                    """,
-                    {
-                        "id": paper["id"],
-                        "title": paper["title"],
-                        "abstract": paper["summary"],
-                        "authors": paper["authors"],  # Will be stored as JSONB
-                        "published_date": paper["published"],
-                        "updated_date": paper.get("updated", paper["published"]),
-                        "category": paper["category"]
-                    }
-                )
+    def _tune_store_batch_size(self, latency: Optional[float]) -> None:
+        """Adjust the store batch size after an insert that took `latency` seconds (None if it failed)."""
+        size = self._store_batch_size
+        if latency is None or latency > STORE_SLOW_SECONDS:
+            self._store_batch_size = max(STORE_BATCH_MIN, size // 2)
+            self._fast_store_batches = 0
+        elif latency < STORE_FAST_SECONDS:
+            self._fast_store_batches += 1
+            if self._fast_store_batches >= 3:
+                self._store_batch_size = min(STORE_BATCH_MAX, int(size * 1.5))
+                self._fast_store_batches = 0
+        else:
+            self._fast_store_batches = 0
 
-                result["stored"] += 1
-                sanitized = self._sanitize_paper_record(paper)
-                result["papers"].append(sanitized)
-                self.log_debug(f"Stored paper {paper['id']}: {paper['title'][:50]}...")
+        if self._store_batch_size != size:
+            self.log_debug("Store batch size adjusted", size=self._store_batch_size, latency=latency)
 
-            except Exception as e:
-                result["errors"] += 1
-                self.log_error(f"Failed to store paper {paper.get('id', 'unknown')}", error=e)
+    async def _insert_papers(self, papers: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Insert papers not already stored, in a single statement.
 
-        return result
+        The batch is sent as one JSON array and expanded server-side; rows
+        that already exist are left untouched, so the returned IDs are
+        exactly the newly stored papers.
+        """
+        isoformat = self._isoformat
+        payload = _json_bytes([
+            {
+                "id": paper["id"],
+                "title": paper["title"],
+                "abstract": paper["summary"],
+                "authors": paper["authors"],
+                "published_date": isoformat(paper["published"]),
+                "updated_date": isoformat(paper.get("updated", paper["published"])),
+                "category": paper["category"],
+            }
+            for paper in papers
+        ]).decode("utf-8")
+
+        rows = await database.fetch_all(
+            """
+                INSERT INTO papers (
+                    id, title, abstract, authors, published_date,
+                    updated_date, category, ingested_at
+                )
+                SELECT
+                    p.id, p.title, p.abstract, p.authors, p.published_date,
+                    p.updated_date, p.category, CURRENT_TIMESTAMP
+                FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS p(
+                    id text, title text, abstract text, authors jsonb,
+                    published_date timestamp, updated_date timestamp, category text
+                )
+                ON CONFLICT (id) DO NOTHING
+                RETURNING id
+            """,
+            {"payload": payload}
+        )
+        return {row["id"] for row in rows}
+
+    @staticmethod
+    def _isoformat(value: Any) -> Any:
+        return value.isoformat() if isinstance(value, datetime) else value
 
     def _dump_to_local(
         self,
         papers: List[Dict[str, Any]],
         storage_context: Optional[Dict[str, Any]]
     ) -> Tuple[Path, List[Dict[str, Any]]]:
+        """Write one window's papers to an NDJSON dump (blocking; run it off the event loop)"""
         if not self.local_dump_dir:
             raise RuntimeError("Local dump directory not configured")
 
-        sanitized_records = [self._sanitize_paper_record(paper) for paper in papers]
-
         context = storage_context or {}
         category = context.get("category", "uncategorized")
         start_dt = self._ensure_datetime(context.get("window_start"))
@@ -413,21 +570,17 @@ class IngestionService(LoggerMixin):
         file_name = f"papers_{start_label}_{end_label}_{timestamp.strftime('%Y%m%dT%H%M%S')}.ndjson"
         file_path = window_dir / file_name
 
-        start_iso = start_dt.isoformat() if start_dt else None
-        end_iso = end_dt.isoformat() if end_dt else None
-
-        records_with_context: List[Dict[str, Any]] = []
-        with file_path.open("w", encoding="utf-8") as fh:
-            for record in sanitized_records:
-                enriched = record.copy()
-                if start_iso:
-                    enriched["window_start"] = start_iso
-                if end_iso:
-                    enriched["window_end"] = end_iso
-                if "category" not in enriched:
-                    enriched["category"] = category
-                records_with_context.append(enriched)
-                fh.write(json.dumps(enriched, ensure_ascii=False) + "\n")
+        # Window bounds are formatted once and merged into every record
+        window_fields = {}
+        if start_dt:
+            window_fields["window_start"] = start_dt.isoformat()
+        if end_dt:
+            window_fields["window_end"] = end_dt.isoformat()
+
+        sanitize = self._sanitize_paper_record
+        records_with_context = [{**sanitize(paper), **window_fields} for paper in papers]
+        with file_path.open("wb") as fh:
+            fh.writelines(_json_bytes(record) + b"\n" for record in records_with_context)
 
         self.log_info("Dumped papers to local file", path=str(file_path), count=len(papers))
         return file_path, records_with_context
@@ -471,13 +624,29 @@ class IngestionService(LoggerMixin):
 
         self.log_info("Enriching research graph for papers", paper_count=len(paper_ids))
 
-        # Author + organisation enrichment
+        # Author + organisation enrichment: one transaction per paper, with up
+        # to GRAPH_WRITE_CONCURRENCY papers written at once
         try:
             author_payloads = await self.openalex_provider.fetch_authors_and_affiliations(paper_ids)
-            for payload in author_payloads:
-                await self.research_graph_service.upsert_authors(
-                    payload.get("authors", []),
-                    paper_id=payload.get("paper_id")
+            slots = asyncio.Semaphore(settings.GRAPH_WRITE_CONCURRENCY)
+
+            async def store_authors(payload: Dict[str, Any]) -> None:
+                async with slots:
+                    await self.research_graph_service.upsert_authors(
+                        payload.get("authors", []),
+                        paper_id=payload.get("paper_id")
+                    )
+
+            results = await asyncio.gather(
+                *(store_authors(payload) for payload in author_payloads),
+                return_exceptions=True,
+            )
+            failures = [result for result in results if isinstance(result, Exception)]
+            if failures:
+                self.log_warning(
+                    "Author enrichment failed for some papers",
+                    failed=len(failures),
+                    error=str(failures[0])
                 )
         except ProviderError as exc:
             self.log_warning("Author enrichment failed", error=str(exc))
@@ -547,38 +716,36 @@ class IngestionService(LoggerMixin):
         """
         self.log_info(f"Ingesting recent papers from {len(categories)} categories")
 
-        combined_stats = {
-            "fetched": 0,
-            "stored": 0,
-            "duplicates": 0,
-            "embeddings_generated": 0,
-            "errors": 0,
-            "categories_processed": 0
-        }
+        combined_stats = Counter(dict.fromkeys((*_INGEST_COUNTS, "categories_processed"), 0))
 
-        for category in categories:
-            try:
-                self.log_info(f"Processing category: {category}")
-                stats = await self.ingest_by_category(
-                    category=category,
-                    max_results=max_per_category,
-                    generate_embeddings=generate_embeddings
-                )
+        semaphore = asyncio.Semaphore(settings.ARXIV_WINDOW_CONCURRENCY)
 
-                combined_stats["fetched"] += stats["fetched"]
-                combined_stats["stored"] += stats["stored"]
-                combined_stats["duplicates"] += stats["duplicates"]
-                combined_stats["embeddings_generated"] += stats["embeddings_generated"]
-                combined_stats["errors"] += stats["errors"]
-                combined_stats["categories_processed"] += 1
+        async def process_category(category: str) -> Dict[str, Any] | Exception:
+            async with semaphore:
+                self.log_info(f"Processing category: {category}")
+                try:
+                    return await self.ingest_by_category(
+                        category=category,
+                        max_results=max_per_category,
+                        generate_embeddings=generate_embeddings
+                    )
+                except _TRANSIENT_ERRORS as exc:
+                    return exc
 
-                # Rate limiting: small delay between categories
-                await asyncio.sleep(1)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(process_category(category)) for category in categories]
 
-            except Exception as e:
-                self.log_error(f"Failed to process category {category}", error=e)
+        for category, task in zip(categories, tasks):
+            stats = task.result()
+            if isinstance(stats, BaseException):
+                self.log_error(f"Failed to process category {category}", error=stats)
                 combined_stats["errors"] += 1
+                continue
 
+            combined_stats.update({key: stats[key] for key in _INGEST_COUNTS})
+            combined_stats["categories_processed"] += 1
+
+        combined_stats = dict(combined_stats)
         self.log_info("Completed ingesting recent papers", stats=combined_stats)
         return combined_stats
 
@@ -589,8 +756,7 @@ class IngestionService(LoggerMixin):
         window_months: int = 3,
         max_per_window: int = 200,
         generate_embeddings: bool = False,
-        extract_concepts: bool = False,
-        sleep_seconds: float = 0.5
+        extract_concepts: bool = False
     ) -> Dict[str, Any]:
         """
         Seed the research atlas with papers from the last N years (chunked by window).
@@ -623,61 +789,90 @@ class IngestionService(LoggerMixin):
             "local_dump_dir": str(self.local_dump_dir) if self.local_dump_dir else None
         }
 
-        for category in categories:
-            category_stats = {
-                "category": category,
-                "windows_processed": 0,
-                "fetched": 0,
-                "stored": 0,
-                "duplicates": 0,
-                "errors": 0,
-                "dumps": []
-            }
-
-            for start, end in windows:
-                query = (
-                    f"cat:{category} AND submittedDate:["
-                    f"{self._format_arxiv_datetime(start)} TO {self._format_arxiv_datetime(end)}]"
-                )
-
+        category_counts = {
+            category: Counter(dict.fromkeys(("windows_processed", *_INGEST_COUNTS), 0))
+            for category in categories
+        }
+        category_dumps: Dict[str, List[str]] = {category: [] for category in categories}
+        units = [(category, start, end) for category in categories for start, end in windows]
+        results: Dict[Tuple[str, datetime, datetime], Any] = {}
+        fetch_slots = asyncio.Semaphore(settings.ARXIV_WINDOW_CONCURRENCY)
+        store_workers = max(1, settings.INGEST_STORE_CONCURRENCY)
+        # Fetched windows wait here for a store worker, so the next arXiv
+        # fetches overlap the database work instead of queueing behind it;
+        # the bound keeps fetching from running far ahead of storage
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=store_workers)
+
+        async def fetch_window(unit: Tuple[str, datetime, datetime]) -> None:
+            category, start, end = unit
+            async with fetch_slots:
+                # Windows are fetched concurrently; arxiv_service's shared
+                # rate limiter spaces out the actual requests
                 self.log_info(
                     "Processing window",
                     category=category,
                     start=start.isoformat(),
                     end=end.isoformat(),
-                    query=query
+                    query=self._window_query(category, start, end)
                 )
-
                 try:
-                    stats = await self._ingest_window(
-                        category=category,
-                        start=start,
-                        end=end,
+                    papers = await self._fetch_papers_for_range(category, start, end)
+                except _TRANSIENT_ERRORS as exc:
+                    results[unit] = exc
+                    return
+                # Hand off while still holding the slot: a full queue then
+                # stops further fetches until a store worker catches up
+                await fetched.put((unit, papers))
+
+        async def fetch_windows() -> None:
+            async with asyncio.TaskGroup() as producers:
+                for unit in units:
+                    producers.create_task(fetch_window(unit))
+            for _ in range(store_workers):
+                await fetched.put(None)
+
+        async def store_windows() -> None:
+            while (item := await fetched.get()) is not None:
+                unit, papers = item
+                try:
+                    results[unit] = await self._ingest_window(
+                        *unit,
+                        papers=papers,
                         generate_embeddings=generate_embeddings,
                         extract_concepts=extract_concepts,
                     )
+                except _TRANSIENT_ERRORS as exc:
+                    results[unit] = exc
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(fetch_windows())
+            for _ in range(store_workers):
+                tg.create_task(store_windows())
+
+        # Units are in category-then-window order, so dumps stay chronological
+        for category, start, end in units:
+            stats = results[(category, start, end)]
+            counts = category_counts[category]
+            if isinstance(stats, BaseException):
+                self.log_error(
+                    "Failed to process window",
+                    category=category,
+                    start=start.isoformat(),
+                    end=end.isoformat(),
+                    error=str(stats)
+                )
+                counts["errors"] += 1
+                continue
 
-                    category_stats["windows_processed"] += 1
-                    category_stats["fetched"] += stats["fetched"]
-                    category_stats["stored"] += stats["stored"]
-                    category_stats["duplicates"] += stats["duplicates"]
-                    category_stats["errors"] += stats["errors"]
-                    if stats.get("dump_path"):
-                        category_stats["dumps"].append(stats["dump_path"])
-
-                    await asyncio.sleep(sleep_seconds)
-
-                except Exception as exc:  # noqa: BLE001
-                    self.log_error(
-                        "Failed to process window",
-                        category=category,
-                        start=start.isoformat(),
-                        end=end.isoformat(),
-                        error=str(exc)
-                    )
-                    category_stats["errors"] += 1
+            counts.update({key: stats[key] for key in _INGEST_COUNTS})
+            counts["windows_processed"] += 1
+            if stats.get("dump_path"):
+                category_dumps[category].append(stats["dump_path"])
 
-            summary["stats"].append(category_stats)
+        summary["stats"] = [
+            {"category": category, **category_counts[category], "dumps": category_dumps[category]}
+            for category in categories
+        ]
 
         self.log_info("Bootstrap completed", summary=summary)
         return summary
@@ -802,6 +997,7 @@ class IngestionService(LoggerMixin):
         )
 
         return {
+            "store_batch_size": self._store_batch_size,
             "total_papers": total_result["count"],
             "recent_24h": recent_result["count"],
             "by_category": [dict(r) for r in category_result],
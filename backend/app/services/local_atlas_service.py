@@ -12,10 +12,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
-import torch
-import torch.nn.functional as F
 
 from app.core.config import settings
+from app.services.specter2_encoder import get_specter2_encoder
 from app.utils.logger import LoggerMixin
 
 
@@ -37,6 +36,8 @@ class LocalAtlasService(LoggerMixin):
         self._encoder = None
         self._encoder_type: str = "sentence-transformers"
         self._record_ids: List[Optional[str]] = []
+        # Version-less arXiv ID -> record index (first record wins)
+        self._index_by_base_id: Dict[str, int] = {}
         self._active_cache_label: Optional[str] = None
         self._stats: Dict[str, object] = {}
         self._timeline: Dict[str, List[Dict[str, object]]] = {}
@@ -80,6 +81,9 @@ class LocalAtlasService(LoggerMixin):
 
         self._load_summary_files(atlas_path)
         self._record_ids = [record.get("id") for record in self._records]
+        for idx, record_id in enumerate(self._record_ids):
+            if record_id:
+                self._index_by_base_id.setdefault(record_id.split("v")[0], idx)
         documents = [record["_search_text"] for record in self._records]
 
         # Pre-compute word sets for fast keyword matching (optimization)
@@ -107,7 +111,8 @@ class LocalAtlasService(LoggerMixin):
 
             if model_name.startswith("allenai/specter2"):
                 self._encoder_type = "specter2"
-                self._encoder = Specter2Encoder(model_name)
+                self._encoder = get_specter2_encoder(model_name)
+                self._encoder.load()
                 embeddings = (
                     cached_embeddings
                     if cached_embeddings is not None
@@ -525,22 +530,12 @@ class LocalAtlasService(LoggerMixin):
         if not self.enabled or self._embeddings is None:
             return []
 
-        # Normalize paper_id (remove version suffix if present)
-        base_id = paper_id.split("v")[0] if "v" in paper_id else paper_id
-
         # Find the paper's index
-        paper_idx: Optional[int] = None
-        paper_authors: Set[str] = set()
-        for idx, record_id in enumerate(self._record_ids):
-            record_base_id = record_id.split("v")[0] if record_id and "v" in record_id else record_id
-            if record_base_id == base_id:
-                paper_idx = idx
-                paper_authors = set(self._records[idx].get("authors", []))
-                break
-
+        paper_idx = self.get_record_index(paper_id)
         if paper_idx is None:
             self.log_warning("Paper not found for similarity search", paper_id=paper_id)
             return []
+        paper_authors: Set[str] = set(self._records[paper_idx].get("authors", []))
 
         # Get the paper's embedding and compute similarities
         paper_embedding = self._embeddings[paper_idx]
@@ -586,27 +581,29 @@ class LocalAtlasService(LoggerMixin):
 
         return results
 
+    def get_record_index(self, paper_id: str) -> Optional[int]:
+        """Index of a paper in the atlas records, ignoring any version suffix."""
+        return self._index_by_base_id.get(paper_id.split("v")[0])
+
     def get_paper_by_id(self, paper_id: str) -> Optional[Dict]:
         """Get a paper by its ID."""
         if not self.enabled:
             return None
 
-        base_id = paper_id.split("v")[0] if "v" in paper_id else paper_id
+        idx = self.get_record_index(paper_id)
+        if idx is None:
+            return None
 
-        for idx, record_id in enumerate(self._record_ids):
-            record_base_id = record_id.split("v")[0] if record_id and "v" in record_id else record_id
-            if record_base_id == base_id:
-                record = self._records[idx]
-                return {
-                    "id": record.get("id"),
-                    "title": record.get("title"),
-                    "abstract": record.get("abstract"),
-                    "authors": record.get("authors"),
-                    "published": record.get("published"),
-                    "category": record.get("category"),
-                    "link": record.get("link"),
-                }
-        return None
+        record = self._records[idx]
+        return {
+            "id": record.get("id"),
+            "title": record.get("title"),
+            "abstract": record.get("abstract"),
+            "authors": record.get("authors"),
+            "published": record.get("published"),
+            "category": record.get("category"),
+            "link": record.get("link"),
+        }
 
     # ------------------------------------------------------------------ #
     # Lexical utilities
@@ -899,53 +896,6 @@ class LocalAtlasService(LoggerMixin):
         }
 
 
-class Specter2Encoder:
-    """Wrapper for producing SPECTER2 retrieval embeddings."""
-
-    def __init__(self, adapter_name: str) -> None:
-        from adapters import AutoAdapterModel
-        from transformers import AutoTokenizer
-
-        # Use MPS on Apple Silicon, CUDA on NVIDIA, or fall back to CPU
-        if torch.backends.mps.is_available():
-            self.device = torch.device("mps")
-        elif torch.cuda.is_available():
-            self.device = torch.device("cuda")
-        else:
-            self.device = torch.device("cpu")
-
-        base_model_name = "allenai/specter2_base"
-        self.tokenizer = AutoTokenizer.from_pretrained(base_model_name)
-        self.model = AutoAdapterModel.from_pretrained(base_model_name)
-
-        adapter_to_load = adapter_name or "allenai/specter2"
-        loaded_adapter = self.model.load_adapter(adapter_to_load, source="hf")
-        self.model.set_active_adapters(loaded_adapter)
-        self.model.to(self.device)
-        self.model.eval()
-
-    def encode(self, texts: List[str], batch_size: int = 16) -> np.ndarray:
-        embeddings: List[np.ndarray] = []
-        with torch.no_grad():
-            for start in range(0, len(texts), batch_size):
-                batch = texts[start : start + batch_size]
-                tokenized = self.tokenizer(
-                    batch,
-                    padding=True,
-                    truncation=True,
-                    max_length=512,
-                    return_tensors="pt",
-                )
-                tokenized = {k: v.to(self.device) for k, v in tokenized.items()}
-                outputs = self.model(**tokenized)
-                cls_embeddings = outputs.last_hidden_state[:, 0]
-                cls_embeddings = F.normalize(cls_embeddings, p=2, dim=1)
-                embeddings.append(cls_embeddings.cpu().numpy())
-        if not embeddings:
-            return np.zeros((0, self.model.config.hidden_size), dtype=np.float32)
-        return np.vstack(embeddings)
-
-
 # Module-level singleton with lazy initialization
 _local_atlas_service: Optional[LocalAtlasService] = None
 
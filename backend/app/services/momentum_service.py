@@ -45,12 +45,13 @@ class MomentumService:
         180: 8.0,    # 6 months
         365: 15.0,   # 1 year
     }
+    _AGE_BUCKETS = tuple(sorted(AGE_EXPECTED_CITATIONS.items()))
 
-    async def _get_expected_citations(self, days_old: int) -> float:
-        """Get expected citations for a paper of given age."""
+    def _get_expected_citations(self, days_old: int) -> float:
+        """Get expected citations for a paper of given age (pure arithmetic, so not async)."""
         # Linear interpolation between age buckets
         prev_days, prev_expected = 0, 0.0
-        for days, expected in sorted(self.AGE_EXPECTED_CITATIONS.items()):
+        for days, expected in self._AGE_BUCKETS:
             if days_old <= days:
                 if days == prev_days:
                     return expected
@@ -121,7 +122,7 @@ class MomentumService:
         results = []
         for row in rows:
             days_old = row["days_old"] or 1
-            expected = await self._get_expected_citations(days_old)
+            expected = self._get_expected_citations(days_old)
             actual = row["citation_count"] or 0
             performance_ratio = actual / expected if expected > 0 else 0
 
@@ -193,7 +194,7 @@ class MomentumService:
         breakouts = []
         for row in rows:
             days_old = row["days_old"] or 1
-            expected = await self._get_expected_citations(days_old)
+            expected = self._get_expected_citations(days_old)
             actual = row["citation_count"] or 0
             performance_ratio = actual / expected if expected > 0 else 0
 
@@ -314,7 +315,7 @@ class MomentumService:
         days_old = row["days_old"] or 1
         actual = row["citation_count"] or 0
         velocity = actual / days_old
-        expected = await self._get_expected_citations(days_old)
+        expected = self._get_expected_citations(days_old)
         performance_ratio = actual / expected if expected > 0 else 0
 
         # Get velocity percentile by comparing to peers
@@ -8,6 +8,7 @@ Manages the creation and tracking of enrichment jobs:
 - Health monitoring via database views
 """
 
+import asyncio
 import json
 import uuid
 import logging
@@ -356,9 +357,6 @@ class PipelineService:
     async def get_pipeline_health(self) -> Dict[str, Any]:
         """Get pipeline health metrics from the v_pipeline_health view."""
         query = "SELECT metric, value FROM v_pipeline_health"
-        rows = await database.fetch_all(query)
-
-        metrics = {row["metric"]: row["value"] for row in rows}
 
         # Get job queue status
         queue_query = """
@@ -367,7 +365,14 @@ class PipelineService:
             WHERE created_at > NOW() - INTERVAL '24 hours'
             GROUP BY job_type, status
         """
-        queue_rows = await database.fetch_all(queue_query)
+
+        # Independent queries - run them on separate pool connections at once
+        rows, queue_rows = await asyncio.gather(
+            database.fetch_all(query),
+            database.fetch_all(queue_query),
+        )
+
+        metrics = {row["metric"]: row["value"] for row in rows}
 
         job_status = {}
         for row in queue_rows:
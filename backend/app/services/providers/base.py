@@ -3,10 +3,20 @@ Common base utilities for external data providers.
 """
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import Any, Dict
 
+import httpx
+
 from app.utils.logger import LoggerMixin
 
+# HTTP/2 lets concurrent requests to one API share a connection instead of
+# each holding its own; httpx needs the optional h2 package for it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Connection pool shared by the requests a provider client has in flight
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
 
 class ProviderError(RuntimeError):
     """Generic exception for provider failures."""
@@ -19,7 +19,7 @@ from pydantic import BaseModel
 
 from app.schemas.research_graph import TechniqueUpsert
 from app.core.config import settings
-from .base import BaseProvider
+from .base import BaseProvider, HTTP2_AVAILABLE, HTTP_LIMITS
 
 
 class OpenAlexWork(BaseModel):
@@ -76,7 +76,9 @@ class OpenAlexProvider(BaseProvider):
                 base_url=self.BASE_URL,
                 headers={"Accept": "application/json"},
                 params=params,
-                timeout=30.0
+                timeout=30.0,
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
             )
         return self._client
 
@@ -24,7 +24,7 @@ from app.schemas.research_graph import (
     DatasetUpsert,
     TechniqueUpsert,
 )
-from .base import BaseProvider
+from .base import BaseProvider, HTTP2_AVAILABLE, HTTP_LIMITS
 
 
 class PWCPaper(BaseModel):
@@ -85,7 +85,9 @@ class PapersWithCodeProvider(BaseProvider):
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 headers={"Accept": "application/json"},
-                timeout=30.0
+                timeout=30.0,
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_LIMITS,
             )
         return self._client
 
@@ -11,6 +11,8 @@ Implementation will live behind adapters (OpenAlex, PapersWithCode, GitHub, etc.
 """
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import Iterable, Sequence, Dict, Any, List, Optional
 from datetime import datetime
 
@@ -20,6 +22,11 @@ from app.db.database import database
 from app.utils.logger import LoggerMixin
 
 
+# Postgres SQLSTATE for deadlock_detected; the aborted transaction can simply be rerun
+_DEADLOCK_SQLSTATE = "40P01"
+_DEADLOCK_RETRIES = 3
+
+
 class ResearchGraphService(LoggerMixin):
     """
     Coordinates enrichment of the living research graph.
@@ -94,6 +101,9 @@ class ResearchGraphService(LoggerMixin):
     async def upsert_tasks(self, tasks: Sequence[Dict[str, Any]]) -> int:
         """
         Insert or update task definitions (taxonomy-aligned).
+
+        The batch is written in one statement; if a name repeats, its last
+        entry wins.
         """
         if not tasks:
             return 0
@@ -107,12 +117,10 @@ class ResearchGraphService(LoggerMixin):
                 application_domain,
                 description
             )
-            VALUES (
-                :name,
-                :taxonomy_path,
-                :modality,
-                :application_domain,
-                :description
+            SELECT t.name, t.taxonomy_path, t.modality, t.application_domain, t.description
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS t(
+                name text, taxonomy_path text, modality text,
+                application_domain text, description text
             )
             ON CONFLICT (name)
             DO UPDATE SET
@@ -123,8 +131,8 @@ class ResearchGraphService(LoggerMixin):
                 updated_at = CURRENT_TIMESTAMP;
         """)
 
-        for task in tasks:
-            await database.execute(query, task)
+        rows = {task["name"]: task for task in tasks}
+        await database.execute(query, {"payload": json.dumps(list(rows.values()))})
 
         self.log_info("Upserted tasks", count=len(tasks))
         return len(tasks)
@@ -190,15 +198,18 @@ class ResearchGraphService(LoggerMixin):
         Attach techniques/tasks/datasets to a paper.
 
         techniques payload: [{"technique_id": 1, "role": "core", "confidence": 0.9}, ...]
+
+        All links for the paper are written in one transaction.
         """
         await self._ensure_connection()
 
-        if techniques:
-            await self._link_paper_techniques(paper_id, techniques)
-        if tasks:
-            await self._link_paper_tasks(paper_id, tasks)
-        if datasets:
-            await self._link_paper_datasets(paper_id, datasets)
+        async with database.transaction():
+            if techniques:
+                await self._link_paper_techniques(paper_id, techniques)
+            if tasks:
+                await self._link_paper_tasks(paper_id, tasks)
+            if datasets:
+                await self._link_paper_datasets(paper_id, datasets)
 
     async def upsert_authors(
         self,
@@ -207,11 +218,41 @@ class ResearchGraphService(LoggerMixin):
     ) -> List[int]:
         """
         Upsert authors and optionally connect them to a paper.
+
+        Authors are upserted one by one (each needs its returned ID); the
+        paper links are then written in a single statement. Everything runs
+        in one transaction, so a paper's authors commit once.
+
+        Papers are written concurrently during ingestion and share
+        co-authors, so authors are upserted in ORCID order to take row locks
+        in the same order everywhere; a deadlock that still occurs reruns
+        the transaction. Returned IDs follow that order.
         """
         if not authors:
             return []
 
         await self._ensure_connection()
+        ordered = sorted(authors, key=lambda author: (author.get("orcid") is None, author.get("orcid") or ""))
+
+        for attempt in range(1, _DEADLOCK_RETRIES + 1):
+            try:
+                author_ids = await self._write_authors(ordered, paper_id)
+                break
+            except Exception as exc:
+                if getattr(exc, "sqlstate", None) != _DEADLOCK_SQLSTATE or attempt == _DEADLOCK_RETRIES:
+                    raise
+                self.log_warning("Deadlock upserting authors, retrying", paper_id=paper_id, attempt=attempt)
+                await asyncio.sleep(0.1 * attempt)
+
+        self.log_info("Upserted authors", count=len(author_ids))
+        return author_ids
+
+    async def _write_authors(
+        self,
+        authors: Sequence[Dict[str, Any]],
+        paper_id: Optional[str]
+    ) -> List[int]:
+        """Upsert authors and their paper links in one transaction"""
         author_ids: List[int] = []
 
         insert_author = text("""
@@ -249,28 +290,32 @@ class ResearchGraphService(LoggerMixin):
                 author_order,
                 is_corresponding
             )
-            VALUES (:paper_id, :author_id, :author_order, :is_corresponding)
+            SELECT a.paper_id, a.author_id, a.author_order, a.is_corresponding
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS a(
+                paper_id text, author_id integer, author_order integer, is_corresponding boolean
+            )
             ON CONFLICT (paper_id, author_id) DO NOTHING;
         """)
 
-        for author in authors:
-            author_id = await database.fetch_val(insert_author, author)
-            if author_id is None:
-                continue
+        links: List[Dict[str, Any]] = []
+        async with database.transaction():
+            for author in authors:
+                author_id = await database.fetch_val(insert_author, author)
+                if author_id is None:
+                    continue
 
-            author_ids.append(author_id)
-            if paper_id:
-                await database.execute(
-                    link_author,
-                    {
+                author_ids.append(author_id)
+                if paper_id:
+                    links.append({
                         "paper_id": paper_id,
                         "author_id": author_id,
                         "author_order": author.get("author_order"),
                         "is_corresponding": author.get("is_corresponding", False),
-                    }
-                )
+                    })
+
+            if links:
+                await database.execute(link_author, {"payload": json.dumps(links)})
 
-        self.log_info("Upserted authors", count=len(author_ids))
         return author_ids
 
     async def attach_benchmark_results(
@@ -281,7 +326,7 @@ class ResearchGraphService(LoggerMixin):
         sota_paper_id: Optional[str] = None
     ) -> None:
         """
-        Link a technique to one or more benchmark rows.
+        Link a technique to one or more benchmark rows (one statement).
         """
         if not benchmark_ids:
             return
@@ -294,7 +339,11 @@ class ResearchGraphService(LoggerMixin):
                 delta_from_sota,
                 sota_paper_id
             )
-            VALUES (:technique_id, :benchmark_id, :delta_from_sota, :sota_paper_id)
+            SELECT b.technique_id, b.benchmark_id, b.delta_from_sota, b.sota_paper_id
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS b(
+                technique_id integer, benchmark_id integer,
+                delta_from_sota double precision, sota_paper_id text
+            )
             ON CONFLICT (technique_id, benchmark_id)
             DO UPDATE SET
                 delta_from_sota = COALESCE(EXCLUDED.delta_from_sota, technique_benchmarks.delta_from_sota),
@@ -302,16 +351,16 @@ class ResearchGraphService(LoggerMixin):
                 created_at = technique_benchmarks.created_at;
         """)
 
-        for benchmark_id in benchmark_ids:
-            await database.execute(
-                query,
-                {
-                    "technique_id": technique_id,
-                    "benchmark_id": benchmark_id,
-                    "delta_from_sota": delta_from_sota,
-                    "sota_paper_id": sota_paper_id,
-                }
-            )
+        rows = [
+            {
+                "technique_id": technique_id,
+                "benchmark_id": benchmark_id,
+                "delta_from_sota": delta_from_sota,
+                "sota_paper_id": sota_paper_id,
+            }
+            for benchmark_id in dict.fromkeys(benchmark_ids)
+        ]
+        await database.execute(query, {"payload": json.dumps(rows)})
 
         self.log_debug(
             "Linked technique to benchmarks",
@@ -332,6 +381,9 @@ class ResearchGraphService(LoggerMixin):
             "weight": 0.8,
             "first_seen_paper_id": "2010.12345"
         }
+
+        All pairs are written in one statement; if a pair repeats (in either
+        order), its last entry wins.
         """
         if not relationships:
             return
@@ -345,12 +397,15 @@ class ResearchGraphService(LoggerMixin):
                 weight,
                 first_seen_paper_id
             )
-            VALUES (
-                LEAST(:technique_a_id, :technique_b_id),
-                GREATEST(:technique_a_id, :technique_b_id),
-                :relation_type,
-                :weight,
-                :first_seen_paper_id
+            SELECT
+                LEAST(r.technique_a_id, r.technique_b_id),
+                GREATEST(r.technique_a_id, r.technique_b_id),
+                r.relation_type,
+                r.weight,
+                r.first_seen_paper_id
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS r(
+                technique_a_id integer, technique_b_id integer, relation_type text,
+                weight double precision, first_seen_paper_id text
             )
             ON CONFLICT (technique_a_id, technique_b_id)
             DO UPDATE SET
@@ -360,8 +415,11 @@ class ResearchGraphService(LoggerMixin):
                 created_at = technique_relationships.created_at;
         """)
 
-        for rel in relationships:
-            await database.execute(query, rel)
+        rows = {
+            frozenset((rel["technique_a_id"], rel["technique_b_id"])): rel
+            for rel in relationships
+        }
+        await database.execute(query, {"payload": json.dumps(list(rows.values()))})
 
         self.log_info("Recorded technique relationships", count=len(relationships))
 
@@ -391,13 +449,10 @@ class ResearchGraphService(LoggerMixin):
                 evidence_source,
                 notes
             )
-            VALUES (
-                :paper_id,
-                :technique_id,
-                :role,
-                :confidence,
-                :evidence_source,
-                :notes
+            SELECT t.paper_id, t.technique_id, t.role, t.confidence, t.evidence_source, t.notes
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS t(
+                paper_id text, technique_id integer, role text,
+                confidence double precision, evidence_source text, notes text
             )
             ON CONFLICT (paper_id, technique_id)
             DO UPDATE SET
@@ -407,8 +462,9 @@ class ResearchGraphService(LoggerMixin):
                 notes = COALESCE(EXCLUDED.notes, paper_techniques.notes);
         """)
 
-        for technique in techniques:
-            payload = {
+        # Keyed by technique so a repeated ID cannot hit the same row twice
+        rows = {
+            technique["technique_id"]: {
                 "paper_id": paper_id,
                 "technique_id": technique["technique_id"],
                 "role": technique.get("role"),
@@ -416,25 +472,29 @@ class ResearchGraphService(LoggerMixin):
                 "evidence_source": technique.get("evidence_source"),
                 "notes": technique.get("notes"),
             }
-            await database.execute(query, payload)
+            for technique in techniques
+        }
+        await database.execute(query, {"payload": json.dumps(list(rows.values()))})
 
     async def _link_paper_tasks(self, paper_id: str, task_ids: Iterable[int]) -> None:
         query = text("""
             INSERT INTO paper_tasks (paper_id, task_id)
-            VALUES (:paper_id, :task_id)
+            SELECT t.paper_id, t.task_id
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS t(paper_id text, task_id integer)
             ON CONFLICT (paper_id, task_id) DO NOTHING;
         """)
-        for task_id in task_ids:
-            await database.execute(query, {"paper_id": paper_id, "task_id": task_id})
+        rows = [{"paper_id": paper_id, "task_id": task_id} for task_id in task_ids]
+        await database.execute(query, {"payload": json.dumps(rows)})
 
     async def _link_paper_datasets(self, paper_id: str, dataset_ids: Iterable[int]) -> None:
         query = text("""
             INSERT INTO paper_datasets (paper_id, dataset_id)
-            VALUES (:paper_id, :dataset_id)
+            SELECT d.paper_id, d.dataset_id
+            FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS d(paper_id text, dataset_id integer)
             ON CONFLICT (paper_id, dataset_id) DO NOTHING;
         """)
-        for dataset_id in dataset_ids:
-            await database.execute(query, {"paper_id": paper_id, "dataset_id": dataset_id})
+        rows = [{"paper_id": paper_id, "dataset_id": dataset_id} for dataset_id in dataset_ids]
+        await database.execute(query, {"payload": json.dumps(rows)})
 
     async def _ensure_connection(self) -> None:
         if not database.is_connected:
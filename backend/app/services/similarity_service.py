@@ -8,6 +8,7 @@ Implements all 5 query patterns:
 4. Latest in domain (temporal + topic)
 5. Performance benchmarks (leaderboards)
 """
+import json
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, timedelta
 from sqlalchemy import text
@@ -506,17 +507,21 @@ class SimilarityService:
 
         # Get all edges
         if len(all_paper_ids) > 1:
-            placeholders = ",".join([f":id_{i}" for i in range(len(all_paper_ids))])
-            params = {f"id_{i}": pid for i, pid in enumerate(all_paper_ids)}
-
-            edges_query = f"""
+            # One JSON array parameter keeps the statement text fixed, so the
+            # prepared statement is reused whatever the network size
+            edges_query = """
+                WITH ids AS (
+                    SELECT jsonb_array_elements_text(CAST(:ids AS jsonb)) AS id
+                )
                 SELECT citing_paper_id, cited_paper_id, is_influential
                 FROM citations
-                WHERE citing_paper_id IN ({placeholders})
-                    OR cited_paper_id IN ({placeholders})
+                WHERE citing_paper_id IN (SELECT id FROM ids)
+                    OR cited_paper_id IN (SELECT id FROM ids)
             """
 
-            edges = await database.fetch_all(text(edges_query), params)
+            edges = await database.fetch_all(
+                text(edges_query), {"ids": json.dumps(list(all_paper_ids))}
+            )
         else:
             edges = []
 
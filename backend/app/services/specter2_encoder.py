@@ -0,0 +1,204 @@
+"""
+Shared SPECTER2 encoder.
+
+Loading the tokenizer and adapter model takes far longer than encoding a
+small delta of papers, so a single instance is kept per process and loaded
+on first use. The API server exposes it over ``/embeddings/encode`` so the
+embedding maintenance scripts can reuse a warm model instead of reloading it.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+from app.utils.logger import LoggerMixin
+
+
+SPECTER2_BASE_MODEL = "allenai/specter2_base"
+SPECTER2_DEFAULT_ADAPTER = "allenai/specter2"
+SPECTER2_MAX_LENGTH = 512
+
+# Padded sequence lengths used when the model is compiled, so the compiled
+# graph only ever sees a handful of static shapes
+_COMPILE_LENGTH_BUCKETS = (64, 128, 256, SPECTER2_MAX_LENGTH)
+
+
+def get_best_device() -> torch.device:
+    """Use MPS on Apple Silicon, CUDA on NVIDIA, or fall back to CPU."""
+    if torch.backends.mps.is_available():
+        return torch.device("mps")
+    if torch.cuda.is_available():
+        return torch.device("cuda")
+    return torch.device("cpu")
+
+
+class Specter2Encoder(LoggerMixin):
+    """Wrapper for producing SPECTER2 retrieval embeddings."""
+
+    def __init__(self, adapter_name: Optional[str] = None) -> None:
+        self.adapter_name = adapter_name or SPECTER2_DEFAULT_ADAPTER
+        self.device: Optional[torch.device] = None
+        self.tokenizer = None
+        self.model = None
+        self.compiled = False
+        # Batch size the compiled graph was warmed with; compiled encodes
+        # always run batches of exactly this many rows
+        self._compiled_batch_size = 0
+        self._load_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    def load(self, compile_model: bool = False, warmup_batch_size: int = 32) -> None:
+        """
+        Load tokenizer and adapter model (no-op when already loaded).
+
+        With ``compile_model`` on CUDA the forward pass is wrapped in
+        ``torch.compile`` and warmed once per length bucket at
+        ``warmup_batch_size`` rows; later encodes are chunked and padded to
+        that batch size so they reuse the warmed graphs. Compilation takes a
+        while, so it only pays off for large encode runs.
+        """
+        if self.model is not None:
+            return
+        with self._load_lock:
+            if self.model is not None:
+                return
+
+            from adapters import AutoAdapterModel
+            from transformers import AutoTokenizer
+
+            device = get_best_device()
+            tokenizer = AutoTokenizer.from_pretrained(SPECTER2_BASE_MODEL)
+            model = AutoAdapterModel.from_pretrained(SPECTER2_BASE_MODEL)
+
+            loaded_adapter = model.load_adapter(self.adapter_name, source="hf")
+            model.set_active_adapters(loaded_adapter)
+            model.to(device)
+            model.eval()
+
+            self.device = device
+            self.tokenizer = tokenizer
+            self.model = model
+
+            if compile_model and device.type == "cuda":
+                self.model = torch.compile(model, mode="reduce-overhead", dynamic=False)
+                self.compiled = True
+                self._compiled_batch_size = warmup_batch_size
+                self._warm_compiled()
+
+            self.log_info(
+                "SPECTER2 encoder loaded",
+                adapter=self.adapter_name,
+                device=str(device),
+                compiled=self.compiled,
+            )
+
+    def _warm_compiled(self) -> None:
+        """
+        Trigger compilation for every length bucket up front.
+
+        The warmup batches come from the tokenizer and go through the same
+        padding as real batches, so they carry exactly the inputs (including
+        token_type_ids) and shapes that encode() later passes to the model.
+        """
+        with torch.no_grad():
+            for length in _COMPILE_LENGTH_BUCKETS:
+                tokenized = self.tokenizer(
+                    ["warmup"],
+                    padding="max_length",
+                    truncation=True,
+                    max_length=length,
+                    return_tensors="pt",
+                )
+                tokenized = self._pad_for_compiled(tokenized)
+                self.model(**{k: v.to(self.device) for k, v in tokenized.items()})
+
+    def _pad_for_compiled(self, tokenized: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        """
+        Pad a tokenized batch to a warmed shape: columns up to the next
+        compile length bucket, rows up to the compiled batch size.
+        """
+        rows, seq_len = tokenized["input_ids"].shape
+        target = next(b for b in _COMPILE_LENGTH_BUCKETS if b >= seq_len)
+        extra_rows = self._compiled_batch_size - rows
+        if target == seq_len and extra_rows <= 0:
+            return tokenized
+        pad_values = {"input_ids": self.tokenizer.pad_token_id or 0}
+        return {
+            key: F.pad(value, (0, target - seq_len, 0, max(extra_rows, 0)), value=pad_values.get(key, 0))
+            for key, value in tokenized.items()
+        }
+
+    @property
+    def dimension(self) -> int:
+        self.load()
+        return self.model.config.hidden_size
+
+    def encode(self, texts: List[str], batch_size: int = 16) -> np.ndarray:
+        """
+        Encode texts into L2-normalized CLS embeddings.
+
+        Raw CLS vectors are copied into a (pinned, on CUDA) host buffer without
+        a per-batch sync; normalization happens once over the whole buffer.
+        A compiled model encodes in batches of the size it was warmed with,
+        whatever ``batch_size`` is passed.
+        """
+        self.load()
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        if self.compiled:
+            batch_size = self._compiled_batch_size
+        non_blocking = self.device.type == "cuda"
+        output = torch.empty(
+            (len(texts), self.dimension),
+            dtype=torch.float32,
+            pin_memory=non_blocking,
+        )
+        with torch.no_grad():
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start : start + batch_size]
+                tokenized = self.tokenizer(
+                    batch,
+                    padding=True,
+                    truncation=True,
+                    max_length=SPECTER2_MAX_LENGTH,
+                    return_tensors="pt",
+                )
+                if self.compiled:
+                    tokenized = self._pad_for_compiled(tokenized)
+                tokenized = {k: v.to(self.device) for k, v in tokenized.items()}
+                outputs = self.model(**tokenized)
+                # Rows added to fill a compiled batch are dropped here
+                cls_embeddings = outputs.last_hidden_state[: len(batch), 0]
+                output[start : start + len(batch)].copy_(cls_embeddings, non_blocking=non_blocking)
+        if non_blocking:
+            torch.cuda.synchronize(self.device)
+
+        embeddings = output.numpy()
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.maximum(norms, 1e-12, out=norms)
+        np.divide(embeddings, norms, out=embeddings)
+        return embeddings
+
+
+# One encoder per adapter, shared by everything in the process
+_specter2_encoders: Dict[str, Specter2Encoder] = {}
+_specter2_encoders_lock = threading.Lock()
+
+
+def get_specter2_encoder(adapter_name: Optional[str] = None) -> Specter2Encoder:
+    """Get the shared SPECTER2 encoder for an adapter (model loads lazily)."""
+    key = adapter_name or SPECTER2_DEFAULT_ADAPTER
+    with _specter2_encoders_lock:
+        encoder = _specter2_encoders.get(key)
+        if encoder is None:
+            encoder = Specter2Encoder(key)
+            _specter2_encoders[key] = encoder
+    return encoder
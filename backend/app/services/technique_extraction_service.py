@@ -18,14 +18,20 @@ import asyncio
 import json
 import re
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Set
 
 from pydantic import BaseModel
-import google.generativeai as genai
 
 from app.core.config import settings
+from app.services.gemini_model import get_gemini_model
 from app.utils.logger import LoggerMixin
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
 
 class ExtractedTechnique(BaseModel):
     """A technique/method extracted from a paper"""
@@ -104,6 +110,107 @@ TASK_DOMAINS = {
     "graphs": ["graph neural", "gnn", "node", "edge", "knowledge graph"],
 }
 
+# Lower-cased pattern tuples, built once instead of on every heuristic pass
+_TECHNIQUE_MATCHERS = tuple(
+    (key, tuple(p.lower() for p in patterns)) for key, patterns in TECHNIQUE_PATTERNS.items()
+)
+
+_DOMAIN_MATCHERS = tuple(
+    (domain, tuple(kw.lower() for kw in keywords)) for domain, keywords in TASK_DOMAINS.items()
+)
+_ALL_PATTERNS = frozenset(
+    pattern
+    for matchers in (_TECHNIQUE_MATCHERS, _DOMAIN_MATCHERS)
+    for _, patterns in matchers
+    for pattern in patterns
+)
+
+
+def _build_pattern_automaton():
+    """Aho-Corasick automaton over every pattern, when pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in _ALL_PATTERNS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_PATTERN_AUTOMATON = _build_pattern_automaton()
+
+
+def _find_patterns(text: str) -> Set[str]:
+    """
+    Return every technique/domain pattern occurring in text.
+
+    With the automaton this is a single pass over the text however many
+    patterns there are; otherwise each pattern is a substring scan.
+    """
+    if _PATTERN_AUTOMATON is not None:
+        return {pattern for _, pattern in _PATTERN_AUTOMATON.iter(text)}
+    return {pattern for pattern in _ALL_PATTERNS if pattern in text}
+
+
+def match_technique_keys(text: str) -> List[str]:
+    """Keys of TECHNIQUE_PATTERNS with a pattern in the (lower-cased) text, in table order"""
+    found_patterns = _find_patterns(text)
+    return [
+        key for key, patterns in _TECHNIQUE_MATCHERS
+        if any(p in found_patterns for p in patterns)
+    ]
+
+
+def match_task_domains(text: str) -> List[str]:
+    """Keys of TASK_DOMAINS with a keyword in the (lower-cased) text, in table order"""
+    found_patterns = _find_patterns(text)
+    return [
+        domain for domain, keywords in _DOMAIN_MATCHERS
+        if any(kw in found_patterns for kw in keywords)
+    ]
+
+
+# Compiled once; _extract_key_components runs for every paper in a batch
+_PARENTHESISED_PATTERN = re.compile(r'\(([^)]+)\)')
+_ACRONYM_PATTERN = re.compile(r'\b([A-Z]{2,6})\b')
+_JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+# Checked in priority order when picking a paper's architecture type
+_ARCHITECTURE_KEYS = ("transformer", "diffusion", "cnn", "rnn", "gan", "vae", "moe", "ssm")
+_TRAINING_KEYS = frozenset({"lora", "qlora", "peft", "distillation", "contrastive", "rlhf", "dpo"})
+_OPTIMIZATION_KEYS = frozenset({"adam", "lion", "schedule_free", "warmup", "cosine_decay"})
+
+_TECHNIQUE_CATEGORIES = MappingProxyType({
+    "transformer": "architecture",
+    "diffusion": "architecture",
+    "cnn": "architecture",
+    "rnn": "architecture",
+    "gan": "architecture",
+    "vae": "architecture",
+    "moe": "architecture",
+    "ssm": "architecture",
+    "lora": "fine-tuning",
+    "qlora": "fine-tuning",
+    "peft": "fine-tuning",
+    "distillation": "training",
+    "contrastive": "training",
+    "rlhf": "training",
+    "dpo": "training",
+    "layer_norm": "normalization",
+    "batch_norm": "normalization",
+    "dropout": "regularization",
+    "rmsnorm": "normalization",
+    "flash_attention": "attention",
+    "sparse_attention": "attention",
+    "linear_attention": "attention",
+    "cross_attention": "attention",
+    "adam": "optimization",
+    "lion": "optimization",
+    "schedule_free": "optimization",
+    "warmup": "optimization",
+    "cosine_decay": "optimization",
+})
+
 
 class TechniqueExtractionService(LoggerMixin):
     """
@@ -151,8 +258,7 @@ Return ONLY valid JSON, no other text:
 
         try:
             if settings.GEMINI_API_KEY:
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+                self.model = get_gemini_model()
                 self.llm_available = True
                 self.log_info("Technique extraction service initialized with Gemini")
         except Exception as e:
@@ -250,7 +356,7 @@ Return ONLY valid JSON, no other text:
         text = response.text.strip()
 
         # Try to extract JSON from response
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        json_match = _JSON_OBJECT_PATTERN.search(text)
         if not json_match:
             raise ValueError("No JSON found in LLM response")
 
@@ -289,49 +395,51 @@ Return ONLY valid JSON, no other text:
     ) -> TechniqueExtractionResult:
         """Extract techniques using pattern matching heuristics"""
 
-        text = f"{title} {abstract}".lower()
+        # Lower-case once; every matcher below works on these
+        title_lower = title.lower()
+        text = f"{title_lower} {abstract.lower()}"
 
         techniques: List[ExtractedTechnique] = []
         found_names: Set[str] = set()
+        found_patterns = _find_patterns(text)
 
-        # Match technique patterns
-        for technique_key, patterns in TECHNIQUE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in text:
-                    if technique_key not in found_names:
-                        found_names.add(technique_key)
-                        techniques.append(ExtractedTechnique(
-                            name=technique_key.replace("_", " ").title(),
-                            normalized_name=technique_key,
-                            category=self._infer_category(technique_key),
-                            technique_type=self._infer_type(technique_key),
-                            is_primary=self._is_likely_primary(pattern, title),
-                            confidence=0.7,
-                            related_techniques=[],
-                            description=None
-                        ))
-                    break
-
-        # Detect architecture type
-        architecture_type = None
-        for arch in ["transformer", "diffusion", "cnn", "rnn", "gan", "vae", "moe", "ssm"]:
-            if arch in found_names or any(p in text for p in TECHNIQUE_PATTERNS.get(arch, [])):
-                architecture_type = arch
-                break
+        # Match technique patterns (first listed pattern wins per technique)
+        for technique_key, patterns in _TECHNIQUE_MATCHERS:
+            pattern = next((p for p in patterns if p in found_patterns), None)
+            if pattern is None:
+                continue
+            found_names.add(technique_key)
+            techniques.append(ExtractedTechnique.model_construct(
+                name=technique_key.replace("_", " ").title(),
+                normalized_name=technique_key,
+                category=self._infer_category(technique_key),
+                technique_type=self._infer_type(technique_key),
+                is_primary=self._is_likely_primary(pattern, title_lower),
+                confidence=0.7,
+                related_techniques=[],
+                description=None
+            ))
+
+        # Detect architecture type (every architecture pattern was already
+        # checked above, so a match is recorded in found_names)
+        architecture_type = next(
+            (arch for arch in _ARCHITECTURE_KEYS if arch in found_names), None
+        )
 
         # Detect task domains
-        task_domains = []
-        for domain, keywords in TASK_DOMAINS.items():
-            if any(kw in text for kw in keywords):
-                task_domains.append(domain)
+        task_domains = [
+            domain for domain, keywords in _DOMAIN_MATCHERS
+            if any(kw in found_patterns for kw in keywords)
+        ]
 
         # Infer novelty type
-        novelty_type = self._infer_novelty_type(title, abstract)
+        novelty_type = self._infer_novelty_type(text)
 
         # Extract key components from title (often mentioned there)
         key_components = self._extract_key_components(title)
 
-        return TechniqueExtractionResult(
+        # Heuristic results are built from known-good values, so skip validation
+        return TechniqueExtractionResult.model_construct(
             paper_id=paper_id,
             techniques=techniques,
             architecture_type=architecture_type,
@@ -347,60 +455,25 @@ Return ONLY valid JSON, no other text:
 
     def _infer_category(self, technique_key: str) -> Optional[str]:
         """Infer technique category from key"""
-        categories = {
-            "transformer": "architecture",
-            "diffusion": "architecture",
-            "cnn": "architecture",
-            "rnn": "architecture",
-            "gan": "architecture",
-            "vae": "architecture",
-            "moe": "architecture",
-            "ssm": "architecture",
-            "lora": "fine-tuning",
-            "qlora": "fine-tuning",
-            "peft": "fine-tuning",
-            "distillation": "training",
-            "contrastive": "training",
-            "rlhf": "training",
-            "dpo": "training",
-            "layer_norm": "normalization",
-            "batch_norm": "normalization",
-            "dropout": "regularization",
-            "rmsnorm": "normalization",
-            "flash_attention": "attention",
-            "sparse_attention": "attention",
-            "linear_attention": "attention",
-            "cross_attention": "attention",
-            "adam": "optimization",
-            "lion": "optimization",
-            "schedule_free": "optimization",
-            "warmup": "optimization",
-            "cosine_decay": "optimization",
-        }
-        return categories.get(technique_key)
+        return _TECHNIQUE_CATEGORIES.get(technique_key)
 
     def _infer_type(self, technique_key: str) -> Optional[str]:
         """Infer technique type"""
-        architecture_keys = {"transformer", "diffusion", "cnn", "rnn", "gan", "vae", "moe", "ssm"}
-        training_keys = {"lora", "qlora", "peft", "distillation", "contrastive", "rlhf", "dpo"}
-        optimization_keys = {"adam", "lion", "schedule_free", "warmup", "cosine_decay"}
-
-        if technique_key in architecture_keys:
+        if technique_key in _ARCHITECTURE_KEYS:
             return "architecture"
-        elif technique_key in training_keys:
+        elif technique_key in _TRAINING_KEYS:
             return "training"
-        elif technique_key in optimization_keys:
+        elif technique_key in _OPTIMIZATION_KEYS:
             return "optimization"
 
         return "component"
 
-    def _is_likely_primary(self, pattern: str, title: str) -> bool:
-        """Check if technique is likely the primary contribution"""
-        return pattern.lower() in title.lower()
+    def _is_likely_primary(self, pattern: str, title_lower: str) -> bool:
+        """Check if technique is likely the primary contribution (pattern and title lower-cased)"""
+        return pattern in title_lower
 
-    def _infer_novelty_type(self, title: str, abstract: str) -> Optional[str]:
-        """Infer what type of contribution this is"""
-        text = f"{title} {abstract}".lower()
+    def _infer_novelty_type(self, text: str) -> Optional[str]:
+        """Infer what type of contribution this is from the lower-cased title and abstract"""
 
         if any(kw in text for kw in ["dataset", "benchmark", "corpus", "collection"]):
             if "introduce" in text or "present" in text or "release" in text:
@@ -424,11 +497,11 @@ Return ONLY valid JSON, no other text:
         components = []
 
         # Look for things in parentheses or after colons
-        paren_match = re.findall(r'\(([^)]+)\)', title)
+        paren_match = _PARENTHESISED_PATTERN.findall(title)
         components.extend(paren_match)
 
         # Look for acronyms (all caps, 2-6 chars)
-        acronyms = re.findall(r'\b([A-Z]{2,6})\b', title)
+        acronyms = _ACRONYM_PATTERN.findall(title)
         components.extend(acronyms)
 
         return list(set(components))[:5]  # Limit to 5
@@ -11,21 +11,40 @@ Uses the local atlas data to compute trends efficiently.
 """
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 
+import numpy as np
 from pydantic import BaseModel
 
 from app.utils.logger import LoggerMixin
 from app.services.local_atlas_service import local_atlas_service
 from app.services.technique_extraction_service import (
     get_technique_extraction_service,
+    match_task_domains,
+    match_technique_keys,
     TECHNIQUE_PATTERNS,
     TASK_DOMAINS
 )
 
 
+# Column order of the incidence matrices built by TrendService._get_columns
+_TECHNIQUE_KEYS = tuple(TECHNIQUE_PATTERNS)
+_DOMAIN_KEYS = tuple(TASK_DOMAINS)
+
+# Simple co-occurrence based on common categories
+_RELATED_TOPICS = MappingProxyType({
+    "transformer": ("attention", "layer_norm", "flash_attention"),
+    "diffusion": ("vae", "contrastive", "rmsnorm"),
+    "lora": ("qlora", "peft", "adam"),
+    "flash_attention": ("transformer", "sparse_attention"),
+    "contrastive": ("clip", "transformer", "distillation"),
+    "rlhf": ("dpo", "transformer", "peft"),
+})
+
+
 class TrendingTopic(BaseModel):
     """A trending research topic"""
     name: str
@@ -66,8 +85,53 @@ class TrendService(LoggerMixin):
     def __init__(self):
         self.technique_extractor = get_technique_extraction_service()
         self._cached_reference_date: Optional[datetime] = None
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
         self.log_info("Trend service initialized")
 
+    def _get_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Column-wise view of the atlas, built once and shared by every trend query.
+
+        Returns publication dates (NaT when unknown) plus records x techniques
+        and records x task-domain boolean incidence matrices, so windowed
+        counts are masked column sums instead of per-record Python loops.
+        Catalogs built by build_atlas_dataset carry each paper's technique
+        and domain keys; older catalogs are matched here instead.
+        """
+        if self._columns is not None:
+            return self._columns
+
+        records = local_atlas_service._records
+        published = np.array(
+            [record.get("_published_dt") or np.datetime64("NaT") for record in records],
+            dtype="datetime64[s]"
+        )
+        techniques = np.zeros((len(records), len(_TECHNIQUE_KEYS)), dtype=bool)
+        domains = np.zeros((len(records), len(_DOMAIN_KEYS)), dtype=bool)
+        technique_column = {key: i for i, key in enumerate(_TECHNIQUE_KEYS)}
+        domain_column = {key: i for i, key in enumerate(_DOMAIN_KEYS)}
+
+        for row, record in enumerate(records):
+            technique_keys = record.get("heuristic_techniques")
+            domain_keys = record.get("heuristic_domains")
+            if technique_keys is None or domain_keys is None:
+                text = record.get("_search_text", "").lower()
+                technique_keys = match_technique_keys(text)
+                domain_keys = match_task_domains(text)
+
+            techniques[row, [technique_column[k] for k in technique_keys if k in technique_column]] = True
+            domains[row, [domain_column[d] for d in domain_keys if d in domain_column]] = True
+
+        self._columns = (published, techniques, domains)
+        return self._columns
+
+    @staticmethod
+    def _encounter_order(incidence: np.ndarray) -> np.ndarray:
+        """Columns with any hit, in the order a row-by-row scan first meets them"""
+        present = np.flatnonzero(incidence.any(axis=0))
+        first_rows = incidence[:, present].argmax(axis=0)
+        return present[np.lexsort((present, first_rows))]
+
     def _get_reference_date(self) -> datetime:
         """
         Get reference date for trend calculations.
@@ -126,35 +190,20 @@ class TrendService(LoggerMixin):
         previous_cutoff = current_cutoff - timedelta(days=comparison_window_days)
 
         # Count techniques in each window
-        current_counts: Dict[str, int] = defaultdict(int)
-        previous_counts: Dict[str, int] = defaultdict(int)
-        technique_papers: Dict[str, List[Dict]] = defaultdict(list)
-
-        for record in local_atlas_service._records:
-            published_dt = record.get("_published_dt")
-            if not published_dt:
-                continue
-
-            text = record.get("_search_text", "").lower()
-
-            # Find techniques in this paper
-            for technique_key, patterns in TECHNIQUE_PATTERNS.items():
-                if any(p in text for p in patterns):
-                    if published_dt >= current_cutoff:
-                        current_counts[technique_key] += 1
-                        if len(technique_papers[technique_key]) < 3:
-                            technique_papers[technique_key].append({
-                                "id": record.get("id"),
-                                "title": record.get("title"),
-                                "published": record.get("published")
-                            })
-                    elif published_dt >= previous_cutoff:
-                        previous_counts[technique_key] += 1
+        published, techniques, _ = self._get_columns()
+        in_current = published >= np.datetime64(current_cutoff)
+        in_previous = (published >= np.datetime64(previous_cutoff)) & ~in_current
+        current_hits = techniques & in_current[:, None]
+        current_counts = current_hits.sum(axis=0)
+        previous_counts = techniques[in_previous].sum(axis=0)
 
         # Calculate acceleration
+        records = local_atlas_service._records
         trends = []
-        for technique, current in current_counts.items():
-            previous = previous_counts.get(technique, 0)
+        for column in self._encounter_order(current_hits):
+            technique = _TECHNIQUE_KEYS[column]
+            current = int(current_counts[column])
+            previous = int(previous_counts[column])
 
             if previous > 0:
                 acceleration = ((current - previous) / previous) * 100
@@ -170,7 +219,14 @@ class TrendService(LoggerMixin):
                 current_count=current,
                 previous_count=previous,
                 acceleration=acceleration,
-                representative_papers=technique_papers.get(technique, []),
+                representative_papers=[
+                    {
+                        "id": records[row].get("id"),
+                        "title": records[row].get("title"),
+                        "published": records[row].get("published")
+                    }
+                    for row in np.flatnonzero(current_hits[:, column])[:3]
+                ],
                 related_topics=self._find_related_topics(technique)
             ))
 
@@ -210,25 +266,17 @@ class TrendService(LoggerMixin):
         ]
 
         # Count by period
-        period_counts: List[Dict[str, int]] = [{} for _ in periods]
-
-        for record in local_atlas_service._records:
-            published_dt = record.get("_published_dt")
-            if not published_dt:
-                continue
-
-            text = record.get("_search_text", "").lower()
-
-            for technique_key, patterns in TECHNIQUE_PATTERNS.items():
-                if any(p in text for p in patterns):
-                    for i, (start, end) in enumerate(periods):
-                        if start <= published_dt < end:
-                            period_counts[i][technique_key] = period_counts[i].get(technique_key, 0) + 1
+        published, techniques, _ = self._get_columns()
+        period_counts = np.stack([
+            techniques[(published >= np.datetime64(start)) & (published < np.datetime64(end))].sum(axis=0)
+            for start, end in periods
+        ])
 
         # Find techniques with consistent growth
         rising = []
-        for technique in set().union(*[set(p.keys()) for p in period_counts]):
-            counts = [period_counts[i].get(technique, 0) for i in range(3)]
+        for column in np.flatnonzero(period_counts.any(axis=0)):
+            technique = _TECHNIQUE_KEYS[column]
+            counts = [int(c) for c in period_counts[:, column]]
 
             # Check for growth pattern: recent > middle > old
             if counts[0] > counts[1] >= counts[2] and counts[0] > 2:
@@ -272,24 +320,30 @@ class TrendService(LoggerMixin):
         author_stats: Dict[str, Dict] = defaultdict(lambda: {
             "total_count": 0,
             "recent_count": 0,
-            "topics": defaultdict(int)
+            "topics": Counter()
         })
 
-        for record in local_atlas_service._records:
-            published_dt = record.get("_published_dt")
+        published, technique_matrix, _ = self._get_columns()
+        recent_rows = published >= np.datetime64(cutoff)
+
+        for row, record in enumerate(local_atlas_service._records):
             authors = record.get("authors", [])
-            text = record.get("_search_text", "").lower()
+            recent = bool(recent_rows[row])
 
-            for author in authors:
-                author_stats[author]["total_count"] += 1
+            # Topics are a property of the paper: look up once, not per author
+            techniques = (
+                [_TECHNIQUE_KEYS[c] for c in np.flatnonzero(technique_matrix[row])]
+                if recent and authors else ()
+            )
 
-                if published_dt and published_dt >= cutoff:
-                    author_stats[author]["recent_count"] += 1
+            for author in authors:
+                stats = author_stats[author]
+                stats["total_count"] += 1
 
+                if recent:
+                    stats["recent_count"] += 1
                     # Track topics
-                    for technique_key, patterns in TECHNIQUE_PATTERNS.items():
-                        if any(p in text for p in patterns):
-                            author_stats[author]["topics"][technique_key] += 1
+                    stats["topics"].update(techniques)
 
         # Build author trend list
         trends = []
@@ -297,11 +351,7 @@ class TrendService(LoggerMixin):
             if stats["recent_count"] < 2:
                 continue
 
-            top_topics = sorted(
-                stats["topics"].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:3]
+            top_topics = stats["topics"].most_common(3)
 
             trends.append(AuthorTrend(
                 name=name,
@@ -327,27 +377,19 @@ class TrendService(LoggerMixin):
         recent_cutoff = reference_date - timedelta(days=60)
         older_cutoff = recent_cutoff - timedelta(days=60)
 
-        recent_counts: Dict[str, int] = defaultdict(int)
-        older_counts: Dict[str, int] = defaultdict(int)
-
-        for record in local_atlas_service._records:
-            published_dt = record.get("_published_dt")
-            if not published_dt:
-                continue
-
-            text = record.get("_search_text", "").lower()
-
-            for domain, keywords in TASK_DOMAINS.items():
-                if any(kw in text for kw in keywords):
-                    if published_dt >= recent_cutoff:
-                        recent_counts[domain] += 1
-                    elif published_dt >= older_cutoff:
-                        older_counts[domain] += 1
+        published, _, domains = self._get_columns()
+        in_recent = published >= np.datetime64(recent_cutoff)
+        in_older = (published >= np.datetime64(older_cutoff)) & ~in_recent
+        recent_hits = domains & in_recent[:, None]
+        recent_counts = recent_hits.sum(axis=0)
+        older_counts = domains[in_older].sum(axis=0)
 
         # Find areas with acceleration
         emerging = []
-        for domain, recent in recent_counts.items():
-            older = older_counts.get(domain, 0)
+        for column in self._encounter_order(recent_hits):
+            domain = _DOMAIN_KEYS[column]
+            recent = int(recent_counts[column])
+            older = int(older_counts[column])
             if older > 0 and recent > older * 1.2:  # 20% growth
                 emerging.append((domain, (recent - older) / older))
             elif older == 0 and recent > 5:
@@ -375,16 +417,7 @@ class TrendService(LoggerMixin):
 
     def _find_related_topics(self, technique: str) -> List[str]:
         """Find topics that often appear with this technique"""
-        # Simple co-occurrence based on common categories
-        related_map = {
-            "transformer": ["attention", "layer_norm", "flash_attention"],
-            "diffusion": ["vae", "contrastive", "rmsnorm"],
-            "lora": ["qlora", "peft", "adam"],
-            "flash_attention": ["transformer", "sparse_attention"],
-            "contrastive": ["clip", "transformer", "distillation"],
-            "rlhf": ["dpo", "transformer", "peft"],
-        }
-        return related_map.get(technique, [])[:3]
+        return list(_RELATED_TOPICS.get(technique, ())[:3])
 
 
 # Module-level singleton
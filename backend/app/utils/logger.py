@@ -3,6 +3,7 @@ Logging configuration and utilities
 """
 import logging
 import sys
+from functools import lru_cache
 from typing import Any, Dict
 from app.core.config import settings
 
@@ -35,8 +36,9 @@ def setup_logging() -> None:
     logging.getLogger("redis").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
-    """Get logger instance with specified name"""
+    """Get logger instance with specified name (memoized; getLogger takes a global lock)"""
     return logging.getLogger(name)
 
 
@@ -48,26 +50,29 @@ class LoggerMixin:
         """Get logger instance for this class"""
         return get_logger(self.__class__.__name__)
     
-    def log_info(self, message: str, **kwargs: Any) -> None:
+    # Positional args are %-format arguments for the message, so formatting
+    # is skipped entirely when the level is disabled
+
+    def log_info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message with optional extra data"""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
     
-    def log_warning(self, message: str, **kwargs: Any) -> None:
+    def log_warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message with optional extra data"""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, extra=kwargs)
     
-    def log_error(self, message: str, error: Exception = None, **kwargs: Any) -> None:
+    def log_error(self, message: str, *args: Any, error: Exception = None, **kwargs: Any) -> None:
         """Log error message with optional exception and extra data"""
         extra_data = kwargs.copy()
         if error:
             extra_data['error'] = str(error)
             extra_data['error_type'] = type(error).__name__
         
-        self.logger.error(message, extra=extra_data, exc_info=error)
+        self.logger.error(message, *args, extra=extra_data, exc_info=error)
     
-    def log_debug(self, message: str, **kwargs: Any) -> None:
+    def log_debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message with optional extra data"""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
 
 
 # Initialize logging
@@ -9,8 +9,6 @@ import time
 from pathlib import Path
 
 import numpy as np
-import torch
-import torch.nn.functional as F
 from tqdm import tqdm
 
 # Add parent to path for imports
@@ -19,19 +17,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.config import settings
 
 
-def get_device():
-    """Get best available device."""
-    if torch.backends.mps.is_available():
-        print("Using Apple MPS (GPU)")
-        return torch.device("mps")
-    elif torch.cuda.is_available():
-        print("Using CUDA (GPU)")
-        return torch.device("cuda")
-    else:
-        print("Using CPU (slow!)")
-        return torch.device("cpu")
-
-
 def load_papers(catalog_path: Path) -> tuple[list[dict], list[str], list[str]]:
     """Load papers from catalog."""
     records = []
@@ -56,42 +41,23 @@ def load_papers(catalog_path: Path) -> tuple[list[dict], list[str], list[str]]:
     return records, ids, texts
 
 
-def encode_with_specter2(texts: list[str], device: torch.device, batch_size: int = 32) -> np.ndarray:
-    """Encode texts using SPECTER2 with progress bar."""
-    from adapters import AutoAdapterModel
-    from transformers import AutoTokenizer
+def encode_with_specter2(texts: list[str], batch_size: int = 32) -> np.ndarray:
+    """Encode texts using the shared SPECTER2 encoder with progress bar."""
+    from app.services.specter2_encoder import get_specter2_encoder
 
     print("Loading SPECTER2 model...")
-    base_model = "allenai/specter2_base"
-    tokenizer = AutoTokenizer.from_pretrained(base_model)
-    model = AutoAdapterModel.from_pretrained(base_model)
-
-    # Load and activate adapter
-    adapter = model.load_adapter("allenai/specter2", source="hf")
-    model.set_active_adapters(adapter)
-    model.to(device)
-    model.eval()
-    print(f"Model loaded on {device}")
+    encoder = get_specter2_encoder()
+    encoder.load()
+    print(f"Model loaded on {encoder.device}")
 
+    # Many batches per call so the encoder syncs with the device once per chunk
+    chunk_size = batch_size * 32
     embeddings = []
-    total_batches = (len(texts) + batch_size - 1) // batch_size
-
-    with torch.no_grad():
-        for i in tqdm(range(0, len(texts), batch_size), total=total_batches, desc="Encoding"):
-            batch = texts[i:i + batch_size]
-            tokens = tokenizer(
-                batch,
-                padding=True,
-                truncation=True,
-                max_length=512,
-                return_tensors="pt"
-            )
-            tokens = {k: v.to(device) for k, v in tokens.items()}
-
-            outputs = model(**tokens)
-            cls_emb = outputs.last_hidden_state[:, 0]
-            cls_emb = F.normalize(cls_emb, p=2, dim=1)
-            embeddings.append(cls_emb.cpu().numpy())
+    total_chunks = (len(texts) + chunk_size - 1) // chunk_size
+
+    for i in tqdm(range(0, len(texts), chunk_size), total=total_chunks, desc="Encoding"):
+        chunk = texts[i:i + chunk_size]
+        embeddings.append(encoder.encode(chunk, batch_size=batch_size))
 
     return np.vstack(embeddings)
 
@@ -118,12 +84,9 @@ def main():
     records, ids, texts = load_papers(catalog_path)
     print(f"Loaded {len(records)} papers")
 
-    # Get device
-    device = get_device()
-
     # Encode
     print(f"\nEncoding {len(texts)} papers...")
-    embeddings = encode_with_specter2(texts, device, batch_size=32)
+    embeddings = encode_with_specter2(texts, batch_size=32)
     print(f"Embeddings shape: {embeddings.shape}")
 
     # Save
@@ -136,6 +99,8 @@ def main():
     print(f"Saving IDs to {ids_path}")
     with ids_path.open("w", encoding="utf-8") as f:
         json.dump(ids, f)
+    # Binary sidecar so update_embeddings.py can skip JSON decoding
+    np.save(cache_dir / "specter2_ids.npy", np.asarray([pid or "" for pid in ids], dtype=str))
 
     elapsed = time.time() - start_time
     print(f"\nDone! Took {elapsed:.1f}s ({elapsed/60:.1f} min)")
@@ -1,66 +1,209 @@
 #!/usr/bin/env python3
 """
 Incremental SPECTER2 embeddings update - only encodes NEW papers.
-Run from backend directory: python scripts/update_embeddings.py
+Run from backend directory: python scripts/update_embeddings.py [--compile]
 """
+import argparse
 import json
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+import httpx
 import numpy as np
-import torch
-import torch.nn.functional as F
 from tqdm import tqdm
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.config import settings
 
 
-def get_device():
-    if torch.backends.mps.is_available():
-        print("Using Apple MPS (GPU)")
-        return torch.device("mps")
-    elif torch.cuda.is_available():
-        print("Using CUDA")
-        return torch.device("cuda")
+# Below this size the catalog is parsed in-process; pool startup would dominate
+PARALLEL_SCAN_MIN_BYTES = 32 * 1024 * 1024
+
+# Cached IDs broadcast to scan workers via the pool initializer
+_worker_existing_ids: Optional[np.ndarray] = None
+
+
+def _init_scan_worker(existing_ids: np.ndarray) -> None:
+    global _worker_existing_ids
+    _worker_existing_ids = existing_ids
+
+
+def _split_ranges(path: Path, parts: int) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that each end on a line boundary."""
+    size = path.stat().st_size
+    step = max(1, size // parts)
+    ranges = []
+    start = 0
+    with path.open("rb") as f:
+        while start < size:
+            end = min(size, start + step)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _scan_range(task: tuple[str, int, int]) -> tuple[int, list[tuple[str, str, str]]]:
+    """Parse one byte range; return (records seen, new (id, title, abstract) rows)."""
+    path, start, end = task
+    rows = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            if not line.strip():
+                continue
+            try:
+                r = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            rows.append((r.get("id") or "", r.get("title", ""), r.get("abstract", "")))
+
+    if not rows:
+        return 0, []
+    ids = np.asarray([row[0] for row in rows], dtype=str)
+    is_cached = np.isin(ids, _worker_existing_ids)
+    return len(rows), [row for row, cached in zip(rows, is_cached.tolist()) if not cached]
+
+
+def load_new_papers(
+    catalog_path: Path, existing_ids: np.ndarray, workers: int
+) -> tuple[int, dict[str, dict]]:
+    """
+    Scan the catalog for papers missing from the cache.
+
+    Large catalogs are split into line-aligned byte ranges parsed in worker
+    processes; each worker only sends back the (small) set of new papers.
+    Returns (records scanned, id -> {title, abstract}).
+    """
+    if workers <= 1 or catalog_path.stat().st_size < PARALLEL_SCAN_MIN_BYTES:
+        _init_scan_worker(existing_ids)
+        results = [_scan_range((str(catalog_path), 0, catalog_path.stat().st_size))]
     else:
-        print("Using CPU")
-        return torch.device("cpu")
-
-
-def load_papers(catalog_path: Path) -> dict[str, dict]:
-    """Load papers as id -> record dict."""
-    papers = {}
-    with catalog_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    r = json.loads(line)
-                    papers[r.get("id")] = r
-                except json.JSONDecodeError:
-                    continue
-    return papers
-
-
-def encode_batch(texts: list[str], tokenizer, model, device) -> np.ndarray:
-    """Encode a batch of texts."""
-    with torch.no_grad():
-        tokens = tokenizer(
-            texts,
-            padding=True,
-            truncation=True,
-            max_length=512,
-            return_tensors="pt"
-        )
-        tokens = {k: v.to(device) for k, v in tokens.items()}
-        outputs = model(**tokens)
-        cls_emb = outputs.last_hidden_state[:, 0]
-        cls_emb = F.normalize(cls_emb, p=2, dim=1)
-        return cls_emb.cpu().numpy()
+        tasks = [(str(catalog_path), s, e) for s, e in _split_ranges(catalog_path, workers)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(existing_ids,),
+        ) as pool:
+            results = list(pool.map(_scan_range, tasks))
+
+    scanned = 0
+    new_papers = {}
+    for count, rows in results:
+        scanned += count
+        for pid, title, abstract in rows:
+            new_papers[pid] = {"title": title, "abstract": abstract}
+    return scanned, new_papers
+
+
+def load_ids(ids_path: Path, ids_sidecar_path: Path, expected_count: int) -> np.ndarray:
+    """
+    Load cached paper IDs, preferring the binary .npy sidecar.
+
+    The JSON file stays canonical (the atlas service reads it); the sidecar
+    is only trusted when it is at least as new and matches the row count.
+    """
+    if ids_sidecar_path.exists() and ids_sidecar_path.stat().st_mtime >= ids_path.stat().st_mtime:
+        ids = np.load(ids_sidecar_path, allow_pickle=False)
+        if len(ids) == expected_count:
+            return ids
+    return np.asarray([pid or "" for pid in json.loads(ids_path.read_text())], dtype=str)
+
+
+def append_embeddings(embeddings_path: Path, existing: np.ndarray, new: np.ndarray) -> tuple[int, int]:
+    """
+    Write existing + new embeddings to embeddings_path without materializing
+    the merged array.
+
+    ``existing`` should be a read-only memmap of embeddings_path. Rows are
+    streamed into a memmapped temp file in chunks, which then atomically
+    replaces the original. Returns the merged shape.
+    """
+    shape = (existing.shape[0] + new.shape[0], existing.shape[1])
+    tmp_path = embeddings_path.with_name(embeddings_path.stem + ".tmp.npy")
+    merged = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=np.result_type(existing, new), shape=shape
+    )
+    existing_rows = existing.shape[0]
+    chunk_rows = 65536
+    for i in range(0, existing_rows, chunk_rows):
+        end = min(i + chunk_rows, existing_rows)
+        merged[i:end] = existing[i:end]
+    merged[existing_rows:] = new
+    merged.flush()
+    del merged
+    os.replace(tmp_path, embeddings_path)
+    return shape
+
+
+def encode_remote(texts: list[str], batch_size: int) -> Optional[np.ndarray]:
+    """Encode via the API server's warm SPECTER2 model; None if it's not reachable."""
+    url = settings.SPECTER2_ENCODE_URL
+    if not url:
+        return None
+
+    embeddings = []
+    try:
+        with httpx.Client(timeout=300.0) as client:
+            for i in tqdm(range(0, len(texts), batch_size)):
+                batch = texts[i:i + batch_size]
+                response = client.post(url, json={"texts": batch, "batch_size": batch_size})
+                response.raise_for_status()
+                embeddings.append(np.asarray(response.json()["embeddings"], dtype=np.float32))
+    except httpx.HTTPError as e:
+        print(f"Encoder service unavailable at {url} ({e})")
+        return None
+
+    return np.vstack(embeddings)
+
+
+def encode_local(texts: list[str], batch_size: int, compile_model: bool = False) -> np.ndarray:
+    """Encode in-process with the shared SPECTER2 encoder."""
+    from app.services.specter2_encoder import get_specter2_encoder
+
+    print("\nLoading SPECTER2...")
+    encoder = get_specter2_encoder()
+    encoder.load(compile_model=compile_model, warmup_batch_size=batch_size)
+    print(f"Using {encoder.device}" + (" (compiled)" if encoder.compiled else ""))
+
+    # Hand the encoder many batches at a time: it only syncs with the device
+    # once per call, so per-batch calls would reintroduce the stall
+    chunk_size = batch_size * 32
+    embeddings = []
+    for i in tqdm(range(0, len(texts), chunk_size)):
+        chunk = texts[i:i + chunk_size]
+        embeddings.append(encoder.encode(chunk, batch_size=batch_size))
+
+    return np.vstack(embeddings)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Incrementally update SPECTER2 embeddings")
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="torch.compile the model when encoding in-process on CUDA (worth it for large deltas)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to scan large catalogs (default: CPU count)",
+    )
+    args = parser.parse_args()
+
     start = time.time()
 
     # Paths
@@ -69,24 +212,22 @@ def main():
     cache_dir = Path(settings.ATLAS_EMBED_CACHE_DIR).expanduser().resolve()
     embeddings_path = cache_dir / "specter2_embeddings.npy"
     ids_path = cache_dir / "specter2_ids.json"
-
-    # Load current papers
-    print("Loading papers catalog...")
-    current_papers = load_papers(catalog_path)
-    print(f"Current papers: {len(current_papers)}")
+    ids_sidecar_path = cache_dir / "specter2_ids.npy"
 
     # Load existing cache
     if not embeddings_path.exists() or not ids_path.exists():
         print("No existing cache found - run regenerate_embeddings.py instead")
         sys.exit(1)
 
-    existing_embeddings = np.load(embeddings_path)
-    existing_ids = json.loads(ids_path.read_text())
+    existing_embeddings = np.load(embeddings_path, mmap_mode="r")
+    existing_ids = load_ids(ids_path, ids_sidecar_path, len(existing_embeddings))
     print(f"Cached embeddings: {len(existing_ids)} papers, shape {existing_embeddings.shape}")
 
-    # Find new papers
-    existing_set = set(existing_ids)
-    new_papers = {pid: p for pid, p in current_papers.items() if pid not in existing_set}
+    # Find new papers - workers test membership against the cached ID array
+    # with np.isin, so no Python set of every cached ID has to be built
+    print("Scanning papers catalog...")
+    scanned, new_papers = load_new_papers(catalog_path, existing_ids, args.workers)
+    print(f"Catalog records: {scanned}")
 
     if not new_papers:
         print("No new papers to encode!")
@@ -101,45 +242,39 @@ def main():
         for p in new_papers.values()
     ]
 
-    # Load model
-    device = get_device()
-    print("\nLoading SPECTER2...")
-    from adapters import AutoAdapterModel
-    from transformers import AutoTokenizer
-
-    tokenizer = AutoTokenizer.from_pretrained("allenai/specter2_base")
-    model = AutoAdapterModel.from_pretrained("allenai/specter2_base")
-    adapter = model.load_adapter("allenai/specter2", source="hf")
-    model.set_active_adapters(adapter)
-    model.to(device)
-    model.eval()
-
-    # Encode new papers
-    print(f"\nEncoding {len(new_texts)} new papers...")
-    batch_size = 32
-    new_embeddings = []
-
-    for i in tqdm(range(0, len(new_texts), batch_size)):
-        batch = new_texts[i:i + batch_size]
-        emb = encode_batch(batch, tokenizer, model, device)
-        new_embeddings.append(emb)
+    # Identical title+abstract texts (crossposts, re-uploads) only need one encode
+    unique_positions: dict[str, int] = {}
+    inverse = np.asarray(
+        [unique_positions.setdefault(text, len(unique_positions)) for text in new_texts],
+        dtype=np.intp,
+    )
+    unique_texts = list(unique_positions)
+    if len(unique_texts) < len(new_texts):
+        print(f"Skipping {len(new_texts) - len(unique_texts)} duplicate texts")
 
-    new_embeddings = np.vstack(new_embeddings)
+    # Encode new papers, preferring the warm model held by the API server
+    print(f"\nEncoding {len(unique_texts)} new papers...")
+    batch_size = 32
+    unique_embeddings = encode_remote(unique_texts, batch_size)
+    if unique_embeddings is None:
+        unique_embeddings = encode_local(unique_texts, batch_size, compile_model=args.compile)
+    new_embeddings = (
+        unique_embeddings if len(unique_texts) == len(new_texts) else unique_embeddings[inverse]
+    )
     print(f"New embeddings shape: {new_embeddings.shape}")
 
-    # Merge
-    all_embeddings = np.vstack([existing_embeddings, new_embeddings])
-    all_ids = existing_ids + new_ids
-
-    print(f"\nMerged: {len(all_ids)} papers, embeddings shape {all_embeddings.shape}")
+    # Merge + save - streamed through memmaps so peak RAM stays at new_embeddings
+    all_ids = np.concatenate([existing_ids, np.asarray([pid or "" for pid in new_ids], dtype=str)])
 
-    # Save
-    print(f"Saving to {embeddings_path}")
-    np.save(embeddings_path, all_embeddings)
+    print(f"\nSaving to {embeddings_path}")
+    merged_shape = append_embeddings(embeddings_path, existing_embeddings, new_embeddings)
+    del existing_embeddings
+    print(f"Merged: {len(all_ids)} papers, embeddings shape {merged_shape}")
 
     print(f"Saving IDs to {ids_path}")
     with ids_path.open("w", encoding="utf-8") as f:
-        json.dump(all_ids, f)
+        json.dump(all_ids.tolist(), f)
+    np.save(ids_sidecar_path, all_ids)
 
     elapsed = time.time() - start
     print(f"\nDone! Added {len(new_papers)} papers in {elapsed:.1f}s")